@@ -3,6 +3,9 @@ CLI Tool for scanning Python projects and generating JSON reports.
 
 Usage:
     python cli/commands.py scan examples --out storage/review_logs.json
+    python cli/commands.py scan examples --generate-docs
+    python cli/commands.py scan examples --generate-docs --styles google
+    LOG_LEVEL=DEBUG python cli/commands.py scan examples --generate-docs
 
 Purpose:
     - Automated scanning for CI/CD pipelines
@@ -14,34 +17,125 @@ Note: For full documentation coverage analysis and docstring generation,
 """
 
 import argparse
+import logging
 import os
 import sys
-
-# Add project root to Python path
-project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
-if project_root not in sys.path:
-    sys.path.insert(0, project_root)
- 
-from core.parser.python_parser import parse_path
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from pathlib import Path
+
+# Add project root to Python path when run as a script (python cli/commands.py);
+# imports as `cli.commands` already have it
+if not __package__:
+    project_root = str(Path(__file__).resolve().parents[1])
+    if project_root not in sys.path:
+        sys.path.insert(0, project_root)
+
+from core._paths import ensure_parent_dir
+from core.parser.python_parser import configure_parse_cache, parse_path
 from core.reporter.coverage_reporter import compute_coverage, write_report
+from core.docstring_engine.generator import (
+    configure_cache,
+    configure_rate_limit,
+    generate_docstrings_batch,
+)
+
+STYLES = ("google", "numpy", "rest")
+
+
+def _parse_styles(value):
+    """argparse type for --styles: a comma-separated subset of STYLES."""
+    styles = tuple(dict.fromkeys(style.strip().lower() for style in value.split(",") if style.strip()))
+    unknown = [style for style in styles if style not in STYLES]
+    if not styles or unknown:
+        raise argparse.ArgumentTypeError(
+            f"expected a comma-separated list of {', '.join(STYLES)}; got {value!r}"
+        )
+    return styles
+
+
+def _attach_generated_docstrings(results, concurrency=16, on_progress=None, styles=STYLES):
+    """
+    Attach suggested docstrings in the given styles to every function, method and class.
+    
+    `on_progress` (if given) is called from this thread each time a batch of
+    docstrings has been attached, so callers can persist partial results.
+    """
+    funcs = []
+    classes = []
+    for file_result in results:
+        funcs.extend(file_result.get("functions", []))
+        for cls in file_result.get("classes", []):
+            classes.append(cls)
+            funcs.extend(cls.get("methods", []))
+
+    # One batched request per non-empty kind, both kinds in flight at the same
+    # time. Two batches split `concurrency` between them so the total number of
+    # LLM calls in flight never exceeds it (with a budget of 1 they take turns);
+    # a lone batch gets all of it.
+    batches = [(items, kind) for items, kind in ((funcs, "function"), (classes, "class")) if items]
+    if len(batches) == 2:
+        budgets = [max(1, concurrency - concurrency // 2), max(1, concurrency // 2)]
+    else:
+        budgets = [concurrency] * len(batches)
+    with ThreadPoolExecutor(max_workers=2 if concurrency >= 2 else 1) as executor:
+        futures = {
+            executor.submit(generate_docstrings_batch, items, kind=kind,
+                            max_concurrency=budget, styles=styles): items
+            for (items, kind), budget in zip(batches, budgets)
+        }
+        for future in as_completed(futures):
+            for item, docs in zip(futures[future], future.result()):
+                item["suggested_docstrings"] = docs
+            if on_progress:
+                on_progress()
+
+
+def _write_report_atomic(report, out_path):
+    """Write the report to `<out>.partial` and move it into place atomically."""
+    partial_path = out_path + ".partial"
+    write_report(report, partial_path)
+    os.replace(partial_path, out_path)
 
 
 def cmd_scan(args):
     """Scan Python files and save report to JSON."""
-    results = parse_path(args.path, recursive=True)
+    configure_parse_cache(None if args.no_parse_cache else args.parse_cache_dir)
+    results = parse_path(args.path, recursive=True, max_workers=args.jobs)
 
     if not results:
         print("[WARNING] No Python files found!")
         return
 
+    # Coverage is cheap, so it is written before the slow LLM step starts and
+    # survives an interrupted --generate-docs run
     out_path = args.out
-    os.makedirs(os.path.dirname(out_path), exist_ok=True)
-    write_report({"parsed_results": results}, out_path)
+    ensure_parent_dir(out_path)
+    report = {"parsed_results": results, "coverage": compute_coverage(results)}
+    _write_report_atomic(report, out_path)
+
+    if args.generate_docs:
+        print(f"[INFO] Coverage report saved at: {out_path}; generating docstrings...")
+        configure_cache(None if args.no_cache else args.cache_dir)
+        configure_rate_limit(args.requests_per_second)
+        # Results are updated in place, so each rewrite includes every finished batch
+        _attach_generated_docstrings(
+            results,
+            concurrency=args.concurrency,
+            styles=args.styles,
+            on_progress=lambda: _write_report_atomic(report, out_path)
+        )
 
     print(f"[INFO] Report saved at: {out_path}")
 
 
 def main():
+    # LOG_LEVEL (DEBUG, INFO, WARNING, ...) controls generator diagnostics; default WARNING
+    log_level = os.getenv("LOG_LEVEL", "WARNING").upper()
+    logging.basicConfig(
+        level=getattr(logging, log_level, logging.WARNING),
+        format="[%(levelname)s] %(message)s"
+    )
+    
     parser = argparse.ArgumentParser(description="AI Code Reviewer CLI Tool")
     sub = parser.add_subparsers(dest="command")
     
@@ -52,6 +146,55 @@ def main():
         default="storage/review_logs.json",
         help="Output JSON file path"
     )
+    scan_cmd.add_argument(
+        "--parse-cache-dir",
+        default="storage/parse_cache",
+        help="Directory of the persistent parse cache (files are re-parsed only when their mtime or size changes)"
+    )
+    scan_cmd.add_argument(
+        "--no-parse-cache",
+        action="store_true",
+        help="Parse every file from scratch"
+    )
+    scan_cmd.add_argument(
+        "--jobs",
+        type=int,
+        default=None,
+        help="Number of processes used to parse files (default: one per CPU; 1 parses serially)"
+    )
+    scan_cmd.add_argument(
+        "--generate-docs",
+        action="store_true",
+        help="Generate suggested docstrings (Google, NumPy, reST) for every function and class"
+    )
+    scan_cmd.add_argument(
+        "--styles",
+        type=_parse_styles,
+        default=STYLES,
+        help="Comma-separated docstring styles to generate (default: google,numpy,rest)"
+    )
+    scan_cmd.add_argument(
+        "--cache-dir",
+        default="storage/docstring_cache",
+        help="Directory of the persistent generated-docstring cache"
+    )
+    scan_cmd.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="Always call the LLM instead of reusing cached docstrings"
+    )
+    scan_cmd.add_argument(
+        "--concurrency",
+        type=int,
+        default=16,
+        help="Maximum number of concurrent LLM requests"
+    )
+    scan_cmd.add_argument(
+        "--requests-per-second",
+        type=float,
+        default=None,
+        help="Throttle LLM requests to stay under the provider's rate limit"
+    )
 
     args = parser.parse_args()
 
@@ -0,0 +1,30 @@
+"""
+Filesystem helpers shared by the CLI and the core modules.
+"""
+
+import functools
+from pathlib import Path
+
+
+@functools.lru_cache(maxsize=None)
+def ensure_dir(path: str) -> None:
+    """
+    Create a directory (and its parents) once per process.
+
+    Repeated calls for the same path are served from the cache, so hot paths
+    such as cache lookups don't stat the filesystem every time.
+
+    Args:
+        path (str): Directory to create; '' means the current directory
+    """
+    Path(path or ".").mkdir(parents=True, exist_ok=True)
+
+
+def ensure_parent_dir(file_path: str) -> None:
+    """
+    Create the directory that will contain `file_path`.
+
+    Args:
+        file_path (str): Path of a file about to be written
+    """
+    ensure_dir(str(Path(file_path).parent))
@@ -5,52 +5,62 @@ Generate docstrings in multiple styles (Google, NumPy, reST) using Groq LLM.
 Enhanced to generate docstrings for all functions AND classes regardless of existing documentation.
 """
 
+import functools
+import hashlib
+import logging
 import os
-from typing import Dict, List, Optional
-from langchain_groq import ChatGroq
-from langchain_core.prompts import ChatPromptTemplate
-from langchain_core.output_parsers import StrOutputParser
-from langchain_core.runnables import RunnableLambda
+import sqlite3
+import threading
+from collections import OrderedDict
+from typing import TYPE_CHECKING, Dict, Iterable, List, Optional
 
+import orjson
 
-def _arg_type_str(arg: Dict, style: str = "google") -> str:
-    """Format argument with type annotation for docstring."""
-    if style == "numpy":
-        if arg.get("annotation"):
-            return f"{arg['name']} : {arg['annotation']}"
-        return arg["name"]
-    elif style == "rest":
-        if arg.get("annotation"):
-            return f":param {arg['annotation']} {arg['name']}:"
-        return f":param {arg['name']}:"
-    else:  # google
-        if arg.get("annotation"):
-            return f"{arg['name']} ({arg['annotation']})"
-        return arg["name"]
+from core._paths import ensure_dir
 
+# LangChain is imported lazily (see _lazy_import_langchain) so scans that never
+# call the LLM don't pay for pulling in langchain/pydantic/httpx
+if TYPE_CHECKING:
+    from langchain_core.rate_limiters import InMemoryRateLimiter
 
-def _build_prompt(func_meta: Dict, style: str = "google") -> str:
-    """
-    Build a prompt for Groq to generate a docstring in specified style.
-    
-    Args:
-        func_meta (Dict): Function metadata dictionary
-        style (str): Docstring style - 'google', 'numpy', or 'rest'
-        
-    Returns:
-        str: Formatted prompt for the LLM
-    """
-    func_name = func_meta['name']
-    args = func_meta.get('args', [])
-    returns = func_meta.get('returns')
-    raises = func_meta.get('raises', [])
-    existing_docstring = func_meta.get('docstring', '')
-    
-    # Filter out self and cls
-    filtered_args = [arg for arg in args if arg['name'] not in ('self', 'cls')]
-    
-    style_examples = {
-        "google": """
+
+logger = logging.getLogger(__name__)
+
+_STYLES = ("google", "numpy", "rest")
+
+_SYSTEM_PROMPTS = {
+    "function": "You are a Python documentation expert. Generate clear, accurate {style_upper}-style docstrings following the exact format conventions. Always generate a complete docstring regardless of existing documentation.",
+    "class": "You are a Python documentation expert. Generate clear, accurate {style_upper}-style CLASS docstrings following the exact format conventions. Focus on describing the class purpose and responsibility."
+}
+
+_MAX_TOKENS = {"function": 500, "class": 400}
+
+# The Groq SDK retries 429/5xx responses itself, with jittered exponential
+# backoff that honours Retry-After; give it more attempts than its default 2
+_MAX_RETRIES = 5
+
+# Read once at import (after any load_dotenv); see refresh_api_key()
+_GROQ_API_KEY: Optional[str] = os.getenv("GROQ_API_KEY")
+
+# Token bucket shared by every chain so concurrent requests respect Groq's RPM cap
+_rate_limiter: Optional["InMemoryRateLimiter"] = None
+_rate_limit_lock = threading.Lock()
+_MIN_REQUESTS_PER_SECOND = 0.1
+
+# Persistent cache of LLM-generated docstrings (None disables it; the CLI and
+# the app turn it on). Disabled by default so library callers never write to disk.
+_cache_dir: Optional[str] = None
+_cache_lock = threading.Lock()
+
+# In-process LRU in front of the persistent cache, so identical signatures
+# (getters, stubs, ...) are only generated once per run even with --no-cache
+_MEMO_SIZE = 4096
+_memo: "OrderedDict[str, str]" = OrderedDict()
+
+
+# Style examples appended to function prompts
+_STYLE_EXAMPLES = {
+    "google": """
 Example Google style:
 \"\"\"
 Brief description.
@@ -67,7 +77,7 @@ Raises:
 \"\"\"
 
 Note: Only include sections that are relevant. If there are no exceptions, omit the Raises section entirely.""",
-        "numpy": """
+    "numpy": """
 Example NumPy style:
 \"\"\"
 Brief description.
@@ -91,7 +101,7 @@ ValueError
 \"\"\"
 
 Note: Only include sections that are relevant. If there are no exceptions, omit the Raises section entirely.""",
-        "rest": """
+    "rest": """
 Example reST style:
 \"\"\"
 Brief description.
@@ -104,66 +114,11 @@ Brief description.
 \"\"\"
 
 Note: Only include sections that are relevant. If there are no exceptions, omit the raises section entirely."""
-    }
-    
-    # Build context about existing documentation
-    existing_doc_context = ""
-    if existing_docstring and existing_docstring.strip() != '"""\nNo docstring.\n"""':
-        existing_doc_context = f"\n\nExisting docstring (for reference):\n{existing_docstring}"
-    
-    # Only mention raises if there actually are exceptions
-    if raises:
-        raises_info = f"- Raises: {', '.join(raises)} (YOU MUST include a Raises section)"
-    else:
-        raises_info = "- Raises: None (DO NOT include a Raises section)"
-
-    
-    prompt = f"""Generate a {style.upper()}-style docstring for a Python function named '{func_name}'.
-
-Function signature details:
-- Arguments: {', '.join([f"{arg['name']}: {arg.get('annotation', 'Any')}" for arg in filtered_args]) if filtered_args else 'None'}
-- Returns: {returns if returns else 'None'}
-{raises_info}{existing_doc_context}
-
-{style_examples.get(style, style_examples['google'])}
-
-Requirements:
-1. Start with a clear, concise summary line
-2. Follow {style.upper()}-style formatting strictly
-3. Include only relevant sections (Args/Parameters, Returns, and Raises ONLY if exceptions exist)
-4. Use proper indentation
-5. Do NOT include the triple quotes in your response
-6. Be descriptive but concise
-7. Exclude self/cls parameters
-8. Generate a COMPLETE docstring even if one already exists
-9. If an existing docstring is provided, use its content as context but reformat to {style.upper()} style
-10. IMPORTANT: If there are no exceptions (Raises: None), do NOT include a Raises section at all
-
-Generate only the docstring content (without the triple quotes):"""
-    
-    return prompt
+}
 
-
-def _build_class_prompt(class_meta: Dict, style: str = "google") -> str:
-    """
-    Build a prompt for Groq to generate a CLASS docstring in specified style.
-    
-    Args:
-        class_meta (Dict): Class metadata dictionary
-        style (str): Docstring style - 'google', 'numpy', or 'rest'
-        
-    Returns:
-        str: Formatted prompt for the LLM
-    """
-    class_name = class_meta['name']
-    methods = class_meta.get('methods', [])
-    existing_docstring = class_meta.get('docstring', '')
-    
-    # Get method names and their brief purpose
-    method_list = ', '.join([m['name'] for m in methods if m['name'] not in ('__init__', '__str__', '__repr__')])
-    
-    style_examples = {
-        "google": """
+# Style examples appended to class prompts
+_CLASS_STYLE_EXAMPLES = {
+    "google": """
 Example Google style for classes:
 \"\"\"
 Brief description of the class.
@@ -176,7 +131,7 @@ Attributes:
 \"\"\"
 
 Note: Only include Attributes section if the class has notable attributes.""",
-        "numpy": """
+    "numpy": """
 Example NumPy style for classes:
 \"\"\"
 Brief description of the class.
@@ -192,7 +147,7 @@ attr2 : int
 \"\"\"
 
 Note: Only include Attributes section if the class has notable attributes.""",
-        "rest": """
+    "rest": """
 Example reST style for classes:
 \"\"\"
 Brief description of the class.
@@ -211,36 +166,496 @@ This class provides functionality for... [more detailed description if needed]
 \"\"\"
 
 Note: Only include attributes if the class has notable attributes."""
-    }
-    
-    # Build context about existing documentation
-    existing_doc_context = ""
-    if existing_docstring and existing_docstring.strip() != '"""\nNo docstring.\n"""':
-        existing_doc_context = f"\n\nExisting docstring (for reference):\n{existing_docstring}"
-    
-    prompt = f"""Generate a {style.upper()}-style docstring for a Python class named '{class_name}'.
+}
+
+# Per-call part of the prompt: only what differs between functions/classes
+_PROMPT_TEMPLATE = """Generate a {style_upper}-style docstring for a Python function named '{func_name}'.
+
+Function signature details:
+- Arguments: {args_str}
+- Returns: {returns}
+{raises_info}{existing_doc_context}
+
+Generate only the docstring content (without the triple quotes):"""
+
+_CLASS_PROMPT_TEMPLATE = """Generate a {style_upper}-style docstring for a Python class named '{class_name}'.
 
 Class details:
 - Class name: {class_name}
-- Methods: {method_list if method_list else 'None (empty class)'}
-- Number of methods: {len(methods)}{existing_doc_context}
+- Methods: {method_list}
+- Number of methods: {method_count}{existing_doc_context}
+
+Generate only the docstring content (without the triple quotes):"""
 
-{style_examples.get(style, style_examples['google'])}
+# Static part of the prompt, appended to the system message. It only depends on
+# (kind, style), so the system message is byte-identical for every call of a
+# scan and the provider can serve it from its prompt-prefix cache.
+_INSTRUCTIONS_TEMPLATE = """
+{style_example}
+
+Requirements:
+1. Start with a clear, concise summary line
+2. Follow {style_upper}-style formatting strictly
+3. Include only relevant sections (Args/Parameters, Returns, and Raises ONLY if exceptions exist)
+4. Use proper indentation
+5. Do NOT include the triple quotes in your response
+6. Be descriptive but concise
+7. Exclude self/cls parameters
+8. Generate a COMPLETE docstring even if one already exists
+9. If an existing docstring is provided, use its content as context but reformat to {style_upper} style
+10. IMPORTANT: If there are no exceptions (Raises: None), do NOT include a Raises section at all"""
+
+_CLASS_INSTRUCTIONS_TEMPLATE = """
+{style_example}
 
 Requirements:
 1. Start with a clear, concise summary line describing the class purpose
-2. Follow {style.upper()}-style formatting strictly
+2. Follow {style_upper}-style formatting strictly
 3. Provide a brief overview of what the class does
 4. Only include Attributes section if it makes sense for the class
 5. Use proper indentation
 6. Do NOT include the triple quotes in your response
 7. Be descriptive but concise
 8. Generate a COMPLETE docstring even if one already exists
-9. Focus on the class's PURPOSE and RESPONSIBILITY, not implementation details
+9. Focus on the class's PURPOSE and RESPONSIBILITY, not implementation details"""
 
-Generate only the docstring content (without the triple quotes):"""
+_STYLE_UPPER = {style: style.upper() for style in _STYLES}
+
+# Per-call templates with the style name already filled in, so building a
+# prompt only formats the fields that differ between functions/classes
+_PROMPT_TEMPLATES = {
+    style: _PROMPT_TEMPLATE.replace("{style_upper}", style_upper) for style, style_upper in _STYLE_UPPER.items()
+}
+_CLASS_PROMPT_TEMPLATES = {
+    style: _CLASS_PROMPT_TEMPLATE.replace("{style_upper}", style_upper) for style, style_upper in _STYLE_UPPER.items()
+}
+
+# Existing docstrings are only reference material; ~200 tokens (4 chars/token) is plenty
+_EXISTING_DOC_MAX_CHARS = 800
+
+# Implicit parameters never documented, and methods left out of class summaries
+_SKIP_ARGS = frozenset(("self", "cls"))
+_SKIP_METHODS = frozenset(("__init__", "__str__", "__repr__"))
+
+
+def _arg_type_str(arg: Dict, style: str = "google") -> str:
+    """Format argument with type annotation for docstring."""
+    if style == "numpy":
+        if arg.get("annotation"):
+            return f"{arg['name']} : {arg['annotation']}"
+        return arg["name"]
+    elif style == "rest":
+        if arg.get("annotation"):
+            return f":param {arg['annotation']} {arg['name']}:"
+        return f":param {arg['name']}:"
+    else:  # google
+        if arg.get("annotation"):
+            return f"{arg['name']} ({arg['annotation']})"
+        return arg["name"]
+
+
+def _clip(text: str, max_chars: int = _EXISTING_DOC_MAX_CHARS) -> str:
+    """Truncate text to `max_chars`, cutting at a word boundary and marking the cut with an ellipsis."""
+    if len(text) <= max_chars:
+        return text
+    clipped = text[:max_chars]
+    cut = clipped.rfind(" ")
+    if cut > max_chars // 2:
+        clipped = clipped[:cut]
+    return clipped.rstrip() + " ..."
+
+
+def _build_prompt(func_meta: Dict, style: str = "google") -> str:
+    """
+    Build a prompt for Groq to generate a docstring in specified style.
+    
+    Args:
+        func_meta (Dict): Function metadata dictionary
+        style (str): Docstring style - 'google', 'numpy', or 'rest'
+        
+    Returns:
+        str: Formatted prompt for the LLM
+    """
+    func_name = func_meta['name']
+    args = func_meta.get('args', [])
+    returns = func_meta.get('returns')
+    raises = func_meta.get('raises', [])
+    existing_docstring = func_meta.get('docstring', '')
+    
+    # Filter out self and cls
+    filtered_args = [arg for arg in args if arg['name'] not in _SKIP_ARGS]
+    
+    # Build context about existing documentation
+    existing_doc_context = ""
+    if existing_docstring and existing_docstring.strip() != '"""\nNo docstring.\n"""':
+        existing_doc_context = f"\n\nExisting docstring (for reference):\n{_clip(existing_docstring)}"
+    
+    # Only mention raises if there actually are exceptions
+    if raises:
+        raises_info = f"- Raises: {', '.join(raises)} (YOU MUST include a Raises section)"
+    else:
+        raises_info = "- Raises: None (DO NOT include a Raises section)"
+    
+    template = _PROMPT_TEMPLATES.get(style) or _PROMPT_TEMPLATE.replace("{style_upper}", style.upper())
+    return template.format(
+        func_name=func_name,
+        args_str=', '.join(f"{arg['name']}: {arg.get('annotation', 'Any')}" for arg in filtered_args) if filtered_args else 'None',
+        returns=returns if returns else 'None',
+        raises_info=raises_info,
+        existing_doc_context=existing_doc_context
+    )
+
+
+def _build_class_prompt(class_meta: Dict, style: str = "google") -> str:
+    """
+    Build a prompt for Groq to generate a CLASS docstring in specified style.
+    
+    Args:
+        class_meta (Dict): Class metadata dictionary
+        style (str): Docstring style - 'google', 'numpy', or 'rest'
+        
+    Returns:
+        str: Formatted prompt for the LLM
+    """
+    class_name = class_meta['name']
+    methods = class_meta.get('methods', [])
+    existing_docstring = class_meta.get('docstring', '')
+    
+    # Get method names and their brief purpose
+    method_list = ', '.join(m['name'] for m in methods if m['name'] not in _SKIP_METHODS)
+    
+    # Build context about existing documentation
+    existing_doc_context = ""
+    if existing_docstring and existing_docstring.strip() != '"""\nNo docstring.\n"""':
+        existing_doc_context = f"\n\nExisting docstring (for reference):\n{_clip(existing_docstring)}"
+    
+    template = _CLASS_PROMPT_TEMPLATES.get(style) or _CLASS_PROMPT_TEMPLATE.replace("{style_upper}", style.upper())
+    return template.format(
+        class_name=class_name,
+        method_list=method_list if method_list else 'None (empty class)',
+        method_count=len(methods),
+        existing_doc_context=existing_doc_context
+    )
+
+
+@functools.lru_cache(maxsize=None)
+def _lazy_import_langchain():
+    """Import the LangChain pieces used to build chains, on first use only."""
+    from langchain_groq import ChatGroq
+    from langchain_core.prompts import ChatPromptTemplate
+    from langchain_core.output_parsers import StrOutputParser
+    from langchain_core.runnables import RunnableLambda
+    return ChatGroq, ChatPromptTemplate, StrOutputParser, RunnableLambda
+
+
+class _TemplateDocstring(str):
+    """Template docstring returned by the chain fallback instead of LLM output."""
+
+
+def _slow_down_on_rate_limit(error: BaseException) -> None:
+    """Halve the shared request rate when Groq still answers 429 after all retries."""
+    if getattr(error, "status_code", None) != 429:
+        return
+    if _rate_limiter is None:
+        logger.warning("Groq rate limit persisted after %d retries; consider --requests-per-second", _MAX_RETRIES)
+        return
+    with _rate_limit_lock:
+        _rate_limiter.requests_per_second = max(_MIN_REQUESTS_PER_SECOND, _rate_limiter.requests_per_second / 2)
+    logger.warning("Groq rate limit persisted after %d retries; throttling to %.2f requests/s",
+                   _MAX_RETRIES, _rate_limiter.requests_per_second)
+
+
+def _template_fallback(inputs: Dict) -> str:
+    """Chain fallback: build a template docstring from the metadata in the invoke input."""
+    meta = inputs["meta"]
+    _slow_down_on_rate_limit(inputs.get("error"))
+    logger.info("Falling back to template for %s (%s): %s", meta.get('name', 'unknown'), inputs['style'], inputs.get('error'))
+    fallback = _generate_fallback_class_docstring if inputs["kind"] == "class" else _generate_fallback_docstring
+    return _TemplateDocstring(fallback(meta, inputs["style"]))
+
+
+@functools.lru_cache(maxsize=None)
+def _system_prompt(kind: str, style: str) -> str:
+    """
+    Build the system message for a kind ('function'/'class') and style.
+    
+    It holds the role, the style example and the formatting rules, none of
+    which depend on the function being documented.
+    """
+    if kind == "class":
+        examples, instructions = _CLASS_STYLE_EXAMPLES, _CLASS_INSTRUCTIONS_TEMPLATE
+    else:
+        examples, instructions = _STYLE_EXAMPLES, _INSTRUCTIONS_TEMPLATE
+    style_upper = _STYLE_UPPER.get(style) or style.upper()
+    return _SYSTEM_PROMPTS[kind].format(style_upper=style_upper) + instructions.format(
+        style_upper=style_upper,
+        style_example=examples.get(style, examples['google'])
+    )
+
+
+def _chain_input(meta: Dict, style: str, kind: str = "function") -> Dict:
+    """Build the invoke input for the shared chain of the given kind."""
+    build_prompt = _build_class_prompt if kind == "class" else _build_prompt
+    return {
+        "system_prompt": _system_prompt(kind, style),
+        "prompt_text": build_prompt(meta, style),
+        "meta": meta,
+        "style": style,
+        "kind": kind
+    }
+
+
+@functools.lru_cache(maxsize=None)
+def _get_chain(kind: str = "function"):
+    """
+    Return the shared LangChain pipeline for function or class docstrings.
+    
+    The chain is built once per kind. The per-style system prompt, the prompt
+    text and the metadata used by the template fallback travel in the invoke
+    input (see ``_chain_input``), so a single chain serves every function/class
+    in Google, NumPy and reST alike.
+    """
+    ChatGroq, ChatPromptTemplate, StrOutputParser, RunnableLambda = _lazy_import_langchain()
+    llm = ChatGroq(
+        model="llama-3.3-70b-versatile",
+        temperature=0.3,
+        max_tokens=_MAX_TOKENS[kind],
+        groq_api_key=_GROQ_API_KEY,
+        rate_limiter=_rate_limiter,
+        max_retries=_MAX_RETRIES
+    )
+    prompt_template = ChatPromptTemplate.from_messages([
+        ("system", "{system_prompt}"),
+        ("user", "{prompt_text}")
+    ])
+    chain = prompt_template | llm | StrOutputParser()
+    return chain.with_fallbacks([RunnableLambda(_template_fallback)], exception_key="error")
+
+
+def refresh_api_key() -> Optional[str]:
+    """
+    Re-read GROQ_API_KEY from the environment, e.g. after the key was changed at runtime.
+    
+    Returns:
+        Optional[str]: The key now in use, or None if it is not set
+    """
+    global _GROQ_API_KEY
+    _GROQ_API_KEY = os.getenv("GROQ_API_KEY")
+    # Chains capture the key when built, so rebuild them on next use
+    _get_chain.cache_clear()
+    return _GROQ_API_KEY
+
+
+def configure_rate_limit(requests_per_second: Optional[float]) -> None:
+    """
+    Throttle LLM requests with a token bucket shared across all threads.
+    
+    Args:
+        requests_per_second (Optional[float]): Sustained request rate, or None for no limit
+    """
+    global _rate_limiter
+    if requests_per_second:
+        from langchain_core.rate_limiters import InMemoryRateLimiter
+        _rate_limiter = InMemoryRateLimiter(
+            requests_per_second=requests_per_second,
+            check_every_n_seconds=0.1,
+            max_bucket_size=max(1, requests_per_second)
+        )
+    else:
+        _rate_limiter = None
+    # Chains capture the limiter when built, so rebuild them on next use
+    _get_chain.cache_clear()
+
+
+def configure_cache(cache_dir: Optional[str] = None) -> None:
+    """
+    Set the directory of the persistent docstring cache.
     
-    return prompt
+    Args:
+        cache_dir (Optional[str]): Cache directory, or None to disable caching
+    """
+    global _cache_dir
+    _cache_dir = cache_dir
+
+
+def _cache_key(meta: Dict, style: str, kind: str = "function") -> str:
+    """Hash the parts of a function/class signature that shape its generated docstring."""
+    if kind == "class":
+        payload = {
+            "name": meta.get("name"),
+            "methods": [m.get("name") for m in meta.get("methods", [])],
+            "docstring": meta.get("docstring")
+        }
+    else:
+        payload = {
+            "name": meta.get("name"),
+            "args": meta.get("args", []),
+            "returns": meta.get("returns"),
+            "raises": meta.get("raises", []),
+            "docstring": meta.get("docstring")
+        }
+    payload["kind"] = kind
+    payload["style"] = style
+    encoded = orjson.dumps(payload, option=orjson.OPT_SORT_KEYS, default=str)
+    return hashlib.blake2b(encoded, digest_size=20).hexdigest()
+
+
+def _cache_connect() -> sqlite3.Connection:
+    """Open the cache database, creating it on first use."""
+    ensure_dir(_cache_dir)
+    conn = sqlite3.connect(os.path.join(_cache_dir, "docstrings.sqlite3"))
+    conn.execute("CREATE TABLE IF NOT EXISTS docstrings (key TEXT PRIMARY KEY, docstring TEXT NOT NULL)")
+    return conn
+
+
+def _memo_get(keys: List[str]) -> Dict[str, str]:
+    """Return the docstrings already generated in this process for the given keys."""
+    found = {}
+    with _cache_lock:
+        for key in keys:
+            if key in _memo:
+                _memo.move_to_end(key)
+                found[key] = _memo[key]
+    return found
+
+
+def _memo_put(entries: Dict[str, str]) -> None:
+    """Remember generated docstrings for the rest of the process, evicting the oldest."""
+    with _cache_lock:
+        for key, docstring in entries.items():
+            _memo[key] = docstring
+            _memo.move_to_end(key)
+        while len(_memo) > _MEMO_SIZE:
+            _memo.popitem(last=False)
+
+
+def _cache_get(keys: Iterable[str]) -> Dict[str, str]:
+    """Return the cached docstrings for the given keys (misses are omitted)."""
+    keys = list(keys)
+    found = _memo_get(keys)
+    missing = [key for key in keys if key not in found]
+    if _cache_dir is None or not missing:
+        return found
+    from_disk = {}
+    try:
+        with _cache_lock:
+            conn = _cache_connect()
+            try:
+                # Stay well below SQLite's bound-parameter limit
+                for i in range(0, len(missing), 500):
+                    chunk = missing[i:i + 500]
+                    placeholders = ",".join("?" * len(chunk))
+                    from_disk.update(conn.execute(
+                        f"SELECT key, docstring FROM docstrings WHERE key IN ({placeholders})", chunk
+                    ).fetchall())
+            finally:
+                conn.close()
+    except sqlite3.Error as e:
+        logger.warning("Docstring cache unavailable: %s", e)
+    _memo_put(from_disk)
+    found.update(from_disk)
+    return found
+
+
+def _cache_set(entries: Dict[str, str]) -> None:
+    """Store generated docstrings in the in-process and persistent caches."""
+    _memo_put(entries)
+    if _cache_dir is None or not entries:
+        return
+    try:
+        with _cache_lock:
+            conn = _cache_connect()
+            try:
+                conn.executemany("INSERT OR REPLACE INTO docstrings (key, docstring) VALUES (?, ?)", entries.items())
+                conn.commit()
+            finally:
+                conn.close()
+    except sqlite3.Error as e:
+        logger.warning("Could not write docstring cache: %s", e)
+
+
+def _wrap_docstring(docstring_content: str) -> str:
+    """Strip markdown fences / stray quotes from an LLM response and wrap it in triple quotes."""
+    if docstring_content.startswith("```"):
+        lines = docstring_content.split('\n')
+        docstring_content = '\n'.join(lines[1:-1]) if len(lines) > 2 else docstring_content
+    
+    docstring_content = docstring_content.strip('"""').strip("'''").strip()
+    return f'"""\n{docstring_content}\n"""'
+
+
+def generate_docstrings_batch(metas: List[Dict], use_groq: bool = True, kind: str = "function",
+                              max_concurrency: int = 16, styles: Iterable[str] = _STYLES) -> List[Dict[str, str]]:
+    """
+    Generate docstrings in all styles for many functions or classes at once.
+    
+    Every (item, style) prompt is submitted through a single ``chain.batch`` call,
+    so a whole project costs roughly one round-trip instead of one per docstring.
+    Docstrings already generated in this process or found in the persistent
+    cache are not requested again, duplicate signatures are requested once, and
+    items whose request fails fall back to the template generator individually.
+    
+    Args:
+        metas (List[Dict]): Function or class metadata dictionaries
+        use_groq (bool): Whether to use Groq LLM or fallback to template
+        kind (str): 'function' or 'class'
+        max_concurrency (int): Maximum number of requests in flight
+        styles (Iterable[str]): Styles to generate; each one is cached independently
+        
+    Returns:
+        List[Dict[str, str]]: One {style: docstring} dict per input item
+    """
+    fallback = _generate_fallback_class_docstring if kind == "class" else _generate_fallback_docstring
+    
+    styles = tuple(styles)
+    if not metas:
+        return []
+    
+    if not use_groq or not _GROQ_API_KEY:
+        if use_groq:
+            logger.warning("GROQ_API_KEY not found. Using fallback templates for %d %s(s).", len(metas), kind)
+        return [{style: fallback(meta, style) for style in styles} for meta in metas]
+    
+    tasks = [(meta, style, _cache_key(meta, style, kind)) for meta in metas for style in styles]
+    cached = _cache_get(key for _, _, key in tasks)
+    # Identical signatures (same key) are requested only once
+    pending = list({key: (meta, style, key) for meta, style, key in tasks if key not in cached}.values())
+    
+    generated = {}
+    if pending:
+        inputs = [_chain_input(meta, style, kind) for meta, style, _ in pending]
+        logger.debug("Calling Groq API via LangChain batch for %d %s docstring(s) (%d cached)...",
+                     len(inputs), kind, len(tasks) - len(pending))
+        try:
+            responses = _get_chain(kind).batch(
+                inputs,
+                config={"max_concurrency": max_concurrency},
+                return_exceptions=True
+            )
+        except Exception as e:
+            logger.error("Error generating docstrings with LangChain batch: %s", e,
+                         exc_info=logger.isEnabledFor(logging.DEBUG))
+            responses = [e] * len(inputs)
+        
+        for (meta, style, key), response in zip(pending, responses):
+            if isinstance(response, Exception):
+                _slow_down_on_rate_limit(response)
+                logger.info("Falling back to template for %s (%s): %s", meta.get('name', 'unknown'), style, response)
+            elif not response.strip():
+                logger.info("Empty LLM response for %s (%s); using template", meta.get('name', 'unknown'), style)
+            elif not isinstance(response, _TemplateDocstring):
+                generated[key] = _wrap_docstring(response)
+        _cache_set(generated)
+    
+    results = []
+    tasks = iter(tasks)
+    for meta in metas:
+        docs = {}
+        for style in styles:
+            _, _, key = next(tasks)
+            docs[style] = cached.get(key) or generated.get(key) or fallback(meta, style)
+        results.append(docs)
+    return results
 
 
 def generate_google_docstring(func_meta: Dict, use_groq: bool = True, style: str = "google") -> str:
@@ -252,6 +667,9 @@ def generate_google_docstring(func_meta: Dict, use_groq: bool = True, style: str
     - Have no docstring
     - Have an existing docstring in any style
     
+    LLM results are kept in a persistent cache keyed by the function signature,
+    so unchanged functions are not sent to Groq again on later scans.
+    
     Args:
         func_meta (Dict): Function metadata dictionary containing name, args, returns, etc.
         use_groq (bool): Whether to use Groq LLM or fallback to template
@@ -260,76 +678,51 @@ def generate_google_docstring(func_meta: Dict, use_groq: bool = True, style: str
     Returns:
         str: Complete docstring with triple quotes
     """
-    print(f"[DEBUG] Generating {style} docstring for: {func_meta.get('name', 'unknown')}")
+    logger.debug("Generating %s docstring for: %s", style, func_meta.get('name', 'unknown'))
     
     if not use_groq:
-        print(f"[INFO] Using fallback template generation (use_groq=False)")
+        logger.info("Using fallback template generation (use_groq=False)")
         return _generate_fallback_docstring(func_meta, style)
     
     # Check API key
-    api_key = os.getenv("GROQ_API_KEY")
-    if not api_key:
-        print(f"[WARNING] GROQ_API_KEY not found. Using fallback template for {style} style.")
+    if not _GROQ_API_KEY:
+        logger.warning("GROQ_API_KEY not found. Using fallback template for %s style.", style)
         return _generate_fallback_docstring(func_meta, style)
     
-    print(f"[DEBUG] API Key found: {api_key[:10]}...")
+    cache_key = _cache_key(func_meta, style, "function")
+    cached = _cache_get([cache_key]).get(cache_key)
+    if cached is not None:
+        logger.debug("Docstring cache hit for %s (%s)", func_meta.get('name', 'unknown'), style)
+        return cached
     
     try:
-        # 1️⃣ Initialize LLM
-        llm = ChatGroq(
-            model="llama-3.3-70b-versatile",
-            temperature=0.3,
-            max_tokens=500,
-            groq_api_key=api_key
-        )
-        
-        # 2️⃣ Create prompt template
-        prompt_template = ChatPromptTemplate.from_messages([
-            ("system", f"You are a Python documentation expert. Generate clear, accurate {style.upper()}-style docstrings following the exact format conventions. Always generate a complete docstring regardless of existing documentation."),
-            ("user", "{prompt_text}")
-        ])
-        
-        # 3️⃣ Create output parser
-        output_parser = StrOutputParser()
-        
-        # 4️⃣ Build the chain
-        chain = prompt_template | llm | output_parser
-        
-        # 5️⃣ Add fallback chain
-        fallback_chain = RunnableLambda(lambda x: _generate_fallback_docstring(func_meta, style))
-        chain_with_fallback = chain.with_fallbacks([fallback_chain])
-        
-        # 6️⃣ Build prompt
-        prompt_text = _build_prompt(func_meta, style)
-        print(f"[DEBUG] Prompt built, length: {len(prompt_text)}")
-        
-        # 7️⃣ Invoke chain
-        print(f"[DEBUG] Calling Groq API via LangChain...")
-        docstring_content = chain_with_fallback.invoke({"prompt_text": prompt_text})
-        print(f"[DEBUG] API call successful")
-        
-        print(f"[DEBUG] Docstring content length: {len(docstring_content)}")
-        
-        # 8️⃣ Clean up response
-        # Remove markdown code blocks if present
-        if docstring_content.startswith("```"):
-            lines = docstring_content.split('\n')
-            docstring_content = '\n'.join(lines[1:-1]) if len(lines) > 2 else docstring_content
-        
-        # Remove triple quotes if they were included
-        docstring_content = docstring_content.strip('"""').strip("'''").strip()
-        
-        # 9️⃣ Wrap in triple quotes
-        result = f'"""\n{docstring_content}\n"""'
-        print(f"[DEBUG] Final docstring generated successfully")
+        # 1️⃣ Build prompt
+        chain_input = _chain_input(func_meta, style, "function")
+        logger.debug("Prompt built, length: %d", len(chain_input['prompt_text']))
+        
+        # 2️⃣ Invoke the shared chain (falls back to the template on failure)
+        logger.debug("Calling Groq API via LangChain...")
+        docstring_content = _get_chain("function").invoke(chain_input)
+        if isinstance(docstring_content, _TemplateDocstring):
+            return str(docstring_content)
+        if not docstring_content.strip():
+            logger.info("Empty LLM response; using template for %s style.", style)
+            return _generate_fallback_docstring(func_meta, style)
+        logger.debug("API call successful")
+        
+        logger.debug("Docstring content length: %d", len(docstring_content))
+        
+        # 3️⃣ Clean up response and wrap in triple quotes
+        result = _wrap_docstring(docstring_content)
+        _cache_set({cache_key: result})
+        logger.debug("Final docstring generated successfully")
         return result
         
     except Exception as e:
-        print(f"[ERROR] Error generating docstring with LangChain: {e}")
-        print(f"[ERROR] Exception type: {type(e).__name__}")
-        import traceback
-        print(f"[ERROR] Traceback: {traceback.format_exc()}")
-        print(f"[INFO] Falling back to template-based generation for {style} style.")
+        # The traceback is only formatted when debug logging is on
+        logger.error("Error generating docstring with LangChain (%s): %s", type(e).__name__, e,
+                     exc_info=logger.isEnabledFor(logging.DEBUG))
+        logger.info("Falling back to template-based generation for %s style.", style)
         return _generate_fallback_docstring(func_meta, style)
 
 
@@ -338,6 +731,7 @@ def generate_class_docstring(class_meta: Dict, use_groq: bool = True, style: str
     Generate a docstring for a CLASS using Groq LLM via LangChain.
     
     This function ALWAYS generates a new class docstring regardless of whether one exists.
+    LLM results are kept in the same persistent cache as function docstrings.
     
     Args:
         class_meta (Dict): Class metadata dictionary containing name, methods, etc.
@@ -347,76 +741,121 @@ def generate_class_docstring(class_meta: Dict, use_groq: bool = True, style: str
     Returns:
         str: Complete docstring with triple quotes
     """
-    print(f"[DEBUG] Generating {style} CLASS docstring for: {class_meta.get('name', 'unknown')}")
+    logger.debug("Generating %s CLASS docstring for: %s", style, class_meta.get('name', 'unknown'))
     
     if not use_groq:
-        print(f"[INFO] Using fallback template generation for class (use_groq=False)")
+        logger.info("Using fallback template generation for class (use_groq=False)")
         return _generate_fallback_class_docstring(class_meta, style)
     
     # Check API key
-    api_key = os.getenv("GROQ_API_KEY")
-    if not api_key:
-        print(f"[WARNING] GROQ_API_KEY not found. Using fallback template for {style} style.")
+    if not _GROQ_API_KEY:
+        logger.warning("GROQ_API_KEY not found. Using fallback template for %s style.", style)
         return _generate_fallback_class_docstring(class_meta, style)
     
-    print(f"[DEBUG] API Key found: {api_key[:10]}...")
+    cache_key = _cache_key(class_meta, style, "class")
+    cached = _cache_get([cache_key]).get(cache_key)
+    if cached is not None:
+        logger.debug("Docstring cache hit for %s (%s)", class_meta.get('name', 'unknown'), style)
+        return cached
     
     try:
-        # 1️⃣ Initialize LLM
-        llm = ChatGroq(
-            model="llama-3.3-70b-versatile",
-            temperature=0.3,
-            max_tokens=400,
-            groq_api_key=api_key
-        )
-        
-        # 2️⃣ Create prompt template
-        prompt_template = ChatPromptTemplate.from_messages([
-            ("system", f"You are a Python documentation expert. Generate clear, accurate {style.upper()}-style CLASS docstrings following the exact format conventions. Focus on describing the class purpose and responsibility."),
-            ("user", "{prompt_text}")
-        ])
-        
-        # 3️⃣ Create output parser
-        output_parser = StrOutputParser()
-        
-        # 4️⃣ Build the chain
-        chain = prompt_template | llm | output_parser
-        
-        # 5️⃣ Add fallback chain
-        fallback_chain = RunnableLambda(lambda x: _generate_fallback_class_docstring(class_meta, style))
-        chain_with_fallback = chain.with_fallbacks([fallback_chain])
-        
-        # 6️⃣ Build prompt
-        prompt_text = _build_class_prompt(class_meta, style)
-        print(f"[DEBUG] Class prompt built, length: {len(prompt_text)}")
-        
-        # 7️⃣ Invoke chain
-        print(f"[DEBUG] Calling Groq API for class via LangChain...")
-        docstring_content = chain_with_fallback.invoke({"prompt_text": prompt_text})
-        print(f"[DEBUG] API call successful")
-        
-        print(f"[DEBUG] Class docstring content length: {len(docstring_content)}")
-        
-        # 8️⃣ Clean up response
-        if docstring_content.startswith("```"):
-            lines = docstring_content.split('\n')
-            docstring_content = '\n'.join(lines[1:-1]) if len(lines) > 2 else docstring_content
-        
-        docstring_content = docstring_content.strip('"""').strip("'''").strip()
-        
-        # 9️⃣ Wrap in triple quotes
-        result = f'"""\n{docstring_content}\n"""'
-        print(f"[DEBUG] Final class docstring generated successfully")
+        # 1️⃣ Build prompt
+        chain_input = _chain_input(class_meta, style, "class")
+        logger.debug("Class prompt built, length: %d", len(chain_input['prompt_text']))
+        
+        # 2️⃣ Invoke the shared chain (falls back to the template on failure)
+        logger.debug("Calling Groq API for class via LangChain...")
+        docstring_content = _get_chain("class").invoke(chain_input)
+        if isinstance(docstring_content, _TemplateDocstring):
+            return str(docstring_content)
+        if not docstring_content.strip():
+            logger.info("Empty LLM response; using template for %s style.", style)
+            return _generate_fallback_class_docstring(class_meta, style)
+        logger.debug("API call successful")
+        
+        logger.debug("Class docstring content length: %d", len(docstring_content))
+        
+        # 3️⃣ Clean up response and wrap in triple quotes
+        result = _wrap_docstring(docstring_content)
+        _cache_set({cache_key: result})
+        logger.debug("Final class docstring generated successfully")
         return result
         
     except Exception as e:
-        print(f"[ERROR] Error generating class docstring with LangChain: {e}")
-        print(f"[ERROR] Exception type: {type(e).__name__}")
-        import traceback
-        print(f"[ERROR] Traceback: {traceback.format_exc()}")
-        print(f"[INFO] Falling back to template-based generation for {style} style.")
+        # The traceback is only formatted when debug logging is on
+        logger.error("Error generating class docstring with LangChain (%s): %s", type(e).__name__, e,
+                     exc_info=logger.isEnabledFor(logging.DEBUG))
+        logger.info("Falling back to template-based generation for %s style.", style)
         return _generate_fallback_class_docstring(class_meta, style)
 
+def _google_fallback_sections(args: List[Dict], returns: Optional[str], raises: List[str]) -> List[str]:
+    """Pre-joined Google-style Args/Returns/Raises sections of a template docstring."""
+    sections = []
+    if args:
+        block = "Args:"
+        for arg in args:
+            name, ann = arg["name"], arg.get("annotation")
+            block += f"\n    {name} ({ann}): Description of {name}." if ann else f"\n    {name}: Description of {name}."
+        sections.append(block)
+    if returns:
+        sections.append(f"Returns:\n    {returns}: Description of return value.")
+    if raises:
+        block = "Raises:"
+        for exc in raises:
+            block += f"\n    {exc}: Description of when {exc} is raised."
+        sections.append(block)
+    return sections
+
+
+def _numpy_fallback_sections(args: List[Dict], returns: Optional[str], raises: List[str]) -> List[str]:
+    """Pre-joined NumPy-style Parameters/Returns/Raises sections of a template docstring."""
+    sections = []
+    if args:
+        block = "Parameters\n----------"
+        sep = "\n"
+        for arg in args:
+            name = arg["name"]
+            block += f"{sep}{name} : {arg.get('annotation', 'TYPE')}\n    Description of {name}."
+            sep = "\n\n"
+        sections.append(block)
+    if returns:
+        sections.append(f"Returns\n-------\n{returns}\n    Description of return value.")
+    if raises:
+        block = "Raises\n------"
+        sep = "\n"
+        for exc in raises:
+            block += f"{sep}{exc}\n    Description of when {exc} is raised."
+            sep = "\n\n"
+        sections.append(block)
+    return sections
+
+
+def _rest_fallback_sections(args: List[Dict], returns: Optional[str], raises: List[str]) -> List[str]:
+    """Pre-joined reST :param:/:returns:/:raises: field groups of a template docstring."""
+    sections = []
+    if args:
+        block = ""
+        for arg in args:
+            name = arg["name"]
+            block += f"\n:param {arg.get('annotation', 'TYPE')} {name}: Description of {name}."
+        sections.append(block[1:])
+    if returns:
+        sections.append(f":returns: Description of return value.\n:rtype: {returns}")
+    if raises:
+        block = ""
+        for exc in raises:
+            block += f"\n:raises {exc}: Description of when {exc} is raised."
+        sections.append(block[1:])
+    return sections
+
+
+_FALLBACK_SECTIONS = {
+    "google": _google_fallback_sections,
+    "numpy": _numpy_fallback_sections,
+    "rest": _rest_fallback_sections
+}
+
+
 def _generate_fallback_docstring(func_meta: Dict, style: str = "google") -> str:
     """
     Generate a template-based docstring in specified style (fallback method).
@@ -430,97 +869,20 @@ def _generate_fallback_docstring(func_meta: Dict, style: str = "google") -> str:
     Returns:
         str: Complete docstring
     """
-    lines = ['"""']
-    func_name = func_meta['name']
-    args = func_meta.get("args", [])
-    returns = func_meta.get("returns")
-    raises = func_meta.get("raises", [])
-    
-    # Filter out self and cls
-    filtered_args = [arg for arg in args if arg["name"] not in ("self", "cls")]
-    
-    # Summary line
-    lines.append(f"Short description of `{func_name}`.")
+    summary = f"Short description of `{func_meta['name']}`."
     
-    if filtered_args or returns or raises:
-        lines.append("")
-    
-    if style == "numpy":
-        # NumPy style
-        if filtered_args:
-            lines.append("Parameters")
-            lines.append("----------")
-            for arg in filtered_args:
-                ann = arg.get("annotation", "TYPE")
-                lines.append(f"{arg['name']} : {ann}")
-                lines.append(f"    Description of {arg['name']}.")
-                if arg != filtered_args[-1]:
-                    lines.append("")
-        
-        if returns and returns != "None":
-            if filtered_args:
-                lines.append("")
-            lines.append("Returns")
-            lines.append("-------")
-            lines.append(returns)
-            lines.append("    Description of return value.")
-        
-        # Only add Raises section if there are actual exceptions
-        if raises:
-            if filtered_args or returns:
-                lines.append("")
-            lines.append("Raises")
-            lines.append("------")
-            for exc in raises:
-                lines.append(exc)
-                lines.append(f"    Description of when {exc} is raised.")
-                if exc != raises[-1]:
-                    lines.append("")
-    
-    elif style == "rest":
-        # reST style
-        if filtered_args:
-            for arg in filtered_args:
-                ann = arg.get("annotation", "TYPE")
-                lines.append(f":param {ann} {arg['name']}: Description of {arg['name']}.")
-        
-        if returns and returns != "None":
-            if filtered_args:
-                lines.append("")
-            lines.append(f":returns: Description of return value.")
-            lines.append(f":rtype: {returns}")
-        
-        # Only add raises if there are actual exceptions
-        if raises:
-            if filtered_args or returns:
-                lines.append("")
-            for exc in raises:
-                lines.append(f":raises {exc}: Description of when {exc} is raised.")
+    # Filter out self and cls; a "None" return annotation has nothing to document
+    filtered_args = [arg for arg in func_meta.get("args", ()) if arg["name"] not in _SKIP_ARGS]
+    returns = func_meta.get("returns")
+    has_returns = bool(returns) and returns != "None"
+    raises = func_meta.get("raises")
     
-    else:
-        # Google style (default)
-        if filtered_args:
-            lines.append("Args:")
-            for arg in filtered_args:
-                arg_str = _arg_type_str(arg, "google")
-                lines.append(f"    {arg_str}: Description of {arg['name']}.")
-        
-        if returns and returns != "None":
-            if filtered_args:
-                lines.append("")
-            lines.append("Returns:")
-            lines.append(f"    {returns}: Description of return value.")
-        
-        # Only add Raises section if there are actual exceptions
-        if raises:
-            if filtered_args or returns:
-                lines.append("")
-            lines.append("Raises:")
-            for exc in raises:
-                lines.append(f"    {exc}: Description of when {exc} is raised.")
+    if not (filtered_args or has_returns or raises):
+        return f'"""\n{summary}\n"""'
     
-    lines.append('"""')
-    return "\n".join(lines)
+    build_sections = _FALLBACK_SECTIONS.get(style, _google_fallback_sections)
+    sections = "\n\n".join(build_sections(filtered_args, returns if has_returns else None, raises))
+    return f'"""\n{summary}\n\n{sections}\n"""'
 
 
 def _generate_fallback_class_docstring(class_meta: Dict, style: str = "google") -> str:
@@ -549,45 +911,40 @@ def _generate_fallback_class_docstring(class_meta: Dict, style: str = "google")
     return "\n".join(lines)
 
 
-def generate_all_styles(func_meta: Dict, use_groq: bool = True) -> Dict[str, str]:
+def generate_all_styles(func_meta: Dict, use_groq: bool = True, styles: Iterable[str] = _STYLES) -> Dict[str, str]:
     """
     Generate docstrings in all supported styles for a function.
     
     This is a convenience function that generates docstrings in Google, NumPy,
-    and reST styles all at once.
+    and reST styles all at once, in a single batched LLM round-trip.
     
     Args:
         func_meta (Dict): Function metadata dictionary
         use_groq (bool): Whether to use Groq LLM or fallback to template
+        styles (Iterable[str]): Subset of 'google', 'numpy', 'rest' to generate
         
     Returns:
-        Dict[str, str]: Dictionary with keys 'google', 'numpy', 'rest' and
-                       their corresponding docstrings
+        Dict[str, str]: Dictionary with keys 'google', 'numpy', 'rest' (or the
+                       requested styles) and their corresponding docstrings
     """
-    return {
-        "google": generate_google_docstring(func_meta, use_groq=use_groq, style="google"),
-        "numpy": generate_google_docstring(func_meta, use_groq=use_groq, style="numpy"),
-        "rest": generate_google_docstring(func_meta, use_groq=use_groq, style="rest")
-    }
+    return generate_docstrings_batch([func_meta], use_groq=use_groq, styles=styles)[0]
 
 
-def generate_all_styles_class(class_meta: Dict, use_groq: bool = True) -> Dict[str, str]:
+def generate_all_styles_class(class_meta: Dict, use_groq: bool = True,
+                              styles: Iterable[str] = _STYLES) -> Dict[str, str]:
     """
     Generate CLASS docstrings in all supported styles.
     
     This is a convenience function that generates class docstrings in Google, NumPy,
-    and reST styles all at once.
+    and reST styles all at once, in a single batched LLM round-trip.
     
     Args:
         class_meta (Dict): Class metadata dictionary
         use_groq (bool): Whether to use Groq LLM or fallback to template
+        styles (Iterable[str]): Subset of 'google', 'numpy', 'rest' to generate
         
     Returns:
-        Dict[str, str]: Dictionary with keys 'google', 'numpy', 'rest' and
-                       their corresponding class docstrings
+        Dict[str, str]: Dictionary with keys 'google', 'numpy', 'rest' (or the
+                       requested styles) and their corresponding class docstrings
     """
-    return {
-        "google": generate_class_docstring(class_meta, use_groq=use_groq, style="google"),
-        "numpy": generate_class_docstring(class_meta, use_groq=use_groq, style="numpy"),
-        "rest": generate_class_docstring(class_meta, use_groq=use_groq, style="rest")
-    }
+    return generate_docstrings_batch([class_meta], use_groq=use_groq, kind="class", styles=styles)[0]
@@ -13,15 +13,134 @@ Extracts:
 """
 
 import ast
+import hashlib
 import os
-import inspect
-from typing import Any, Dict, List, Optional
+import logging
+import re
+import sqlite3
+import sys
+import threading
+from collections import OrderedDict, deque
+from concurrent.futures import ProcessPoolExecutor
+from typing import Any, Dict, Final, FrozenSet, Iterator, List, Optional, Set, Tuple
+
+import orjson
+
+from core._paths import ensure_dir
+
+
+logger = logging.getLogger(__name__)
+
+# Persistent parse cache keyed by file mtime + size (None disables it; the CLI
+# turns it on). Disabled by default so library callers never write to disk.
+_parse_cache_dir: Optional[str] = None
+
+# Bump when the shape of parse results changes so stale cache entries are ignored
+_PARSE_CACHE_VERSION: Final = 2
+_DIGEST_SUFFIX: Final = f"-py{sys.version_info[0]}{sys.version_info[1]}-v{_PARSE_CACHE_VERSION}"
+
+# In-process LRU of encoded parse results keyed by (path, mtime_ns, size); always on
+_PARSE_MEMO_SIZE: Final = 4096
+_parse_memo: "OrderedDict[Tuple[str, int, int], bytes]" = OrderedDict()
+_parse_memo_lock = threading.Lock()
+
+# A file still to be parsed: (path, source, memo key or None, content digest or None)
+_ParseJob = Tuple[str, str, Optional[Tuple[str, int, int]], Optional[str]]
+
+# Start of a line holding something other than whitespace or a comment
+_CODE_LINE: Final = re.compile(r"(?:^|[\r\n])[ \t\f]*[^\s#]")
+
+# parse_path only starts worker processes for more cache misses than this
+_PARALLEL_MIN_FILES: Final = 8
+
+# parse_path parses cache misses in batches of this many files, each with a
+# fresh worker pool, so neither the pending sources nor the workers' memory grow
+# with the size of the scan
+_PARSE_BATCH_FILES: Final = 2000
+
+
+# isinstance()/in targets used by _simple_expr_str, built once instead of per call
+_DOTTED_NAME_TYPES: Final = (ast.Name, ast.Attribute)
+_NESTED_UNION_TYPES: Final = (ast.BinOp, ast.List)
+_REPR_CONSTANT_TYPES: Final = frozenset((str, int, bool))
+
+
+def _simple_expr_str(node: ast.AST) -> Optional[str]:
+    """
+    Render common annotation/default shapes without ast.unparse.
+    
+    Covers names, dotted names, plain constants, subscripts such as
+    Dict[str, Any] or Callable[[int], str], and X | Y unions. The result is
+    exactly what ast.unparse would produce; None means "no fast path".
+    """
+    if isinstance(node, ast.Name):
+        return node.id
+    if isinstance(node, ast.Attribute):
+        value = node.value
+        if isinstance(value, _DOTTED_NAME_TYPES):
+            base = _simple_expr_str(value)
+            if base is not None:
+                return f"{base}.{node.attr}"
+        return None
+    if isinstance(node, ast.Constant):
+        value = node.value
+        if node.kind is None and (value is None or type(value) in _REPR_CONSTANT_TYPES):
+            return repr(value)
+        if value is Ellipsis:
+            return "..."
+        return None
+    if isinstance(node, ast.Subscript):
+        value = node.value
+        if isinstance(value, _DOTTED_NAME_TYPES):
+            base = _simple_expr_str(value)
+            index = node.slice
+            if isinstance(index, ast.Tuple):
+                if len(index.elts) < 2:
+                    return None
+                inner = _simple_expr_list(index.elts)
+            else:
+                inner = _simple_expr_str(index)
+            if base is not None and inner is not None:
+                return f"{base}[{inner}]"
+        return None
+    if isinstance(node, ast.List):
+        inner = _simple_expr_list(node.elts)
+        return None if inner is None else f"[{inner}]"
+    if isinstance(node, ast.BinOp) and isinstance(node.op, ast.BitOr):
+        # Left-nested unions only: X | Y | Z, never X | (Y | Z)
+        left, right = node.left, node.right
+        if isinstance(right, _NESTED_UNION_TYPES) or isinstance(left, ast.List):
+            return None
+        left_str = _simple_expr_str(left)
+        right_str = _simple_expr_str(right)
+        if left_str is not None and right_str is not None:
+            return f"{left_str} | {right_str}"
+        return None
+    if isinstance(node, ast.UnaryOp) and isinstance(node.op, ast.USub):
+        operand = node.operand
+        if isinstance(operand, ast.Constant) and type(operand.value) is int:
+            return f"-{operand.value!r}"
+    return None
+
+
+def _simple_expr_list(nodes: List[ast.AST]) -> Optional[str]:
+    """Comma-join fast-path renderings, or None if any element has none."""
+    parts: List[str] = []
+    for elt in nodes:
+        part = _simple_expr_str(elt)
+        if part is None:
+            return None
+        parts.append(part)
+    return ", ".join(parts)
 
 
 def get_annotation_str(node: Optional[ast.AST]) -> Optional[str]:
     """Convert annotation AST node to string representation."""
     if node is None:
         return None
+    text = _simple_expr_str(node)
+    if text is not None:
+        return text
     try:
         return ast.unparse(node)
     except Exception:
@@ -32,54 +151,247 @@ def _get_default_str(node: Optional[ast.AST]) -> Optional[str]:
     """Convert default value AST node to string representation."""
     if node is None:
         return None
+    text = _simple_expr_str(node)
+    if text is not None:
+        return text
     try:
         return ast.unparse(node)
     except Exception:
         return str(node)
 
 
+# Node kinds _ModuleVisitor reacts to; every other node type is only descended into
+_KIND_BLOCK: Final = 0
+_KIND_TRY: Final = 1
+_KIND_FUNCTION: Final = 2
+_KIND_EXCEPT: Final = 3
+_KIND_BOOLOP: Final = 4
+_KIND_RAISE: Final = 5
+_KIND_IMPORT: Final = 6
+_KIND_IMPORT_FROM: Final = 7
+_NODE_KINDS: Final[Dict[type, int]] = {
+    ast.If: _KIND_BLOCK,
+    ast.For: _KIND_BLOCK,
+    ast.While: _KIND_BLOCK,
+    ast.With: _KIND_BLOCK,
+    ast.Try: _KIND_TRY,
+    ast.FunctionDef: _KIND_FUNCTION,
+    ast.ExceptHandler: _KIND_EXCEPT,
+    ast.BoolOp: _KIND_BOOLOP,
+    ast.Raise: _KIND_RAISE,
+    ast.Import: _KIND_IMPORT,
+    ast.ImportFrom: _KIND_IMPORT_FROM,
+}
+_LEAF_TYPES: Final[FrozenSet[type]] = frozenset(
+    cls for base in (ast.expr_context, ast.boolop, ast.operator, ast.unaryop, ast.cmpop)
+    for cls in base.__subclasses__()
+)
+# Expressions cannot contain statements, so outside the tracked functions
+# (where only imports and nested functions matter) their subtrees are skipped
+_OUTSIDE_FUNCTION_SKIP_TYPES: Final[FrozenSet[type]] = _LEAF_TYPES | frozenset(ast.expr.__subclasses__()) | frozenset(
+    (ast.arguments, ast.arg, ast.keyword, ast.comprehension, ast.withitem, ast.alias)
+)
+
+
+class _ModuleVisitor:
+    """
+    Collect imports and per-function metrics in a single pass over a tree.
+    
+    Metrics (complexity, nesting depth, raised exceptions) are gathered for
+    the FunctionDef nodes in `tracked` and include everything nested inside
+    them. The walk uses an explicit queue in ast.walk (breadth-first) order,
+    so imports come out in that order (each distinct import once) and deep
+    trees cannot hit the recursion limit.
+    """
+    
+    def __init__(self, tracked: Optional[Set[int]] = None):
+        self.tracked: Set[int] = tracked or set()
+        self.metrics: Dict[int, Dict[str, Any]] = {}
+        self.imports: List[str] = []
+        self._seen_imports: Set[str] = set()
+    
+    def visit(self, tree: ast.AST) -> None:
+        """Walk `tree`, recording metrics for tracked functions and all imports."""
+        self._walk(tree, track_root=False)
+    
+    def visit_function(self, node: ast.AST) -> None:
+        """Walk a single function, recording its metrics under id(node)."""
+        self._walk(node, track_root=True)
+    
+    def _walk(self, root: ast.AST, track_root: bool) -> None:
+        tracked = self.tracked
+        metrics = self.metrics
+        imports = self.imports
+        seen_imports = self._seen_imports
+        iter_child_nodes = ast.iter_child_nodes
+        found: List[Dict[str, Any]] = []
+        
+        # (node, control-flow nesting inside the current function, its metrics)
+        queue = deque([(root, 0, None)])
+        popleft = queue.popleft
+        append = queue.append
+        node_kinds = _NODE_KINDS
+        leaf_types = _LEAF_TYPES
+        outside_skip = _OUTSIDE_FUNCTION_SKIP_TYPES
+        while queue:
+            node, nesting, func = popleft()
+            kind = node_kinds.get(type(node))
+            
+            if kind is None:
+                pass
+            elif kind <= _KIND_TRY:
+                nesting += 1
+                if func is not None:
+                    if kind == _KIND_BLOCK:
+                        func["complexity"] += 1
+                    if nesting > func["nesting_depth"]:
+                        func["nesting_depth"] = nesting
+            elif kind == _KIND_FUNCTION:
+                if id(node) in tracked or (node is root and track_root):
+                    func = {"complexity": 1, "nesting_depth": 0, "raises": set()}
+                    nesting = 0
+                    metrics[id(node)] = func
+                    found.append(func)
+                    if _is_trivial_body(node.body):
+                        # Nothing in the body can count; only the signature and
+                        # decorators (defaults like `x=a or b`) still need a look
+                        for child in node.decorator_list:
+                            append((child, 0, func))
+                        append((node.args, 0, func))
+                        if node.returns is not None:
+                            append((node.returns, 0, func))
+                        continue
+            elif kind == _KIND_EXCEPT:
+                if func is not None:
+                    func["complexity"] += 1
+            elif kind == _KIND_BOOLOP:
+                if func is not None:
+                    func["complexity"] += len(node.values) - 1
+            elif kind == _KIND_RAISE:
+                exc = node.exc
+                if func is not None and exc:
+                    if isinstance(exc, ast.Call):
+                        # raise ValueError("message")
+                        if isinstance(exc.func, ast.Name):
+                            func["raises"].add(exc.func.id)
+                        elif isinstance(exc.func, ast.Attribute):
+                            func["raises"].add(exc.func.attr)
+                    elif isinstance(exc, ast.Name):
+                        # raise exc (where exc is a variable)
+                        func["raises"].add(exc.id)
+            elif kind == _KIND_IMPORT:
+                for name in node.names:
+                    if name.asname:
+                        text = f"import {name.name} as {name.asname}"
+                    else:
+                        text = f"import {name.name}"
+                    if text not in seen_imports:
+                        seen_imports.add(text)
+                        imports.append(text)
+                continue
+            else:
+                module = node.module or ""
+                for name in node.names:
+                    if name.asname:
+                        text = f"from {module} import {name.name} as {name.asname}"
+                    else:
+                        text = f"from {module} import {name.name}"
+                    if text not in seen_imports:
+                        seen_imports.add(text)
+                        imports.append(text)
+                continue
+            
+            # Contexts and operators (Load, Add, ...) never hold anything we count;
+            # outside a tracked function only statements can (imports, functions)
+            skip = leaf_types if func is not None else outside_skip
+            for child in iter_child_nodes(node):
+                if type(child) not in skip:
+                    append((child, nesting, func))
+        
+        for func in found:
+            func["raises"] = sorted(func["raises"])
+
+
+def _is_trivial_body(body: List[ast.stmt]) -> bool:
+    """
+    True if no statement in `body` can add complexity, nesting or raises.
+    
+    Covers the common one-liners: pass, a docstring, `return`, `return x`,
+    `return self.x` and `return <constant>`.
+    """
+    for stmt in body:
+        stmt_type = type(stmt)
+        if stmt_type is ast.Pass:
+            continue
+        if stmt_type is ast.Expr or stmt_type is ast.Return:
+            value = stmt.value
+            if value is None:
+                continue
+            value_type = type(value)
+            if value_type is ast.Constant or value_type is ast.Name:
+                continue
+            if value_type is ast.Attribute and type(value.value) is ast.Name:
+                continue
+        return False
+    return True
+
+
+def _scan_module(tree: ast.AST) -> _ModuleVisitor:
+    """Visit a module once, tracking its top-level functions and top-level class methods."""
+    tracked: Set[int] = set()
+    for item in getattr(tree, 'body', ()):
+        if isinstance(item, ast.FunctionDef):
+            tracked.add(id(item))
+        elif isinstance(item, ast.ClassDef):
+            for method in item.body:
+                if isinstance(method, ast.FunctionDef):
+                    tracked.add(id(method))
+    visitor = _ModuleVisitor(tracked)
+    visitor.visit(tree)
+    return visitor
+
+
+def _function_metrics(node: ast.AST) -> Dict[str, Any]:
+    """Compute complexity, nesting depth and raises for a single function node."""
+    visitor = _ModuleVisitor()
+    visitor.visit_function(node)
+    return visitor.metrics[id(node)]
+
+
 def _simple_complexity(node: ast.FunctionDef) -> int:
     """
     Calculate simple complexity estimate (heuristic).
     Counts control flow statements: if, for, while, except, with, and, or.
     """
-    complexity = 1
-    for child in ast.walk(node):
-        if isinstance(child, (ast.If, ast.For, ast.While, ast.ExceptHandler, ast.With)):
-            complexity += 1
-        elif isinstance(child, (ast.BoolOp,)):
-            if isinstance(child.op, (ast.And, ast.Or)):
-                complexity += len(child.values) - 1
-    return complexity
+    return _function_metrics(node)["complexity"]
 
 
 def _max_nesting_depth(node: ast.FunctionDef) -> int:
     """
     Calculate maximum nesting depth of control structures.
     """
-    def depth(n, current=0):
-        if isinstance(n, (ast.If, ast.For, ast.While, ast.With, ast.Try)):
-            max_child = current
-            for child in ast.iter_child_nodes(n):
-                max_child = max(max_child, depth(child, current + 1))
-            return max_child
-        else:
-            max_child = current
-            for child in ast.iter_child_nodes(n):
-                max_child = max(max_child, depth(child, current))
-            return max_child
+    return _function_metrics(node)["nesting_depth"]
+
+
+def _docstring(node: ast.AST) -> Tuple[bool, Optional[str]]:
+    """
+    Check for a docstring and extract it with a single look at the first statement.
     
-    return depth(node, 0)
+    Returns:
+        (has_docstring, docstring) where docstring is the cleaned text wrapped
+        in triple quotes, or None if there is no docstring
+    """
+    # clean=True applies inspect.cleandoc to remove indentation; an empty
+    # docstring still counts as present
+    docstring_text = ast.get_docstring(node, clean=True)
+    if docstring_text is None:
+        return False, None
+    return True, f'"""\n{docstring_text}\n"""'
 
 
 def _has_docstring(node: ast.FunctionDef) -> bool:
     """Check if a function/method has a docstring."""
-    return (
-        len(node.body) > 0 and
-        isinstance(node.body[0], ast.Expr) and
-        isinstance(node.body[0].value, ast.Constant) and
-        isinstance(node.body[0].value.value, str)
-    )
+    return ast.get_docstring(node, clean=False) is not None
 
 
 def _get_docstring(node: ast.FunctionDef) -> Optional[str]:
@@ -88,168 +400,189 @@ def _get_docstring(node: ast.FunctionDef) -> Optional[str]:
     Returns the docstring with triple quotes, or None if no docstring exists.
     Removes indentation from the extracted docstring.
     """
-    if (len(node.body) > 0 and
-        isinstance(node.body[0], ast.Expr) and
-        isinstance(node.body[0].value, ast.Constant) and
-        isinstance(node.body[0].value.value, str)):
-        
-        docstring_text = node.body[0].value.value
-        
-        # Use inspect.cleandoc to remove indentation and clean up the docstring
-        import inspect
-        cleaned_docstring = inspect.cleandoc(docstring_text)
-        
-        # Return with triple quotes
-        return f'"""\n{cleaned_docstring}\n"""'
-    return None
+    return _docstring(node)[1]
+
+
+def _function_info(item: ast.FunctionDef, metrics: Dict[str, Any]) -> Dict[str, Any]:
+    """Build the metadata dict of a top-level function."""
+    # Extract arguments with types
+    args = []
+    for arg in item.args.args:
+        arg_info = {
+            "name": arg.arg,
+            "annotation": get_annotation_str(arg.annotation)
+        }
+        args.append(arg_info)
+    
+    # Extract defaults
+    defaults = []
+    num_defaults = len(item.args.defaults)
+    num_args = len(item.args.args)
+    
+    # Map defaults to their corresponding arguments
+    for i, default in enumerate(item.args.defaults):
+        defaults.append({
+            "arg_index": num_args - num_defaults + i,
+            "value": _get_default_str(default)
+        })
+    
+    has_docstring, docstring = _docstring(item)
+    return {
+        "name": item.name,
+        "args": args,
+        "defaults": defaults,
+        "returns": get_annotation_str(item.returns),
+        "start_line": item.lineno,
+        "end_line": item.end_lineno,
+        "complexity": metrics["complexity"],
+        "nesting_depth": metrics["nesting_depth"],
+        "has_docstring": has_docstring,
+        "docstring": docstring,
+        "raises": metrics["raises"]
+    }
+
+
+def _class_info(item: ast.ClassDef, visitor: _ModuleVisitor) -> Dict[str, Any]:
+    """Build the metadata dict of a top-level class and its methods."""
+    methods = []
+
+    for method in item.body:
+        if isinstance(method, ast.FunctionDef):
+            args = []
+            for arg in method.args.args:
+                args.append({
+                    "name": arg.arg,
+                    "annotation": get_annotation_str(arg.annotation)
+                })
+
+            metrics = visitor.metrics[id(method)]
+            has_docstring, docstring = _docstring(method)
+            method_info = {
+                "name": method.name,
+                "args": args,
+                "returns": get_annotation_str(method.returns),
+                "start_line": method.lineno,
+                "end_line": method.end_lineno,
+                "complexity": metrics["complexity"],
+                "has_docstring": has_docstring,
+                "docstring": docstring,
+                "raises": metrics["raises"]
+            }
+            methods.append(method_info)
+
+    has_docstring, docstring = _docstring(item)
+    return {
+        "name": item.name,
+        "methods": methods,
+        "start_line": item.lineno,
+        "end_line": item.end_lineno or item.lineno,
+        "has_docstring": has_docstring,
+        "docstring": docstring
+    }
 
-def parse_functions(node: ast.AST) -> List[Dict[str, Any]]:
+
+def parse_functions(node: ast.AST, visitor: Optional[_ModuleVisitor] = None) -> List[Dict[str, Any]]:
     """
     Parse all top-level functions from AST node (not methods inside classes).
     Returns list of dictionaries with function metadata.
+    
+    Pass the result of _scan_module(node) as `visitor` to reuse its metrics.
     """
     functions = []
+    if visitor is None:
+        visitor = _scan_module(node)
     
     # Only get top-level functions, not methods inside classes
-    if hasattr(node, 'body'):
-        for item in node.body:
-            if isinstance(item, ast.FunctionDef):
-                # Extract arguments with types
-                args = []
-                for arg in item.args.args:
-                    arg_info = {
-                        "name": arg.arg,
-                        "annotation": get_annotation_str(arg.annotation)
-                    }
-                    args.append(arg_info)
-                
-                # Extract defaults
-                defaults = []
-                num_defaults = len(item.args.defaults)
-                num_args = len(item.args.args)
-                
-                # Map defaults to their corresponding arguments
-                for i, default in enumerate(item.args.defaults):
-                    defaults.append({
-                        "arg_index": num_args - num_defaults + i,
-                        "value": _get_default_str(default)
-                    })
-                
-                func_info = {
-                    "name": item.name,
-                    "args": args,
-                    "defaults": defaults,
-                    "returns": get_annotation_str(item.returns),
-                    "start_line": item.lineno,
-                    "end_line": item.end_lineno,
-                    "complexity": _simple_complexity(item),
-                    "nesting_depth": _max_nesting_depth(item),
-                    "has_docstring": _has_docstring(item),
-                    "docstring": _get_docstring(item),
-                    "raises": _extract_raises(item)  # NEW: Extract actual docstring
-                }
-                functions.append(func_info)
+    for item in getattr(node, 'body', ()):
+        if isinstance(item, ast.FunctionDef):
+            functions.append(_function_info(item, visitor.metrics[id(item)]))
     
     return functions
 
 
-def parse_classes(node: ast.AST) -> List[Dict[str, Any]]:
+def parse_classes(node: ast.AST, visitor: Optional[_ModuleVisitor] = None) -> List[Dict[str, Any]]:
     """
     Parse all classes and their methods from AST node.
     Returns list of dictionaries with class metadata.
+    
+    Pass the result of _scan_module(node) as `visitor` to reuse its metrics.
     """
     classes = []
+    if visitor is None:
+        visitor = _scan_module(node)
 
-    if hasattr(node, 'body'):
-        for item in node.body:
-            if isinstance(item, ast.ClassDef):
-                methods = []
-
-                for method in item.body:
-                    if isinstance(method, ast.FunctionDef):
-                        args = []
-                        for arg in method.args.args:
-                            args.append({
-                                "name": arg.arg,
-                                "annotation": get_annotation_str(arg.annotation)
-                            })
-
-                        method_info = {
-                            "name": method.name,
-                            "args": args,
-                            "returns": get_annotation_str(method.returns),
-                            "start_line": method.lineno,
-                            "end_line": method.end_lineno,
-                            "complexity": _simple_complexity(method),
-                            "has_docstring": _has_docstring(method),
-                            "docstring": _get_docstring(method),
-                            # ✅ FIX: pass method, not class
-                            "raises": _extract_raises(method)
-                        }
-                        methods.append(method_info)
-
-                class_info = {
-                    "name": item.name,
-                    "methods": methods,
-                    "start_line": item.lineno,
-                    "end_line": item.end_lineno or item.lineno,
-                    "has_docstring": _has_docstring(item),
-                    "docstring": _get_docstring(item)
-                }
-
-                classes.append(class_info)
+    for item in getattr(node, 'body', ()):
+        if isinstance(item, ast.ClassDef):
+            classes.append(_class_info(item, visitor))
 
     return classes
 
 
+def parse_tree(tree: ast.AST) -> Tuple[List[Dict[str, Any]], List[Dict[str, Any]], List[str]]:
+    """
+    Extract functions, classes and imports from a parsed module.
+    
+    Equivalent to calling parse_functions, parse_classes and parse_imports,
+    but the tree is traversed once and its top-level statements scanned once.
+    
+    Args:
+        tree: Module AST
+        
+    Returns:
+        (functions, classes, imports)
+    """
+    visitor = _scan_module(tree)
+    functions = []
+    classes = []
+    for item in getattr(tree, 'body', ()):
+        if isinstance(item, ast.FunctionDef):
+            functions.append(_function_info(item, visitor.metrics[id(item)]))
+        elif isinstance(item, ast.ClassDef):
+            classes.append(_class_info(item, visitor))
+    return functions, classes, visitor.imports
 
-def parse_imports(node: ast.AST) -> List[str]:
+
+def parse_imports(node: ast.AST, visitor: Optional[_ModuleVisitor] = None) -> List[str]:
     """
     Parse all import statements from AST node.
     Returns list of import strings.
     """
-    imports = []
-    for item in ast.walk(node):
-        if isinstance(item, ast.Import):
-            for name in item.names:
-                if name.asname:
-                    imports.append(f"import {name.name} as {name.asname}")
-                else:
-                    imports.append(f"import {name.name}")
-        elif isinstance(item, ast.ImportFrom):
-            module = item.module or ""
-            for name in item.names:
-                if name.asname:
-                    imports.append(f"from {module} import {name.name} as {name.asname}")
-                else:
-                    imports.append(f"from {module} import {name.name}")
-    
-    return imports
+    if visitor is None:
+        visitor = _ModuleVisitor()
+        visitor.visit(node)
+    return visitor.imports
 
 
-def parse_file(path: str) -> Dict[str, Any]:
-    """
-    Parse a Python file and extract metadata.
+def _is_trivial_source(source: str) -> bool:
+    """True for empty, blank or comment-only sources, which always parse to nothing."""
+    # Stops at the first line with code, usually the first character of the file
+    if _CODE_LINE.search(source):
+        return False
+    return "\0" not in source  # compile() rejects null bytes even inside comments
+
+
+def _parse_source(path: str, source: str) -> Dict[str, Any]:
+    """Run the AST extraction pipeline on source that has already been read from `path`."""
+    if _is_trivial_source(source):
+        # Typically empty __init__.py files: skip the parser entirely
+        return {
+            "file_path": path,
+            "imports": [],
+            "parsing_errors": [],
+            "functions": [],
+            "classes": []
+        }
     
-    Args:
-        path: Path to Python file
-        
-    Returns:
-        Dictionary containing file metadata including functions, classes, imports, and errors
-    """
     parsing_errors = []
     functions = []
     classes = []
     imports = []
     
     try:
-        with open(path, 'r', encoding='utf-8') as f:
-            source = f.read()
-        
-        tree = ast.parse(source, filename=path)
-        functions = parse_functions(tree)
-        classes = parse_classes(tree)
-        imports = parse_imports(tree)
+        # Same as ast.parse without its wrapper frame; type comments stay off and
+        # dont_inherit keeps this module's __future__ flags out of the parse
+        tree = compile(source, path, 'exec', ast.PyCF_ONLY_AST, dont_inherit=True)
+        functions, classes, imports = parse_tree(tree)
         
     except SyntaxError as e:
         parsing_errors.append(f"SyntaxError at line {e.lineno}: {e.msg}")
@@ -265,14 +598,288 @@ def parse_file(path: str) -> Dict[str, Any]:
     }
 
 
-def parse_path(path: str, recursive: bool = True, skip_dirs: Optional[List[str]] = None) -> List[Dict[str, Any]]:
+def _read_error(path: str, error: Exception) -> Dict[str, Any]:
+    """Result reported for a file that could not be read."""
+    return {
+        "file_path": path,
+        "imports": [],
+        "parsing_errors": [f"Error: {str(error)}"],
+        "functions": [],
+        "classes": []
+    }
+
+
+def _parse_file_uncached(path: str) -> Dict[str, Any]:
+    """Read and parse a file, bypassing every cache."""
+    try:
+        with open(path, 'r', encoding='utf-8') as f:
+            source = f.read()
+    except Exception as e:
+        return _read_error(path, e)
+    
+    return _parse_source(path, source)
+
+
+def configure_parse_cache(cache_dir: Optional[str] = None) -> None:
+    """
+    Set the directory of the persistent parse cache used by parse_path.
+    
+    Setting the PYPARSER_NO_CACHE environment variable also disables it.
+    
+    Args:
+        cache_dir (Optional[str]): Cache directory, or None to disable caching
+    """
+    global _parse_cache_dir
+    _parse_cache_dir = cache_dir
+
+
+def _parse_cache_open() -> Optional[sqlite3.Connection]:
+    """Open the parse cache database, or return None if caching is off or unavailable."""
+    if _parse_cache_dir is None or os.getenv("PYPARSER_NO_CACHE"):
+        return None
+    try:
+        ensure_dir(_parse_cache_dir)
+        conn = sqlite3.connect(os.path.join(_parse_cache_dir, "parse_cache.sqlite3"))
+        # Path index (mtime + size -> content digest) in front of results keyed by content
+        conn.execute(
+            "CREATE TABLE IF NOT EXISTS files "
+            "(path TEXT PRIMARY KEY, mtime_ns INTEGER NOT NULL, size INTEGER NOT NULL, digest TEXT NOT NULL)"
+        )
+        conn.execute("CREATE TABLE IF NOT EXISTS sources (digest TEXT PRIMARY KEY, result BLOB NOT NULL)")
+        return conn
+    except (OSError, sqlite3.Error) as e:
+        logger.warning("Parse cache unavailable: %s", e)
+        return None
+
+
+def _source_digest(source: str) -> str:
+    """Key parse results by file content, Python version (AST differences) and cache layout."""
+    return hashlib.sha256(source.encode("utf-8", "surrogatepass")).hexdigest() + _DIGEST_SUFFIX
+
+
+def _cached_result(blob: bytes, path: str) -> Dict[str, Any]:
+    """Decode a cached parse result and point it at the path being scanned."""
+    result = orjson.loads(blob)
+    result["file_path"] = path
+    return result
+
+
+def _memo_get(key: Tuple[str, int, int]) -> Optional[bytes]:
+    """Return the encoded result memoized for (path, mtime_ns, size), if any."""
+    with _parse_memo_lock:
+        blob = _parse_memo.get(key)
+        if blob is not None:
+            _parse_memo.move_to_end(key)
+        return blob
+
+
+def _memo_put(key: Tuple[str, int, int], result: Dict[str, Any]) -> None:
+    """Memoize an encoded parse result, evicting the least recently used entries."""
+    blob = orjson.dumps(result)
+    with _parse_memo_lock:
+        _parse_memo[key] = blob
+        _parse_memo.move_to_end(key)
+        while len(_parse_memo) > _PARSE_MEMO_SIZE:
+            _parse_memo.popitem(last=False)
+
+
+def clear_parse_memo() -> None:
+    """Forget every parse result memoized in this process."""
+    with _parse_memo_lock:
+        _parse_memo.clear()
+
+
+def _cache_lookup(path: str, conn: Optional[sqlite3.Connection] = None) -> Tuple[Optional[Dict[str, Any]], Optional[_ParseJob]]:
+    """
+    Look `path` up in the parse caches without parsing it.
+    
+    Lookups go from cheapest to most expensive: the in-process memo and the
+    persistent path index (both keyed by mtime and size, no file read), then
+    the persistent content cache (file read and hashed, no parse).
+    
+    Returns:
+        (result, None) when no parse is needed (a cache hit, or an unreadable
+        file), otherwise (None, job) where job is (path, source, memo_key,
+        digest) to be parsed and handed to _cache_store.
+    """
+    memo_key = None
+    if not os.getenv("PYPARSER_NO_CACHE"):
+        try:
+            stat = os.stat(path)
+        except OSError:
+            stat = None
+        if stat is not None:
+            key = os.path.abspath(path)
+            memo_key = (key, stat.st_mtime_ns, stat.st_size)
+            
+            blob = _memo_get(memo_key)
+            if blob is not None:
+                return _cached_result(blob, path), None
+            
+            if conn is not None:
+                try:
+                    row = conn.execute(
+                        "SELECT files.mtime_ns, files.size, files.digest, sources.result FROM files "
+                        "JOIN sources ON sources.digest = files.digest WHERE files.path = ?", (key,)
+                    ).fetchone()
+                    if (row is not None and row[0] == stat.st_mtime_ns and row[1] == stat.st_size
+                            and row[2].endswith(_DIGEST_SUFFIX)):
+                        result = _cached_result(row[3], path)
+                        _memo_put(memo_key, result)
+                        return result, None
+                except sqlite3.Error as e:
+                    logger.warning("Parse cache lookup failed for %s: %s", path, e)
+                    conn = None
+    
+    try:
+        with open(path, 'r', encoding='utf-8') as f:
+            source = f.read()
+    except Exception as e:
+        # Unreadable files are reported, never cached
+        return _read_error(path, e), None
+    
+    digest = None
+    if conn is not None and memo_key is not None:
+        digest = _source_digest(source)
+        try:
+            row = conn.execute("SELECT result FROM sources WHERE digest = ?", (digest,)).fetchone()
+            if row is not None:
+                result = _cached_result(row[0], path)
+                conn.execute(
+                    "INSERT OR REPLACE INTO files (path, mtime_ns, size, digest) VALUES (?, ?, ?, ?)",
+                    (*memo_key, digest)
+                )
+                _memo_put(memo_key, result)
+                return result, None
+        except sqlite3.Error as e:
+            logger.warning("Could not use parse cache for %s: %s", path, e)
+            digest = None
+    
+    return None, (path, source, memo_key, digest)
+
+
+def _cache_store(job: _ParseJob, result: Dict[str, Any], conn: Optional[sqlite3.Connection] = None) -> None:
+    """Record the result of parsing a job returned by _cache_lookup."""
+    path, _, memo_key, digest = job
+    if memo_key is None:
+        return
+    if conn is not None and digest is not None:
+        try:
+            conn.execute("INSERT OR REPLACE INTO sources (digest, result) VALUES (?, ?)", (digest, orjson.dumps(result)))
+            conn.execute(
+                "INSERT OR REPLACE INTO files (path, mtime_ns, size, digest) VALUES (?, ?, ?, ?)",
+                (*memo_key, digest)
+            )
+        except sqlite3.Error as e:
+            logger.warning("Could not write parse cache for %s: %s", path, e)
+    _memo_put(memo_key, result)
+
+
+def _parse_file_cached(path: str, conn: Optional[sqlite3.Connection] = None) -> Dict[str, Any]:
+    """Return the parse result for `path`, reusing cached results where possible."""
+    result, job = _cache_lookup(path, conn)
+    if job is None:
+        return result
+    result = _parse_source(job[0], job[1])
+    _cache_store(job, result, conn)
+    return result
+
+
+def _parse_jobs(jobs: List[_ParseJob], max_workers: Optional[int] = None) -> List[Dict[str, Any]]:
+    """
+    Parse cache misses, fanning out to worker processes when there are enough.
+    
+    Cache reads and writes stay in the calling process; workers only run
+    _parse_source. Falls back to parsing serially if no pool can be started.
+    """
+    paths = [job[0] for job in jobs]
+    sources = [job[1] for job in jobs]
+    workers = max_workers or os.cpu_count() or 1
+    if len(jobs) > _PARALLEL_MIN_FILES and workers > 1:
+        workers = min(workers, len(jobs))
+        chunksize = max(1, min(16, len(jobs) // (workers * 4)))
+        try:
+            with ProcessPoolExecutor(max_workers=workers) as executor:
+                return list(executor.map(_parse_source, paths, sources, chunksize=chunksize))
+        except (OSError, RuntimeError) as e:
+            logger.warning("Parsing serially, could not start worker processes: %s", e)
+    return [_parse_source(path, source) for path, source in zip(paths, sources)]
+
+
+def parse_file(path: str) -> Dict[str, Any]:
+    """
+    Parse a Python file and extract metadata.
+    
+    Results are memoized in-process by (path, mtime, size), so parsing an
+    unchanged file again is served from memory (see clear_parse_memo). The
+    PYPARSER_NO_CACHE environment variable turns this off as well.
+    
+    Args:
+        path: Path to Python file
+        
+    Returns:
+        Dictionary containing file metadata including functions, classes, imports, and errors
+    """
+    return _parse_file_cached(path)
+
+
+def _parse_batch(pending: List[Tuple[int, _ParseJob]], results: List[Any],
+                 conn: Optional[sqlite3.Connection], max_workers: Optional[int]) -> None:
+    """Parse a batch of cache misses, store the results and put them at their index."""
+    parsed = _parse_jobs([job for _, job in pending], max_workers)
+    for (index, job), result in zip(pending, parsed):
+        _cache_store(job, result, conn)
+        results[index] = result
+
+
+def _iter_python_files(root: str, recursive: bool, skip_dirs: FrozenSet[str]) -> Iterator[str]:
+    """
+    Yield the .py files under `root` in the order os.walk would list them.
+    
+    Uses the file types cached by os.scandir, so unlike os.walk no extra
+    lstat is needed per subdirectory. Symlinked directories are not
+    followed and unreadable directories are skipped, as with os.walk.
+    """
+    pending = [root]
+    while pending:
+        top = pending.pop()
+        try:
+            with os.scandir(top) as it:
+                entries = list(it)
+        except OSError:
+            continue
+        
+        subdirs = []
+        for entry in entries:
+            try:
+                is_dir = entry.is_dir()
+            except OSError:
+                is_dir = False
+            if is_dir:
+                if recursive and entry.name not in skip_dirs and not entry.is_symlink():
+                    subdirs.append(entry.path)
+            elif entry.name.endswith('.py'):
+                yield entry.path
+        
+        # A directory's files come before its subdirectories, depth first
+        pending.extend(reversed(subdirs))
+
+
+def parse_path(path: str, recursive: bool = True, skip_dirs: Optional[List[str]] = None,
+               max_workers: Optional[int] = None) -> List[Dict[str, Any]]:
     """
     Parse Python files in a directory path.
     
+    When a parse cache is configured (see configure_parse_cache), files whose
+    mtime and size or whose content are unchanged since an earlier scan are
+    not parsed again. Files that do need parsing are spread over worker
+    processes when there are more than a handful of them.
+    
     Args:
         path: Directory path to scan
         recursive: Whether to scan recursively
         skip_dirs: List of directory names to skip
+        max_workers: Number of parser processes (default: one per CPU; 1 parses serially)
         
     Returns:
         List of dictionaries containing metadata for each Python file
@@ -280,23 +887,33 @@ def parse_path(path: str, recursive: bool = True, skip_dirs: Optional[List[str]]
     if skip_dirs is None:
         skip_dirs = []
     
-    results = []
-    
     if os.path.isfile(path):
-        if path.endswith('.py'):
-            results.append(parse_file(path))
+        paths = [path] if path.endswith('.py') else []
     else:
-        for root, dirs, files in os.walk(path):
-            # Skip specified directories
-            dirs[:] = [d for d in dirs if d not in skip_dirs]
-            
-            for file in files:
-                if file.endswith('.py'):
-                    file_path = os.path.join(root, file)
-                    results.append(parse_file(file_path))
-            
-            if not recursive:
-                break
+        paths = list(_iter_python_files(path, recursive, frozenset(skip_dirs)))
+    
+    results: List[Any] = [None] * len(paths)
+    pending: List[Tuple[int, _ParseJob]] = []
+    conn = _parse_cache_open()
+    
+    try:
+        for index, file_path in enumerate(paths):
+            results[index], job = _cache_lookup(file_path, conn)
+            if job is not None:
+                pending.append((index, job))
+                if len(pending) >= _PARSE_BATCH_FILES:
+                    _parse_batch(pending, results, conn, max_workers)
+                    pending = []
+        
+        if pending:
+            _parse_batch(pending, results, conn, max_workers)
+    finally:
+        if conn is not None:
+            try:
+                conn.commit()
+            except sqlite3.Error as e:
+                logger.warning("Could not write parse cache: %s", e)
+            conn.close()
     
     return results
 
@@ -307,20 +924,4 @@ def _extract_raises(node: ast.FunctionDef) -> List[str]:
     Returns:
         List of exception class names that are raised
     """
-    raises = set()
-    
-    for child in ast.walk(node):
-        if isinstance(child, ast.Raise):
-            if child.exc:
-                # Handle different raise patterns
-                if isinstance(child.exc, ast.Call):
-                    # raise ValueError("message")
-                    if isinstance(child.exc.func, ast.Name):
-                        raises.add(child.exc.func.id)
-                    elif isinstance(child.exc.func, ast.Attribute):
-                        raises.add(child.exc.func.attr)
-                elif isinstance(child.exc, ast.Name):
-                    # raise exc (where exc is a variable)
-                    raises.add(child.exc.id)
-    
-    return sorted(list(raises))
\ No newline at end of file
+    return _function_metrics(node)["raises"]
@@ -4,9 +4,28 @@ Compute docstring coverage and write report to JSON.
 Coverage is now based on successfully parsed functions, not just documented ones.
 """
 
-import json
 from typing import List, Dict, Any
 
+import orjson
+
+# Report items are encoded one at a time; a large buffer coalesces them into few write() calls
+_WRITE_BUFFER_SIZE = 128 * 1024
+
+
+def _percentage(part: int, total: int) -> float:
+    """
+    Return part / total as a percentage with 2 decimals, using integer math.
+    
+    Rounds the exact ratio half to even in hundredths of a percent, which
+    avoids both round() and the float error of (part / total) * 100.
+    """
+    if total <= 0:
+        return 0.0
+    hundredths, remainder = divmod(part * 10000, total)
+    if remainder * 2 > total or (remainder * 2 == total and hundredths % 2):
+        hundredths += 1
+    return hundredths / 100
+
 
 def compute_coverage(per_file_results: List[Dict[str, Any]]) -> Dict[str, Any]:
     """
@@ -26,60 +45,72 @@ def compute_coverage(per_file_results: List[Dict[str, Any]]) -> Dict[str, Any]:
     file_stats = []
     
     for file_result in per_file_results:
-        file_path = file_result.get("file_path", "unknown")
-        functions = file_result.get("functions", [])
-        classes = file_result.get("classes", [])
         parsing_errors = file_result.get("parsing_errors", [])
         
         # Count functions (including methods in classes)
-        file_funcs = len(functions)
-        file_methods = 0
-        
-        for cls in classes:
-            methods = cls.get("methods", [])
-            file_methods += len(methods)
-        
-        file_total = file_funcs + file_methods
+        file_total = len(file_result.get("functions", []))
+        for cls in file_result.get("classes", []):
+            file_total += len(cls.get("methods", []))
         
-        # If there are parsing errors, consider none successfully parsed
+        # If there are parsing errors, consider none successfully parsed, so
+        # a file's coverage is always 0% or 100% and needs no division
         if parsing_errors:
             file_parsed = 0
+            file_coverage = 0.0
             total_parsing_errors += len(parsing_errors)
         else:
             file_parsed = file_total
+            file_coverage = 100.0 if file_total else 0.0
         
         total_functions += file_total
         successfully_parsed_functions += file_parsed
         
-        file_coverage = 0.0
-        if file_total > 0:
-            file_coverage = (file_parsed / file_total) * 100
-        
         file_stats.append({
-            "file_path": file_path,
+            "file_path": file_result.get("file_path", "unknown"),
             "total_functions": file_total,
             "parsed_functions": file_parsed,
             "parsing_errors": len(parsing_errors),
-            "coverage_percentage": round(file_coverage, 2)
+            "coverage_percentage": file_coverage
         })
     
-    overall_coverage = 0.0
-    if total_functions > 0:
-        overall_coverage = (successfully_parsed_functions / total_functions) * 100
+    overall_coverage = _percentage(successfully_parsed_functions, total_functions)
     
     return {
         "total_functions": total_functions,
         "successfully_parsed": successfully_parsed_functions,
         "total_parsing_errors": total_parsing_errors,
-        "overall_coverage_percentage": round(overall_coverage, 2),
+        "overall_coverage_percentage": overall_coverage,
         "files": file_stats
     }
 
 
+def _dumps_indented(value: Any, level: int) -> bytes:
+    """Encode a value with 2-space indentation, nested `level` levels deep."""
+    # orjson escapes newlines inside strings, so every raw newline is structural
+    return orjson.dumps(value, option=orjson.OPT_INDENT_2).replace(b"\n", b"\n" + b"  " * level)
+
+
+def dumps_report(report: Dict[str, Any]) -> bytes:
+    """
+    Encode a report as 2-space indented JSON, e.g. for a download button.
+    
+    Args:
+        report (Dict[str, Any]): Report dictionary
+        
+    Returns:
+        bytes: UTF-8 encoded JSON
+    """
+    return orjson.dumps(report, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS)
+
+
 def write_report(report: Dict[str, Any], path: str) -> None:
     """
     Write coverage report to JSON file.
     
+    The report is streamed to disk one top-level list item at a time with
+    orjson, so large `parsed_results` never have to be encoded into a single
+    in-memory string. The output is identical to a 2-space indented dump.
+    
     Args:
         report (Dict[str, Any]): Coverage report dictionary
         path (str): Output file path
@@ -87,5 +118,21 @@ def write_report(report: Dict[str, Any], path: str) -> None:
     Returns:
         None
     """
-    with open(path, 'w', encoding='utf-8') as f:
-        json.dump(report, f, indent=2, ensure_ascii=False)
\ No newline at end of file
+    with open(path, 'wb', buffering=_WRITE_BUFFER_SIZE) as f:
+        if not report:
+            f.write(b"{}")
+            return
+        
+        f.write(b"{")
+        for i, (key, value) in enumerate(report.items()):
+            f.write(b",\n  " if i else b"\n  ")
+            f.write(orjson.dumps(key) + b": ")
+            if isinstance(value, list) and value:
+                f.write(b"[")
+                for j, item in enumerate(value):
+                    f.write(b",\n    " if j else b"\n    ")
+                    f.write(_dumps_indented(item, 2))
+                f.write(b"\n  ]")
+            else:
+                f.write(_dumps_indented(value, 1))
+        f.write(b"\n}")
@@ -0,0 +1,153 @@
+"""
+Summarize pytest-json-report output for the dashboard.
+
+The raw report holds one entry per test, but the dashboard only needs the
+summary and per-file tallies. `split_report` moves the test list into a
+sidecar file and stores the tallies in the main report, so loading it stays
+cheap however large the suite grows. `record_run` keeps those tallies in a
+small SQLite history so earlier runs can be compared without their reports.
+"""
+
+import hashlib
+import logging
+import os
+import sqlite3
+import time
+from collections import Counter
+from typing import Any, Dict, List
+
+import orjson
+
+from core._paths import ensure_parent_dir
+
+
+logger = logging.getLogger(__name__)
+
+
+def raw_tests_path(json_path: str) -> str:
+    """
+    Return the path of the file holding a split report's raw test list.
+
+    Args:
+        json_path (str): Path of the main report, e.g. pytest_results.json
+
+    Returns:
+        str: Sidecar path, e.g. pytest_results_tests.json
+    """
+    root, ext = os.path.splitext(json_path)
+    return f"{root}_tests{ext or '.json'}"
+
+
+def tally_by_file(tests: List[Dict[str, Any]]) -> Dict[str, Dict[str, int]]:
+    """
+    Count test outcomes per test file.
+
+    Args:
+        tests (List[Dict[str, Any]]): The report's `tests` entries
+
+    Returns:
+        Dict[str, Dict[str, int]]: passed/failed/skipped/total (plus any other
+        outcome seen) keyed by file name, in first-seen order
+    """
+    # Count (file, outcome) pairs in one C-level pass, then fold the pairs
+    # into per-file tallies.
+    pair_counts = Counter(
+        (test.get('nodeid', '').partition('::')[0].rsplit('/', 1)[-1], test.get('outcome', 'unknown'))
+        for test in tests
+    )
+    results_by_file = {}
+    for (file_name, outcome), count in pair_counts.items():
+        if file_name not in results_by_file:
+            results_by_file[file_name] = {
+                'passed': 0,
+                'failed': 0,
+                'skipped': 0,
+                'total': 0
+            }
+
+        results_by_file[file_name][outcome] = results_by_file[file_name].get(outcome, 0) + count
+        results_by_file[file_name]['total'] += count
+
+    return results_by_file
+
+
+def _write_atomic(data: Dict[str, Any], path: str) -> None:
+    """Write JSON to `<path>.partial` and move it into place."""
+    partial_path = path + ".partial"
+    with open(partial_path, 'wb') as f:
+        f.write(orjson.dumps(data, option=orjson.OPT_INDENT_2))
+    os.replace(partial_path, path)
+
+
+def split_report(json_path: str) -> None:
+    """
+    Move a report's test list into its sidecar and store per-file tallies.
+
+    Reports that are already split are left untouched, and tallies already
+    stored by the test suite's report hook are kept. The sidecar is written
+    first, so an interrupted split never loses the test list.
+
+    Args:
+        json_path (str): Path of the pytest-json-report output
+
+    Returns:
+        None
+    """
+    with open(json_path, 'rb') as f:
+        data = orjson.loads(f.read())
+    if 'tests' not in data:
+        return
+
+    tests = data.pop('tests')
+    if 'by_file' not in data:
+        data['by_file'] = tally_by_file(tests)
+    _write_atomic(tests, raw_tests_path(json_path))
+    _write_atomic(data, json_path)
+
+
+def record_run(json_path: str, history_path: str, max_runs: int = 200) -> None:
+    """
+    Add a report's summary and per-file tallies to the run history.
+
+    Runs are keyed by the SHA-256 of the report file, so recording the same
+    report twice keeps a single row. Only the newest `max_runs` runs are kept.
+    History is best effort: database errors are logged, not raised.
+
+    Args:
+        json_path (str): Path of the pytest-json-report output
+        history_path (str): SQLite database holding the history
+        max_runs (int): Number of runs to keep
+
+    Returns:
+        None
+    """
+    with open(json_path, 'rb') as f:
+        raw = f.read()
+    data = orjson.loads(raw)
+    by_file = data.get('by_file')
+    if by_file is None:
+        by_file = tally_by_file(data.get('tests', []))
+    results = orjson.dumps({'summary': data.get('summary', {}), 'by_file': by_file})
+
+    try:
+        ensure_parent_dir(history_path)
+        conn = sqlite3.connect(history_path)
+        try:
+            with conn:
+                conn.execute(
+                    "CREATE TABLE IF NOT EXISTS runs "
+                    "(digest TEXT PRIMARY KEY, created REAL NOT NULL, results BLOB NOT NULL)"
+                )
+                conn.execute(
+                    "INSERT OR IGNORE INTO runs (digest, created, results) VALUES (?, ?, ?)",
+                    (hashlib.sha256(raw).hexdigest(), data.get('created', time.time()), results)
+                )
+                conn.execute(
+                    "DELETE FROM runs WHERE digest NOT IN "
+                    "(SELECT digest FROM runs ORDER BY created DESC LIMIT ?)",
+                    (max_runs,)
+                )
+        finally:
+            conn.close()
+    except (OSError, sqlite3.Error) as e:
+        logger.warning("Could not record test run history: %s", e)
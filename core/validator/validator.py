@@ -5,8 +5,155 @@ Enhanced PEP 257 docstring convention validator.
 Checks Python code for docstring compliance and style violations.
 """
 
+import functools
+import hashlib
+import itertools
+import logging
+import os
 import re
-from typing import Dict, List, Tuple, Any
+import sqlite3
+from typing import Dict, Final, Iterable, List, Tuple, Any, Optional
+
+import orjson
+
+from core._paths import ensure_dir
+
+
+logger = logging.getLogger(__name__)
+
+# Persistent cache of violations keyed by file content and parsed data (None
+# disables it). Disabled by default so library callers never write to disk.
+_validation_cache_dir: Optional[str] = None
+
+# Bump whenever a check changes so violations cached by older code are ignored
+_VALIDATION_CACHE_VERSION: Final = 1
+
+# Prefixes and suffixes the checks test for (str.startswith/endswith take a tuple)
+_TRIPLE_QUOTES: Final = ('"""', "'''")
+_CLOSING_QUOTES_ON_OWN_LINE: Final = ('\n"""', "\n'''")
+_SENTENCE_ENDINGS: Final = ('.', '!', '?')
+_DEF_OR_CLASS: Final = ('def ', 'class ')
+
+# Lines that may precede a module docstring: blank lines and comments
+_HEADER_LINE: Final = re.compile(r"\s*(?:#.*)?")
+
+# Messages of the checks made by _analyze_docstring; the caller appends the location
+_FORMAT_MESSAGES: Final = {
+    "D300": "Use triple double quotes for docstrings",
+    "D209": "Multi-line docstring closing quotes should be on separate line",
+    "D205": "1 blank line required between summary and description",
+    "D400": "First line should end with a period",
+    "D402": "First line should not be the function's signature",
+}
+
+
+def configure_validation_cache(cache_dir: Optional[str] = None) -> None:
+    """
+    Set the directory of the persistent validation cache.
+    
+    Args:
+        cache_dir (Optional[str]): Cache directory, or None to disable caching
+    """
+    global _validation_cache_dir
+    _validation_cache_dir = cache_dir
+
+
+def _validation_cache_open() -> Optional[sqlite3.Connection]:
+    """Open the validation cache database, or return None if caching is off or unavailable."""
+    if _validation_cache_dir is None:
+        return None
+    try:
+        ensure_dir(_validation_cache_dir)
+        conn = sqlite3.connect(os.path.join(_validation_cache_dir, "validation_cache.sqlite3"))
+        conn.execute("CREATE TABLE IF NOT EXISTS results (digest TEXT PRIMARY KEY, violations BLOB NOT NULL)")
+        return conn
+    except (OSError, sqlite3.Error) as e:
+        logger.warning("Validation cache unavailable: %s", e)
+        return None
+
+
+def _validation_digest(file_data: Dict[str, Any], source_code: Optional[str]) -> Optional[str]:
+    """
+    Key violations by the parsed file data, the source text and the validator version.
+    
+    Returns None when the file data can't be serialized (it is then not cached).
+    """
+    try:
+        data = orjson.dumps(file_data, option=orjson.OPT_SORT_KEYS)
+    except orjson.JSONEncodeError:
+        return None
+    digest = hashlib.sha256(data)
+    if source_code is not None:
+        digest.update(b"\0")
+        digest.update(source_code.encode("utf-8", "surrogatepass"))
+    return f"{digest.hexdigest()}-v{_VALIDATION_CACHE_VERSION}"
+
+
+def _read_source(file_path: str) -> Optional[str]:
+    """Return the text of `file_path`, or None if it can't be read."""
+    try:
+        with open(file_path, 'r', encoding='utf-8') as f:
+            return f.read()
+    except Exception:
+        return None
+
+
+@functools.lru_cache(maxsize=16384)
+def _analyze_docstring(docstring: str, is_function: bool) -> Tuple[Tuple[str, int], ...]:
+    """
+    Run the format checks that only depend on the docstring text.
+    
+    Cached, since stubs and copied templates repeat the same docstring many
+    times across a project.
+    
+    Returns:
+        (code, line offset from the definition) for each violation, in report order
+    """
+    found = []
+    
+    # Remove the opening triple quotes and the matching closing ones (not every
+    # quote character at either end, which str.strip('"""') would do)
+    doc_content = docstring
+    if doc_content.startswith(_TRIPLE_QUOTES):
+        quotes = doc_content[:3]
+        doc_content = doc_content[3:]
+        if doc_content.endswith(quotes):
+            doc_content = doc_content[:-3]
+    doc_content = doc_content.strip()
+    # Only the first two lines are looked at, and whether there is a third
+    lines = doc_content.split('\n', 2)
+    
+    # D300: Check for triple double quotes (only leading whitespace matters)
+    if not docstring.lstrip().startswith('"""'):
+        found.append(("D300", 0))
+    
+    # A one-liner has a single non-blank line. The text is stripped, so its
+    # first and last lines are never blank: that means "no newline at all"
+    # (which also rules out D200, a one-liner spread over several lines)
+    is_one_liner = bool(doc_content) and '\n' not in doc_content
+    
+    if not is_one_liner:
+        # D209: Multi-line closing quotes on separate line
+        if not docstring.rstrip().endswith(_CLOSING_QUOTES_ON_OWN_LINE):
+            found.append(("D209", 0))
+        
+        # D205: Blank line between summary and description
+        if len(lines) > 2:
+            if lines[1] and not lines[1].isspace():
+                found.append(("D205", 1))
+    
+    # D400: First line should end with period
+    # split() always returns a first line, and it has no leading whitespace
+    # since doc_content is stripped
+    first_line = lines[0].rstrip()
+    if first_line and not first_line.endswith(_SENTENCE_ENDINGS):
+        found.append(("D400", 0))
+    
+    # D402: First line should not be function signature
+    if is_function and first_line and '(' in first_line and ')' in first_line:
+        found.append(("D402", 0))
+    
+    return tuple(found)
 
 
 class PEP257Validator:
@@ -37,9 +184,16 @@ class PEP257Validator:
     D401 = "First line should be in imperative mood"
     D402 = "First line should not be the function's signature"
     
+    __slots__ = ("violations", "_source_code", "_source_path", "_source_lines")
+    
     def __init__(self):
         """Initialize the PEP 257 validator."""
         self.violations = []
+        # Source of the file being validated: given, or read from _source_path
+        # and split into lines the first time a check needs it
+        self._source_code = None
+        self._source_path = None
+        self._source_lines = None
     
     def validate_file(self, file_data: Dict[str, Any], source_code: str = None) -> List[Dict[str, Any]]:
         """
@@ -52,50 +206,108 @@ class PEP257Validator:
         Returns:
             List of violation dictionaries with code, line, message
         """
-        self.violations = []
+        conn = _validation_cache_open()
+        try:
+            return self._validate_file_cached(file_data, source_code, conn)
+        finally:
+            if conn is not None:
+                try:
+                    conn.commit()
+                except sqlite3.Error as e:
+                    logger.warning("Could not write validation cache: %s", e)
+                conn.close()
+    
+    def _validate_file_cached(self, file_data: Dict[str, Any], source_code: Optional[str],
+                              conn: Optional[sqlite3.Connection] = None) -> List[Dict[str, Any]]:
+        """Validate a file, reusing the violations cached for identical content."""
         file_path = file_data.get("file_path", "")
         
-        # Load source code if available
-        if source_code is None and file_path:
+        # The cache key covers the source, so it can't wait for a check to load it
+        if conn is not None and source_code is None and file_path:
+            source_code = _read_source(file_path)
+        
+        digest = _validation_digest(file_data, source_code) if conn is not None else None
+        if digest is not None:
+            try:
+                row = conn.execute("SELECT violations FROM results WHERE digest = ?", (digest,)).fetchone()
+            except sqlite3.Error as e:
+                logger.warning("Could not read validation cache for %s: %s", file_path, e)
+                row = None
+            if row is not None:
+                # Decoding gives every violation its own copy of the path (the
+                # key covers file_data, so they are all equal to file_path):
+                # share the one string instead
+                self.violations = orjson.loads(row[0])
+                for violation in self.violations:
+                    violation["file"] = file_path
+                return self.violations
+        
+        self._validate_source(file_data, source_code)
+        
+        if digest is not None:
             try:
-                with open(file_path, 'r', encoding='utf-8') as f:
-                    source_code = f.read()
-            except Exception:
-                source_code = None
+                conn.execute(
+                    "INSERT OR REPLACE INTO results (digest, violations) VALUES (?, ?)",
+                    (digest, orjson.dumps(self.violations))
+                )
+            except sqlite3.Error as e:
+                logger.warning("Could not write validation cache for %s: %s", file_path, e)
+        return self.violations
+    
+    def _validate_source(self, file_data: Dict[str, Any], source_code: Optional[str]) -> List[Dict[str, Any]]:
+        """
+        Run every check on a file.
         
-        source_lines = source_code.split('\n') if source_code else []
+        Only documented public functions look at the source (D201, D202), so
+        when `source_code` is None the file is read on first use, not upfront.
+        """
+        self.violations = []
+        file_path = file_data.get("file_path", "")
+        self._source_code = source_code
+        self._source_path = file_path if source_code is None else None
+        self._source_lines = None
         
         # Check module-level docstring (D100)
-        #module_has_docstring = self._check_module_docstring(file_data, source_lines)
+        #module_has_docstring = self._check_module_docstring(file_data, self._get_source_lines())
         
         # Check functions (D103, D2xx, D3xx, D4xx)
         for func in file_data.get("functions", []):
-            self._validate_function(func, file_path, source_lines, is_method=False)
+            self._validate_function(func, file_path, is_method=False)
         
         # Check classes and methods (D101, D102, D2xx, D3xx, D4xx)
         for cls in file_data.get("classes", []):
-            self._validate_class(cls, file_path, source_lines)
+            self._validate_class(cls, file_path)
         
+        self._source_code = self._source_lines = None
         return self.violations
     
+    def _get_source_lines(self) -> List[str]:
+        """
+        Return the lines of the file being validated, reading it on first use.
+        
+        One split('\n') is kept over a table of newline offsets: building the
+        table with re.finditer costs more than the split, and splitlines()
+        would also break at \r, \f and other separators and shift line numbers.
+        """
+        if self._source_lines is None:
+            source_code = self._source_code
+            if source_code is None and self._source_path:
+                source_code = _read_source(self._source_path)
+            self._source_lines = source_code.split('\n') if source_code else []
+        return self._source_lines
+    
     def _check_module_docstring(self, file_data: Dict, source_lines: List[str]) -> bool:
         """Check if module has a docstring at the top."""
         if not source_lines:
             return False
         
         # Skip shebang and encoding declarations
-        start_line = 0
-        for i, line in enumerate(source_lines[:10]):
-            stripped = line.strip()
-            if stripped.startswith('#') or stripped == '':
-                start_line = i + 1
-            else:
-                break
+        start_line = sum(1 for _ in itertools.takewhile(_HEADER_LINE.fullmatch, source_lines[:10]))
         
         # Check if first non-comment line is a docstring
         if start_line < len(source_lines):
             line = source_lines[start_line].strip()
-            if not (line.startswith('"""') or line.startswith("'''")):
+            if not line.startswith(_TRIPLE_QUOTES):
                 self.violations.append({
                     "code": "D100",
                     "line": 1,
@@ -106,22 +318,25 @@ class PEP257Validator:
         
         return True
     
-    def _validate_function(self, func: Dict, file_path: str, source_lines: List[str], 
+    def _validate_function(self, func: Dict, file_path: str,
                           is_method: bool = False, class_name: str = None):
         """Validate a function or method for PEP 257 compliance."""
         func_name = func.get("name", "")
+        
+        # Skip private functions/methods (starting with _) before reading anything else
+        if func_name.startswith("_") and not func_name.startswith("__"):
+            return
+        
         start_line = func.get("start_line", 0)
         has_docstring = func.get("has_docstring", False)
         docstring = func.get("docstring", "")
         
-        # Skip private functions/methods (starting with _)
-        if func_name.startswith("_") and not func_name.startswith("__"):
-            return
+        # Every message names the definition the same way, so build it once
+        location = f"{class_name}.{func_name}" if class_name else func_name
         
         # D102 or D103: Missing docstring
         if not has_docstring:
             code = "D102" if is_method else "D103"
-            location = f"{class_name}.{func_name}" if class_name else func_name
             message = f"{code}: Missing docstring in public {'method' if is_method else 'function'} {location}"
             self.violations.append({
                 "code": code,
@@ -132,18 +347,19 @@ class PEP257Validator:
             return
         
         # Check blank lines before docstring (D201)
+        source_lines = self._get_source_lines()
         if source_lines and start_line > 0 and start_line < len(source_lines):
             # Find the line with the function definition
             func_def_line = start_line - 1  # 0-indexed
             
             # Check if there's a blank line between function def and docstring
             if func_def_line + 1 < len(source_lines):
-                next_line = source_lines[func_def_line + 1].strip()
-                # If next line after def is blank (not the docstring start)
-                if next_line == '' and func_def_line + 2 < len(source_lines):
-                    following_line = source_lines[func_def_line + 2].strip()
-                    if following_line.startswith('"""') or following_line.startswith("'''"):
-                        location = f"{class_name}.{func_name}" if class_name else func_name
+                next_line = source_lines[func_def_line + 1]
+                # If next line after def is blank (not the docstring start);
+                # isspace() tests that without building a stripped copy
+                if (not next_line or next_line.isspace()) and func_def_line + 2 < len(source_lines):
+                    following_line = source_lines[func_def_line + 2].lstrip()
+                    if following_line.startswith(_TRIPLE_QUOTES):
                         self.violations.append({
                             "code": "D201",
                             "line": func_def_line + 2,
@@ -154,20 +370,20 @@ class PEP257Validator:
         # Validate docstring content and check for blank lines after (D202)
         if docstring:
             self._validate_docstring_format(docstring, start_line, file_path, source_lines, 
-                                           func_name, is_function=True, class_name=class_name,
-                                           func_obj=func)
+                                           location, is_function=True, func_obj=func)
     
-    def _validate_class(self, cls: Dict, file_path: str, source_lines: List[str]):
+    def _validate_class(self, cls: Dict, file_path: str):
         """Validate a class for PEP 257 compliance."""
         class_name = cls.get("name", "")
-        start_line = cls.get("start_line", 0)
-        has_docstring = cls.get("has_docstring", False)
-        docstring = cls.get("docstring", "")
         
         # Skip private classes
         if class_name.startswith("_"):
             return
         
+        start_line = cls.get("start_line", 0)
+        has_docstring = cls.get("has_docstring", False)
+        docstring = cls.get("docstring", "")
+        
         # D101: Missing class docstring
         if not has_docstring:
             self.violations.append({
@@ -179,100 +395,39 @@ class PEP257Validator:
         else:
             # Validate class docstring format
             if docstring:
-                self._validate_docstring_format(docstring, start_line, file_path, source_lines,
+                self._validate_docstring_format(docstring, start_line, file_path, None,
                                                class_name, is_function=False)
         
         # Validate methods
         for method in cls.get("methods", []):
-            self._validate_function(method, file_path, source_lines, 
-                                   is_method=True, class_name=class_name)
+            self._validate_function(method, file_path, is_method=True, class_name=class_name)
     
     def _validate_docstring_format(self, docstring: str, start_line: int, file_path: str,
-                                   source_lines: List[str], name: str, is_function: bool = True,
-                                   class_name: str = None, func_obj: Dict = None):
-        """Validate docstring format against PEP 257 rules."""
-        if not docstring:
-            return
-        
-        # Remove triple quotes for analysis
-        doc_content = docstring.strip('"""').strip("'''").strip()
-        lines = doc_content.split('\n')
-        
-        # D300: Check for triple double quotes
-        if not docstring.strip().startswith('"""'):
-            location = f"{class_name}.{name}" if class_name else name
-            self.violations.append({
-                "code": "D300",
-                "line": start_line,
-                "message": f"D300: Use triple double quotes for docstrings in {location}",
-                "file": file_path
-            })
-        
-        # Check if it's a one-line or multi-line docstring
-        is_one_liner = len([l for l in lines if l.strip()]) == 1
-        
-        if is_one_liner:
-            # D200: One-line docstring should fit on one line
-            if '\n' in doc_content.strip():
-                location = f"{class_name}.{name}" if class_name else name
-                self.violations.append({
-                    "code": "D200",
-                    "line": start_line,
-                    "message": f"D200: One-line docstring should fit on one line in {location}",
-                    "file": file_path
-                })
-        else:
-            # D209: Multi-line closing quotes on separate line
-            if not docstring.rstrip().endswith('\n"""') and not docstring.rstrip().endswith("\n'''"):
-                location = f"{class_name}.{name}" if class_name else name
-                self.violations.append({
-                    "code": "D209",
-                    "line": start_line,
-                    "message": f"D209: Multi-line docstring closing quotes should be on separate line in {location}",
-                    "file": file_path
-                })
-            
-            # D205: Blank line between summary and description
-            if len(lines) > 2:
-                if lines[1].strip() != '':
-                    location = f"{class_name}.{name}" if class_name else name
-                    self.violations.append({
-                        "code": "D205",
-                        "line": start_line + 1,
-                        "message": f"D205: 1 blank line required between summary and description in {location}",
-                        "file": file_path
-                    })
-        
-        # D400: First line should end with period
-        first_line = lines[0].strip() if lines else ""
-        if first_line and not first_line.endswith(('.', '!', '?')):
-            location = f"{class_name}.{name}" if class_name else name
-            self.violations.append({
-                "code": "D400",
-                "line": start_line,
-                "message": f"D400: First line should end with a period in {location}",
-                "file": file_path
-            })
+                                   source_lines: Optional[List[str]], location: str, is_function: bool = True,
+                                   func_obj: Dict = None):
+        """
+        Validate docstring format against PEP 257 rules.
         
-        # D402: First line should not be function signature
-        if is_function and first_line and '(' in first_line and ')' in first_line:
-            location = f"{class_name}.{name}" if class_name else name
-            self.violations.append({
-                "code": "D402",
-                "line": start_line,
-                "message": f"D402: First line should not be the function's signature in {location}",
+        `location` names the definition in messages ("Class.method" or "name").
+        Callers only call this for a non-empty docstring.
+        """
+        append = self.violations.append
+        for code, line_offset in _analyze_docstring(docstring, is_function):
+            append({
+                "code": code,
+                "line": start_line + line_offset,
+                "message": f"{code}: {_FORMAT_MESSAGES[code]} in {location}",
                 "file": file_path
             })
         
         # D202: Check for blank lines AFTER docstring in source
         if source_lines and func_obj and is_function:
             self._check_blank_lines_after_docstring(
-                source_lines, start_line, docstring, name, class_name, file_path
+                source_lines, start_line, docstring.count('\n') + 1, location, file_path
             )
     
     def _check_blank_lines_after_docstring(self, source_lines: List[str], start_line: int,
-                                           docstring: str, func_name: str, class_name: str,
-                                           file_path: str):
+                                           docstring_line_count: int, location: str, file_path: str):
         """Check for blank lines after function docstring (D202)."""
         if not source_lines or start_line < 1:
             return
@@ -284,25 +439,22 @@ class PEP257Validator:
         # Find where docstring starts (usually next line after def)
         docstring_start_idx = func_def_idx + 1
         
-        # Count how many lines the docstring spans
-        docstring_lines = docstring.split('\n')
-        docstring_line_count = len(docstring_lines)
-        
         # Docstring ends at this index
         docstring_end_idx = docstring_start_idx + docstring_line_count - 1
         
         # Check the line immediately after docstring
         if docstring_end_idx + 1 < len(source_lines):
-            line_after_doc = source_lines[docstring_end_idx + 1].strip()
+            line_after_doc = source_lines[docstring_end_idx + 1]
             
             # If there's a blank line after docstring
-            if line_after_doc == '':
+            if not line_after_doc or line_after_doc.isspace():
                 # Check if it's truly a blank line (not just end of function)
                 if docstring_end_idx + 2 < len(source_lines):
+                    # A full strip(), not lstrip(): "def" followed only by
+                    # whitespace must not count as a definition
                     next_next_line = source_lines[docstring_end_idx + 2].strip()
                     # If there's actual code after the blank line, it's a violation
-                    if next_next_line != '' and not next_next_line.startswith('def ') and not next_next_line.startswith('class '):
-                        location = f"{class_name}.{func_name}" if class_name else func_name
+                    if next_next_line != '' and not next_next_line.startswith(_DEF_OR_CLASS):
                         self.violations.append({
                             "code": "D202",
                             "line": docstring_end_idx + 2,  # Report the line number (1-indexed)
@@ -311,49 +463,67 @@ class PEP257Validator:
                         })
 
 
-def validate_project(scan_results: List[Dict[str, Any]]) -> Dict[str, Any]:
+def _public_counts(items: List[Dict[str, Any]]) -> Tuple[int, int]:
+    """Return how many parsed functions or classes are public, and how many of those have a docstring."""
+    public = 0
+    documented = 0
+    for item in items:
+        if not item.get("name", "").startswith("_"):
+            public += 1
+            if item.get("has_docstring", False):
+                documented += 1
+    return public, documented
+
+
+def validate_project(scan_results: Iterable[Dict[str, Any]]) -> Dict[str, Any]:
     """
     Validate entire project for PEP 257 compliance.
     
     Args:
-        scan_results: List of parsed file data from python_parser
+        scan_results: Parsed file data from python_parser; iterated once, so a
+            generator can stream files without holding them all in memory
         
     Returns:
         Dictionary with validation report including violations and metrics
     """
     validator = PEP257Validator()
     all_violations = []
-    
-    for file_data in scan_results:
-        violations = validator.validate_file(file_data)
-        all_violations.extend(violations)
-    
-    # Compute metrics
     total_functions = 0
     total_classes = 0
     compliant_functions = 0
     compliant_classes = 0
     
-    for file_data in scan_results:
-        funcs = file_data.get("functions", [])
-        classes = file_data.get("classes", [])
-        
-        # Count public functions
-        public_funcs = [f for f in funcs if not f.get("name", "").startswith("_")]
-        total_functions += len(public_funcs)
-        compliant_functions += len([f for f in public_funcs if f.get("has_docstring", False)])
-        
-        # Count public classes
-        public_classes = [c for c in classes if not c.get("name", "").startswith("_")]
-        total_classes += len(public_classes)
-        compliant_classes += len([c for c in public_classes if c.get("has_docstring", False)])
-        
-        # Count public methods
-        for cls in classes:
-            methods = cls.get("methods", [])
-            public_methods = [m for m in methods if not m.get("name", "").startswith("_")]
-            total_functions += len(public_methods)
-            compliant_functions += len([m for m in public_methods if m.get("has_docstring", False)])
+    # Files are validated in this process: checking a parse result is cheaper
+    # than pickling it to a worker, unlike parsing (see parse_path)
+    conn = _validation_cache_open()
+    try:
+        for file_data in scan_results:
+            violations = validator._validate_file_cached(file_data, None, conn)
+            all_violations.extend(violations)
+            
+            # Count public functions
+            public, documented = _public_counts(file_data.get("functions", []))
+            total_functions += public
+            compliant_functions += documented
+            
+            # Count public classes
+            classes = file_data.get("classes", [])
+            public, documented = _public_counts(classes)
+            total_classes += public
+            compliant_classes += documented
+            
+            # Count public methods (of every class, private ones included)
+            for cls in classes:
+                public, documented = _public_counts(cls.get("methods", []))
+                total_functions += public
+                compliant_functions += documented
+    finally:
+        if conn is not None:
+            try:
+                conn.commit()
+            except sqlite3.Error as e:
+                logger.warning("Could not write validation cache: %s", e)
+            conn.close()
     
     total_items = total_functions + total_classes
     compliant_items = compliant_functions + compliant_classes
@@ -5,14 +5,36 @@ Clean, professional Streamlit UI with test results integration.
 """
 
 import streamlit as st
-import json
 import os
+import re
+import orjson
 import pandas as pd
 
+from core.reporter.coverage_reporter import dumps_report
+from core.reporter.pytest_report import record_run, split_report, tally_by_file
+
 
 # -------------------------------------------------
 # Feature Navigation - UPDATED with Tests option
 # -------------------------------------------------
+_DASHBOARD_VIEWS = {
+    "filters": "🔍 Filters",
+    "search": "🔎 Search",
+    "tests": "🧪 Tests",
+    "export": "📦 Export",
+    "help": "ℹ️ Help",
+}
+
+
+def _select_dashboard_view():
+    """Switch views from the nav control; clicking the active view keeps it."""
+    choice = st.session_state.dashboard_nav
+    if choice is None:
+        st.session_state.dashboard_nav = st.session_state.dashboard_view
+    else:
+        st.session_state.dashboard_view = choice
+
+
 def render_feature_cards():
     st.subheader("🧭 Dashboard Navigation")
 
@@ -20,27 +42,16 @@ def render_feature_cards():
     if "dashboard_view" not in st.session_state:
         st.session_state.dashboard_view = "filters"
 
-    col1, col2, col3, col4, col5 = st.columns(5)
-
-    with col1:
-        if st.button("🔍 Filters", use_container_width=True):
-            st.session_state.dashboard_view = "filters"
-
-    with col2:
-        if st.button("🔎 Search", use_container_width=True):
-            st.session_state.dashboard_view = "search"
-    
-    with col3:
-        if st.button("🧪 Tests", use_container_width=True):
-            st.session_state.dashboard_view = "tests"
-
-    with col4:
-        if st.button("📦 Export", use_container_width=True):
-            st.session_state.dashboard_view = "export"
-
-    with col5:
-        if st.button("ℹ️ Help", use_container_width=True):
-            st.session_state.dashboard_view = "help"
+    current = st.session_state.dashboard_view
+    st.segmented_control(
+        "Dashboard view",
+        list(_DASHBOARD_VIEWS),
+        format_func=_DASHBOARD_VIEWS.get,
+        default=current if current in _DASHBOARD_VIEWS else None,
+        key="dashboard_nav",
+        on_change=_select_dashboard_view,
+        label_visibility="collapsed",
+    )
 
     st.divider()
 
@@ -48,91 +59,218 @@ def render_feature_cards():
 # -------------------------------------------------
 # Helper function to load test results
 # -------------------------------------------------
-def load_test_results(json_path="storage/reports/pytest_results.json"):
-    """Load and parse pytest JSON report."""
+@st.cache_data(show_spinner=False, max_entries=8)
+def _load_test_results_cached(json_path, mtime_ns, size):
+    """Parse a pytest JSON report; cached per file version (mtime + size)."""
+    with open(json_path, 'rb') as f:
+        data = orjson.loads(f.read())
+    
+    # Reports split after a dashboard run already carry the per-file
+    # tallies; reports written by a plain pytest run still list every test.
+    summary = data.get('summary', {})
+    results_by_file = data.get('by_file')
+    if results_by_file is None:
+        results_by_file = tally_by_file(data.get('tests', []))
+    
+    # Only the tallies are returned: st.cache_data hands out a pickled copy
+    # on every hit, so keeping the raw test list would re-copy the whole
+    # report on each rerun.
+    return {
+        'summary': summary,
+        'by_file': results_by_file
+    }
+
+
+def _report_stat(json_path):
+    """Return os.stat() of the report, or None when it doesn't exist."""
+    try:
+        return os.stat(json_path)
+    except FileNotFoundError:
+        return None
+
+
+def load_test_results(json_path="storage/reports/pytest_results.json", stat=None):
+    """
+    Load and parse pytest JSON report.
+    
+    Reruns reuse the parsed report until the file's mtime or size changes
+    (i.e. until the tests are run again). Callers that already stat'ed the
+    report can pass the result to skip a second syscall.
+    """
     try:
-        if not os.path.exists(json_path):
+        if stat is None:
+            stat = _report_stat(json_path)
+        if stat is None:
             return None
         
-        with open(json_path, 'r', encoding='utf-8') as f:
-            data = json.load(f)
-        
-        # Parse test results
-        tests = data.get('tests', [])
-        summary = data.get('summary', {})
-        
-        # Group by test file
-        results_by_file = {}
-        for test in tests:
-            nodeid = test.get('nodeid', '')
-            # Extract file name
-            file_name = nodeid.split('::')[0] if '::' in nodeid else nodeid
-            file_name = file_name.split('/')[-1] if '/' in file_name else file_name
-            
-            if file_name not in results_by_file:
-                results_by_file[file_name] = {
-                    'passed': 0,
-                    'failed': 0,
-                    'skipped': 0,
-                    'total': 0
-                }
-            
-            outcome = test.get('outcome', 'unknown')
-            results_by_file[file_name][outcome] = results_by_file[file_name].get(outcome, 0) + 1
-            results_by_file[file_name]['total'] += 1
-        
-        return {
-            'summary': summary,
-            'by_file': results_by_file,
-            'raw_tests': tests
-        }
+        return _load_test_results_cached(json_path, stat.st_mtime_ns, stat.st_size)
     except Exception as e:
         st.error(f"Error loading test results: {e}")
         return None
+
+
 # -------------------------------------------------
 # Helper function to run pytest tests
 # -------------------------------------------------
-def run_pytest_tests():
-    """Run pytest and generate JSON report with live output."""
+def _pytest_parallel_args():
+    """Spread tests over CPU cores with pytest-xdist when it's installed."""
+    import importlib.util
+
+    if importlib.util.find_spec("xdist") is None or (os.cpu_count() or 1) < 2:
+        return []
+    # loadfile keeps each test module on one worker, so module-level
+    # fixtures are built once rather than once per worker.
+    return ["-n", "auto", "--dist=loadfile"]
+
+
+def run_pytest_tests(on_output=None):
+    """Run pytest and generate JSON report with live output.
+
+    Args:
+        on_output: Optional callable receiving the output collected so far
+            each time pytest writes, so the caller can render it live
+    """
+    import codecs
     import subprocess
     
     try:
         # Ensure the reports directory exists
         os.makedirs("storage/reports", exist_ok=True)
         
-        # Run pytest with JSON report
+        # Run pytest with JSON report. The suite is passed as a directory
+        # rather than a cached @nodeids argfile: pytest still imports every
+        # module named in the ids, so collection isn't skipped, and a stale
+        # list would silently drop newly added tests.
         process = subprocess.Popen(
             [
                 "pytest",
                 "-v",
+                *_pytest_parallel_args(),
                 "--json-report",
                 "--json-report-file=storage/reports/pytest_results.json",
                 "tests/"
             ],
             stdout=subprocess.PIPE,
             stderr=subprocess.STDOUT,
-            text=True,
-            bufsize=1,
-            universal_newlines=True
         )
         
-        # Read output line by line
+        # os.read returns whatever the child has written so far instead of
+        # waiting for a newline, so partial lines show up immediately.
+        fd = process.stdout.fileno()
+        decoder = codecs.getincrementaldecoder("utf-8")(errors="replace")
         output_lines = []
-        for line in process.stdout:
-            output_lines.append(line)
+        while True:
+            chunk = os.read(fd, 65536)
+            text = decoder.decode(chunk, final=not chunk)
+            if text:
+                output_lines.append(text)
+                if on_output is not None:
+                    on_output("".join(output_lines))
+            if not chunk:
+                break
+        process.stdout.close()
         
         process.wait()
         
+        # Keep the report the dashboard loads small: the raw test list moves
+        # to a sidecar file and the per-file tallies are stored up front.
+        if os.path.exists("storage/reports/pytest_results.json"):
+            split_report("storage/reports/pytest_results.json")
+            record_run("storage/reports/pytest_results.json", "storage/reports/pytest_history.sqlite3")
+        
         return True, process.returncode == 0, output_lines
     except Exception as e:
         return False, False, [f"Error: {str(e)}"]
 
+# -------------------------------------------------
+# Helper to build the per-file test results chart
+# -------------------------------------------------
+@st.cache_resource(show_spinner=False)
+def _plotly():
+    """Return plotly.graph_objects, or None when plotly isn't installed.
+    
+    Cached so a missing plotly is looked up once per process instead of
+    re-scanning sys.path on every rerun.
+    """
+    try:
+        import plotly.graph_objects as go
+    except ImportError:
+        return None
+    return go
+
+
+@st.cache_resource(show_spinner=False, max_entries=8)
+def _build_results_figure(by_file):
+    """
+    Build the stacked pass/fail bar chart for the per-file tallies.
+    
+    Cached as a resource rather than data: st.cache_data would pickle the
+    figure, and unpickling a plotly Figure re-validates it, which is the
+    cost being avoided. st.plotly_chart only reads the figure it is given.
+    """
+    go = _plotly()
+
+    # Prepare data for chart
+    file_names = list(by_file.keys())
+    passed_counts = [by_file[f].get('passed', 0) for f in file_names]
+    failed_counts = [by_file[f].get('failed', 0) for f in file_names]
+
+    # Shorten file names for display
+    display_names = [f.replace('test_', '').replace('.py', '') for f in file_names]
+
+    fig = go.Figure(data=[
+        go.Bar(
+            name='Failed',
+            x=display_names,
+            y=failed_counts,
+            marker_color='rgb(239, 68, 68)',
+            text=failed_counts,
+            textposition='inside'
+        ),
+        go.Bar(
+            name='Passed',
+            x=display_names,
+            y=passed_counts,
+            marker_color='rgb(16, 185, 129)',
+            text=passed_counts,
+            textposition='inside'
+        )
+    ])
+
+    fig.update_layout(
+        barmode='stack',
+        title='',
+        xaxis_title='',
+        yaxis_title='Number of Tests',
+        paper_bgcolor='rgba(0,0,0,0)',
+        plot_bgcolor='rgba(30, 41, 59, 0.5)',
+        font=dict(color='#e2e8f0', size=12),
+        height=350,
+        showlegend=True,
+        legend=dict(
+            orientation="h",
+            yanchor="bottom",
+            y=1.02,
+            xanchor="right",
+            x=1
+        ),
+        margin=dict(l=50, r=20, t=40, b=100)
+    )
+
+    fig.update_xaxes(tickangle=45)
+    
+    return fig
+
+
 # -------------------------------------------------
 # NEW: Test Results View
 # -------------------------------------------------
 # -------------------------------------------------
 # NEW: Test Results View
 # -------------------------------------------------
+# A fragment, so "Run All Tests" reruns only this view and not the scan,
+# search and export code around it.
+@st.fragment
 def render_tests_view():
     st.markdown('<div class="section-header">🧪 Test Results</div>', unsafe_allow_html=True)
     
@@ -163,7 +301,9 @@ def render_tests_view():
             # Create placeholder for live output
             output_placeholder = st.empty()
             
-            success, all_passed, output_lines = run_pytest_tests()
+            success, all_passed, output_lines = run_pytest_tests(
+                on_output=lambda text: output_placeholder.code(text, language="text")
+            )
             
             # Show live output
             with output_placeholder.container():
@@ -182,8 +322,9 @@ def render_tests_view():
             else:
                 st.error("❌ Failed to run tests")
         
+        # No rerun: the results below are loaded after the run, in this
+        # same pass, from the report it just wrote.
         st.session_state.test_running = False
-        st.rerun()
     
     st.markdown("---")
     
@@ -191,12 +332,14 @@ def render_tests_view():
     # Try to load existing test results first
     if "tests_have_run" not in st.session_state:
         st.session_state.tests_have_run = False
-    # Check if test results file exists
-    if os.path.exists("storage/reports/pytest_results.json"):
+    # Check if test results file exists; one stat serves both the check
+    # and the cache key of the load below
+    report_stat = _report_stat("storage/reports/pytest_results.json")
+    if report_stat is not None:
         st.session_state.tests_have_run = True
     
     # Load test results
-    test_results = load_test_results()
+    test_results = load_test_results(stat=report_stat) if report_stat is not None else None
     
     if not test_results:
         st.markdown("""
@@ -223,40 +366,16 @@ def render_tests_view():
     pass_rate = (passed_tests / total_tests * 100) if total_tests > 0 else 0
     
     with col1:
-        st.markdown(f"""
-        <div class="metric-card">
-            <div class="metric-icon">🧪</div>
-            <div class="metric-value">{total_tests}</div>
-            <div class="metric-label">Total Tests</div>
-        </div>
-        """, unsafe_allow_html=True)
+        st.metric("🧪 Total Tests", total_tests)
     
     with col2:
-        st.markdown(f"""
-        <div class="metric-card">
-            <div class="metric-icon">✅</div>
-            <div class="metric-value">{passed_tests}</div>
-            <div class="metric-label">Passed</div>
-        </div>
-        """, unsafe_allow_html=True)
+        st.metric("✅ Passed", passed_tests)
     
     with col3:
-        st.markdown(f"""
-        <div class="metric-card">
-            <div class="metric-icon">❌</div>
-            <div class="metric-value">{failed_tests}</div>
-            <div class="metric-label">Failed</div>
-        </div>
-        """, unsafe_allow_html=True)
+        st.metric("❌ Failed", failed_tests)
     
     with col4:
-        st.markdown(f"""
-        <div class="metric-card">
-            <div class="metric-icon">📈</div>
-            <div class="metric-value">{pass_rate:.1f}%</div>
-            <div class="metric-label">Pass Rate</div>
-        </div>
-        """, unsafe_allow_html=True)
+        st.metric("📈 Pass Rate", f"{pass_rate:.1f}%")
     
     st.markdown("---")
     
@@ -266,66 +385,17 @@ def render_tests_view():
     with col_chart:
         st.markdown('<h3 style="color: #a5b4fc; margin-bottom: 1rem;">📊 Test Results by File</h3>', unsafe_allow_html=True)
         
-        try:
-            import plotly.graph_objects as go
-            
-            # Prepare data for chart
-            file_names = list(by_file.keys())
-            passed_counts = [by_file[f].get('passed', 0) for f in file_names]
-            failed_counts = [by_file[f].get('failed', 0) for f in file_names]
-            
-            # Shorten file names for display
-            display_names = [f.replace('test_', '').replace('.py', '') for f in file_names]
-            
-            fig = go.Figure(data=[
-                go.Bar(
-                    name='Failed',
-                    x=display_names,
-                    y=failed_counts,
-                    marker_color='rgb(239, 68, 68)',
-                    text=failed_counts,
-                    textposition='inside'
-                ),
-                go.Bar(
-                    name='Passed',
-                    x=display_names,
-                    y=passed_counts,
-                    marker_color='rgb(16, 185, 129)',
-                    text=passed_counts,
-                    textposition='inside'
-                )
-            ])
-            
-            fig.update_layout(
-                barmode='stack',
-                title='',
-                xaxis_title='',
-                yaxis_title='Number of Tests',
-                paper_bgcolor='rgba(0,0,0,0)',
-                plot_bgcolor='rgba(30, 41, 59, 0.5)',
-                font=dict(color='#e2e8f0', size=12),
-                height=350,
-                showlegend=True,
-                legend=dict(
-                    orientation="h",
-                    yanchor="bottom",
-                    y=1.02,
-                    xanchor="right",
-                    x=1
-                ),
-                margin=dict(l=50, r=20, t=40, b=100)
-            )
-            
-            fig.update_xaxes(tickangle=45)
-            
-            st.plotly_chart(fig, use_container_width=True)
-        except ImportError:
+        if _plotly() is None:
             st.warning("📊 Install plotly for chart visualization: `pip install plotly`")
+        else:
+            st.plotly_chart(_build_results_figure(by_file), use_container_width=True)
     
     with col_list:
         st.markdown('<h3 style="color: #a5b4fc; margin-bottom: 1rem;">📋 Test Suites</h3>', unsafe_allow_html=True)
         
-        # Display test suites as colored bars
+        # Display test suites as colored bars, sent as one markdown element
+        # rather than one per suite
+        suite_cards = []
         for file_name, results in by_file.items():
             total = results['total']
             passed = results.get('passed', 0)
@@ -348,7 +418,7 @@ def render_tests_view():
             # Clean file name for display
             display_name = file_name.replace('test_', '').replace('.py', '').replace('_', ' ').title()
             
-            st.markdown(f"""
+            suite_cards.append(f"""
             <div style="background: {bg_color}; border-left: 4px solid {border_color}; 
                         padding: 0.875rem 1.25rem; margin: 0.5rem 0; border-radius: 8px;
                         display: flex; justify-content: space-between; align-items: center;">
@@ -359,11 +429,87 @@ def render_tests_view():
                     {passed}/{total} passed
                 </span>
             </div>
-            """, unsafe_allow_html=True)
+            """)
+        
+        if suite_cards:
+            st.markdown("".join(suite_cards), unsafe_allow_html=True)
     
     st.markdown("---")
 
 
+# -------------------------------------------------
+# Helper to flatten scan results into one row per function / method
+# -------------------------------------------------
+# How the boolean Docstring column is shown in the filter and search tables
+_DOCSTRING_LABELS = {True: "✅ Yes", False: "❌ No"}
+
+
+def _flatten_scan_results(scan_results):
+    """
+    Return a DataFrame with File, Function, Docstring and Complexity columns.
+    
+    Columns are collected as lists (much cheaper for pandas than one dict per
+    row). Views go through _scan_results_frame, which keeps the result for
+    the session instead of hashing scan_results (which costs more than
+    flattening it).
+    """
+    files = []
+    functions = []
+    docstrings = []
+    complexities = []
+
+    for file in scan_results:
+        file_name = os.path.basename(file.get("file_path", ""))
+
+        for fn in file.get("functions", []):
+            files.append(file_name)
+            functions.append(fn["name"])
+            docstrings.append(fn.get("has_docstring", False))
+            complexities.append(fn.get("complexity", 1))
+
+        for cls in file.get("classes", []):
+            for m in cls.get("methods", []):
+                files.append(file_name)
+                functions.append(f"{cls['name']}.{m['name']}")
+                docstrings.append(m.get("has_docstring", False))
+                complexities.append(m.get("complexity", 1))
+
+    return pd.DataFrame({
+        "File": files,
+        "Function": functions,
+        "Docstring": docstrings,
+        "Complexity": complexities
+    })
+
+
+def mark_scan_results_changed():
+    """
+    Record that st.session_state.scan_results was replaced or edited in place.
+    
+    The flattened frame kept for the session is rebuilt on its next use.
+    """
+    st.session_state.scan_results_version = st.session_state.get("scan_results_version", 0) + 1
+
+
+def _scan_results_frame():
+    """
+    Return the session's flattened scan results, reusing them across reruns.
+    
+    Kept in session state rather than st.cache_data: the frame belongs to one
+    session, and session state hands it back without a pickle round trip.
+    Sessions that never call mark_scan_results_changed() flatten every time.
+    """
+    version = st.session_state.get("scan_results_version")
+    cached = st.session_state.get("scan_results_frame")
+    if version is not None and cached is not None and cached[0] == version:
+        return cached[1]
+    
+    df = _flatten_scan_results(st.session_state.scan_results)
+    if version is not None:
+        st.session_state.scan_results_frame = (version, df)
+    return df
+
+
 # -------------------------------------------------
 # Filters View (unchanged)
 # -------------------------------------------------
@@ -435,27 +581,7 @@ def render_filters_view():
     
     st.markdown("<br>", unsafe_allow_html=True)
 
-    rows = []
-
-    for file in st.session_state.scan_results:
-        file_name = os.path.basename(file.get("file_path", ""))
-
-        for fn in file.get("functions", []):
-            rows.append({
-                "File": file_name,
-                "Function": fn["name"],
-                "Docstring": fn.get("has_docstring", False)
-            })
-
-        for cls in file.get("classes", []):
-            for m in cls.get("methods", []):
-                rows.append({
-                    "File": file_name,
-                    "Function": f"{cls['name']}.{m['name']}",
-                    "Docstring": m.get("has_docstring", False)
-                })
-
-    df = pd.DataFrame(rows)
+    df = _scan_results_frame()[["File", "Function", "Docstring"]]
 
     if status.startswith("OK"):
         df_filtered = df[df["Docstring"] == True]
@@ -526,7 +652,7 @@ def render_filters_view():
         st.markdown('<h3 style="color: #a5b4fc; margin-bottom: 1rem;">📋 Functions List</h3>', unsafe_allow_html=True)
         
         st.dataframe(
-            df_filtered.replace({True: "✅ Yes", False: "❌ No"}),
+            df_filtered.replace(_DOCSTRING_LABELS),
             use_container_width=True,
             height=table_height
         )
@@ -548,29 +674,14 @@ def render_search_view():
         st.info("💡 Type a function name to start searching.")
         return
 
-    results = []
-
-    for file in st.session_state.scan_results:
-        file_name = os.path.basename(file.get("file_path", ""))
-
-        for fn in file.get("functions", []):
-            if query.lower() in fn["name"].lower():
-                results.append({
-                    "File": file_name,
-                    "Function": fn["name"],
-                    "Docstring": fn.get("has_docstring", False)
-                })
-
-        for cls in file.get("classes", []):
-            for m in cls.get("methods", []):
-                if query.lower() in m["name"].lower():
-                    results.append({
-                        "File": file_name,
-                        "Function": f"{cls['name']}.{m['name']}",
-                        "Docstring": m.get("has_docstring", False)
-                    })
-
-    df = pd.DataFrame(results)
+    # Filter the session's cached frame. Names never contain a dot, and the
+    # pattern must end the string without crossing one, so methods are found
+    # by their own name rather than by their class's. astype(str) covers the
+    # untyped frame of an empty scan.
+    frame = _scan_results_frame()
+    pattern = "(?!)" if "." in query else re.escape(query) + r"[^.]*$"
+    matches = frame["Function"].astype(str).str.contains(pattern, case=False, regex=True)
+    df = frame.loc[matches, ["File", "Function", "Docstring"]]
 
     st.markdown(f"### 📊 {len(df)} result(s) found for '{query}'")
 
@@ -578,7 +689,7 @@ def render_search_view():
         st.warning(f"❌ No functions matching '{query}' were found.")
     else:
         st.dataframe(
-            df.replace({True: "✅ Yes", False: "❌ No"}),
+            df.replace(_DOCSTRING_LABELS),
             use_container_width=True,
             height=min(400, len(df) * 35 + 38)
         )
@@ -593,23 +704,11 @@ def render_export_view():
         st.warning("⚠️ No data available for export. Please scan your project first.")
         return
 
-    # ✅ FIX: Calculate metrics directly from scan_results in real-time
-    total_functions = 0
-    documented_functions = 0
-    
-    for file in st.session_state.scan_results:
-        # Count standalone functions
-        for fn in file.get("functions", []):
-            total_functions += 1
-            if fn.get("has_docstring", False):
-                documented_functions += 1
-        
-        # Count class methods
-        for cls in file.get("classes", []):
-            for method in cls.get("methods", []):
-                total_functions += 1
-                if method.get("has_docstring", False):
-                    documented_functions += 1
+    # ✅ FIX: Calculate metrics directly from scan_results in real-time.
+    # The same flattened frame feeds the CSV export below.
+    flat_df = _scan_results_frame()
+    total_functions = len(flat_df)
+    documented_functions = int(flat_df["Docstring"].sum())
     
     missing_functions = total_functions - documented_functions
 
@@ -618,28 +717,13 @@ def render_export_view():
     col1, col2, col3 = st.columns(3)
     
     with col1:
-        st.markdown(f"""
-        <div style="background: rgba(99, 102, 241, 0.1); padding: 1.5rem; border-radius: 12px; text-align: center; border: 2px solid rgba(99, 102, 241, 0.3);">
-            <div style="font-size: 2.5rem; font-weight: bold; color: #6366f1;">{total_functions}</div>
-            <div style="color: #94a3b8; margin-top: 0.5rem;">Total Functions</div>
-        </div>
-        """, unsafe_allow_html=True)
+        st.metric("Total Functions", total_functions)
     
     with col2:
-        st.markdown(f"""
-        <div style="background: rgba(16, 185, 129, 0.1); padding: 1.5rem; border-radius: 12px; text-align: center; border: 2px solid rgba(16, 185, 129, 0.3);">
-            <div style="font-size: 2.5rem; font-weight: bold; color: #10b981;">{documented_functions}</div>
-            <div style="color: #94a3b8; margin-top: 0.5rem;">Documented</div>
-        </div>
-        """, unsafe_allow_html=True)
+        st.metric("Documented", documented_functions)
     
     with col3:
-        st.markdown(f"""
-        <div style="background: rgba(239, 68, 68, 0.1); padding: 1.5rem; border-radius: 12px; text-align: center; border: 2px solid rgba(239, 68, 68, 0.3);">
-            <div style="font-size: 2.5rem; font-weight: bold; color: #ef4444;">{missing_functions}</div>
-            <div style="color: #94a3b8; margin-top: 0.5rem;">Missing</div>
-        </div>
-        """, unsafe_allow_html=True)
+        st.metric("Missing", missing_functions)
 
     st.markdown("---")
     st.markdown("### 📥 Download Reports")
@@ -684,7 +768,7 @@ def render_export_view():
         report["files"].append(file_info)
 
     # JSON Export with better button styling
-    json_data = json.dumps(report, indent=2)
+    json_data = dumps_report(report)
     st.markdown("""
     <style>
     /* Fix download button visibility */
@@ -721,31 +805,8 @@ def render_export_view():
     st.markdown("<br>", unsafe_allow_html=True)
 
     # CSV Export
-    rows = []
-    for file in st.session_state.scan_results:
-        fname = os.path.basename(file.get("file_path", ""))
-
-        for fn in file.get("functions", []):
-            rows.append([
-                fname,
-                fn["name"],
-                "Yes" if fn.get("has_docstring", False) else "No",
-                fn.get("complexity", 1)
-            ])
-
-        for cls in file.get("classes", []):
-            for m in cls.get("methods", []):
-                rows.append([
-                    fname,
-                    f"{cls['name']}.{m['name']}",
-                    "Yes" if m.get("has_docstring", False) else "No",
-                    m.get("complexity", 1)
-                ])
-
-    csv_df = pd.DataFrame(
-        rows,
-        columns=["File", "Function", "Has Docstring", "Complexity"]
-    )
+    csv_df = flat_df.rename(columns={"Docstring": "Has Docstring"})
+    csv_df["Has Docstring"] = csv_df["Has Docstring"].map({True: "Yes", False: "No"})
 
     csv_data = csv_df.to_csv(index=False)
     
@@ -769,210 +830,185 @@ def render_export_view():
 # -------------------------------------------------
 # Help View (DO NOT RENAME) - SIMPLIFIED VERSION
 # -------------------------------------------------
-def render_help_view():
-    # Add tab styling first
-    st.markdown("""
-    <style>
-    .stTabs [data-baseweb="tab-list"] button [data-testid="stMarkdownContainer"] p {
-        color: #cbd5e1 !important;
-        font-weight: 500 !important;
-    }
-    .stTabs [data-baseweb="tab-list"] button[aria-selected="true"] [data-testid="stMarkdownContainer"] p {
-        color: #6366f1 !important;
-        font-weight: 700 !important;
-    }
-    </style>
-    """, unsafe_allow_html=True)
-    
-    st.markdown('<div class="section-header">📚 Complete Usage Guide</div>', unsafe_allow_html=True)
-    
-    # Feature Grid - Using Streamlit columns for reliability
-    st.markdown("### 🎯 Core Features")
-    
-    col1, col2 = st.columns(2)
-    
-    with col1:
-        st.markdown("""
-        <div style="background: rgba(30, 41, 59, 0.5); border: 2px solid rgba(99, 102, 241, 0.3); 
-                    border-radius: 16px; padding: 2rem; box-shadow: 0 8px 32px rgba(0, 0, 0, 0.3); margin-bottom: 1.5rem;">
-            <div style="display: flex; align-items: center; gap: 1rem; margin-bottom: 1.5rem;">
-                <div style="font-size: 2.5rem;">🔍</div>
-                <h3 style="margin: 0; color: #06b6d4; font-size: 1.3rem;">Project Scanning</h3>
-            </div>
-            <ul style="color: #cbd5e1; line-height: 1.8; margin: 0; padding-left: 1.25rem;">
-                <li>Recursively scans Python files in your project</li>
-                <li>Parses functions, methods, and classes</li>
-                <li>Extracts existing docstrings and signatures</li>
-                <li>Calculates cyclomatic complexity metrics</li>
-            </ul>
-        </div>
-        """, unsafe_allow_html=True)
-        
-        st.markdown("""
-        <div style="background: rgba(30, 41, 59, 0.5); border: 2px solid rgba(16, 185, 129, 0.3); 
-                    border-radius: 16px; padding: 2rem; box-shadow: 0 8px 32px rgba(0, 0, 0, 0.3); margin-bottom: 1.5rem;">
-            <div style="display: flex; align-items: center; gap: 1rem; margin-bottom: 1.5rem;">
-                <div style="font-size: 2.5rem;">✅</div>
-                <h3 style="margin: 0; color: #10b981; font-size: 1.3rem;">Review &amp; Apply Workflow</h3>
-            </div>
-            <ul style="color: #cbd5e1; line-height: 1.8; margin: 0; padding-left: 1.25rem;">
-                <li>Side-by-side comparison view</li>
-                <li>Detailed diff highlighting changes</li>
-                <li>Accept: Writes docstring directly to your file</li>
-                <li>Tracks accepted styles per function</li>
-            </ul>
-        </div>
-        """, unsafe_allow_html=True)
-        
-        st.markdown("""
-        <div style="background: rgba(30, 41, 59, 0.5); border: 2px solid rgba(99, 102, 241, 0.3); 
-                    border-radius: 16px; padding: 2rem; box-shadow: 0 8px 32px rgba(0, 0, 0, 0.3); margin-bottom: 1.5rem;">
-            <div style="display: flex; align-items: center; gap: 1rem; margin-bottom: 1.5rem;">
-                <div style="font-size: 2.5rem;">📊</div>
-                <h3 style="margin: 0; color: #6366f1; font-size: 1.3rem;">Coverage Tracking</h3>
-            </div>
-            <ul style="color: #cbd5e1; line-height: 1.8; margin: 0; padding-left: 1.25rem;">
-                <li>Real-time calculation of doc coverage %</li>
-                <li>Tracks which functions have docstrings</li>
-                <li>Provides overall project metrics</li>
-                <li>Updates automatically after changes</li>
-            </ul>
-        </div>
-        """, unsafe_allow_html=True)
-    
-    with col2:
-        st.markdown("""
-        <div style="background: rgba(30, 41, 59, 0.5); border: 2px solid rgba(139, 92, 246, 0.3); 
-                    border-radius: 16px; padding: 2rem; box-shadow: 0 8px 32px rgba(0, 0, 0, 0.3); margin-bottom: 1.5rem;">
-            <div style="display: flex; align-items: center; gap: 1rem; margin-bottom: 1.5rem;">
-                <div style="font-size: 2.5rem;">🤖</div>
-                <h3 style="margin: 0; color: #8b5cf6; font-size: 1.3rem;">AI Docstring Generation</h3>
-            </div>
-            <ul style="color: #cbd5e1; line-height: 1.8; margin: 0; padding-left: 1.25rem;">
-                <li>Generates 3 styles: Google, NumPy, reST</li>
-                <li>Uses Groq LLM API for intelligent suggestions</li>
-                <li>Analyzes function signature and complexity</li>
-                <li>Pre-generates all styles during scan</li>
-            </ul>
-        </div>
-        """, unsafe_allow_html=True)
-        
-        st.markdown("""
-        <div style="background: rgba(30, 41, 59, 0.5); border: 2px solid rgba(245, 158, 11, 0.3); 
-                    border-radius: 16px; padding: 2rem; box-shadow: 0 8px 32px rgba(0, 0, 0, 0.3); margin-bottom: 1.5rem;">
-            <div style="display: flex; align-items: center; gap: 1rem; margin-bottom: 1.5rem;">
-                <div style="font-size: 2.5rem;">📝</div>
-                <h3 style="margin: 0; color: #f59e0b; font-size: 1.3rem;">Direct File Modification</h3>
-            </div>
-            <ul style="color: #cbd5e1; line-height: 1.8; margin: 0; padding-left: 1.25rem;">
-                <li>Automatically finds function definition</li>
-                <li>Replaces existing or inserts new docstring</li>
-                <li>Preserves indentation and formatting</li>
-                <li>Works with both functions and class methods</li>
-            </ul>
-        </div>
-        """, unsafe_allow_html=True)
-        
-        st.markdown("""
-        <div style="background: rgba(30, 41, 59, 0.5); border: 2px solid rgba(239, 68, 68, 0.3); 
-                    border-radius: 16px; padding: 2rem; box-shadow: 0 8px 32px rgba(0, 0, 0, 0.3); margin-bottom: 1.5rem;">
-            <div style="display: flex; align-items: center; gap: 1rem; margin-bottom: 1.5rem;">
-                <div style="font-size: 2.5rem;">🔍</div>
-                <h3 style="margin: 0; color: #ef4444; font-size: 1.3rem;">PEP 257 Validation</h3>
-            </div>
-            <ul style="color: #cbd5e1; line-height: 1.8; margin: 0; padding-left: 1.25rem;">
-                <li>Checks docstring compliance standards</li>
-                <li>Identifies missing or malformed docstrings</li>
-                <li>Provides detailed violation reports</li>
-                <li>Groups violations by severity</li>
-            </ul>
-        </div>
-        """, unsafe_allow_html=True)
-    
-    st.markdown("---")
-    
-    # Enhanced Features Guide
-    st.markdown('<div class="section-header">✨ Enhanced Features Guide</div>', unsafe_allow_html=True)
-    
-    col1, col2 = st.columns(2)
-    
-    with col1:
-        st.markdown("""
-        <div style="background: rgba(30, 41, 59, 0.5); border: 2px solid rgba(99, 102, 241, 0.2); 
-                    border-radius: 16px; padding: 2rem; margin-bottom: 1.5rem;">
-            <h3 style="margin: 0 0 1rem 0; color: #a5b4fc; display: flex; align-items: center; gap: 0.75rem;">
-                <span style="font-size: 1.75rem;">🎯</span> Advanced Filters
-            </h3>
-            <p style="color: #cbd5e1; line-height: 1.7; margin: 0;">
-                Filter functions by documentation status: <strong>All</strong>, <strong>Missing Docs</strong>, 
-                or <strong>Documented</strong>. Quickly identify which parts of your codebase need attention. 
-                Shows count and percentage of filtered results.
-            </p>
-        </div>
-        """, unsafe_allow_html=True)
-        
-        st.markdown("""
-        <div style="background: rgba(30, 41, 59, 0.5); border: 2px solid rgba(99, 102, 241, 0.2); 
-                    border-radius: 16px; padding: 2rem; margin-bottom: 1.5rem;">
-            <h3 style="margin: 0 0 1rem 0; color: #a5b4fc; display: flex; align-items: center; gap: 0.75rem;">
-                <span style="font-size: 1.75rem;">📥</span> Export Reports
-            </h3>
-            <p style="color: #cbd5e1; line-height: 1.7; margin: 0;">
-                Download complete analysis reports in <strong>JSON</strong> (programmatic use) or 
-                <strong>CSV</strong> (spreadsheets/Excel). Include coverage metrics, complexity scores, 
-                and validation results for code reviews or CI/CD integration.
-            </p>
-        </div>
-        """, unsafe_allow_html=True)
-    
-    with col2:
-        st.markdown("""
-        <div style="background: rgba(30, 41, 59, 0.5); border: 2px solid rgba(99, 102, 241, 0.2); 
-                    border-radius: 16px; padding: 2rem; margin-bottom: 1.5rem;">
-            <h3 style="margin: 0 0 1rem 0; color: #a5b4fc; display: flex; align-items: center; gap: 0.75rem;">
-                <span style="font-size: 1.75rem;">🔎</span> Search Functions
-            </h3>
-            <p style="color: #cbd5e1; line-height: 1.7; margin: 0;">
-                Find specific functions by name across your entire project. Case-insensitive search helps 
-                you quickly locate methods, classes, or functions. Perfect for large codebases with 
-                hundreds of functions.
-            </p>
-        </div>
-        """, unsafe_allow_html=True)
-        
-        st.markdown("""
-        <div style="background: rgba(30, 41, 59, 0.5); border: 2px solid rgba(99, 102, 241, 0.2); 
-                    border-radius: 16px; padding: 2rem; margin-bottom: 1.5rem;">
-            <h3 style="margin: 0 0 1rem 0; color: #a5b4fc; display: flex; align-items: center; gap: 0.75rem;">
-                <span style="font-size: 1.75rem;">🧪</span> Testing Integration
-            </h3>
-            <p style="color: #cbd5e1; line-height: 1.7; margin: 0;">
-                Run all pytest tests directly from the sidebar. View test results, pass rates, and 
-                failures grouped by file. Ensure your documentation changes don't break existing 
-                functionality.
-            </p>
-        </div>
-        """, unsafe_allow_html=True)
-    
-    st.markdown("---")
-    
-    # Docstring Styles Reference
-    st.markdown('<div class="section-header">📖 Docstring Styles Reference</div>', unsafe_allow_html=True)
-    
-    tab1, tab2, tab3 = st.tabs(["📗 Google Style", "📕 NumPy Style", "📙 reST Style"])
-    
-    with tab1:
-        st.markdown("""
-        <div style="background: rgba(30, 41, 59, 0.5); border: 2px solid rgba(148, 163, 184, 0.2); 
-                    border-radius: 16px; padding: 2rem; margin: 1rem 0;">
-            <h3 style="margin-top: 0; color: #a5b4fc;">Google Style Docstrings</h3>
-            <p style="color: #cbd5e1; line-height: 1.7;">
-                Most popular and readable style. Used by Google, TensorFlow, and many open-source projects.
-            </p>
-        </div>
-        """, unsafe_allow_html=True)
-        
-        st.code('''def example_function(param1, param2, param3=None):
+# Static help-page HTML, built and minified once at import from the card
+# tables below. Cards sharing a column are joined so each column is sent as
+# one markdown element.
+_FEATURE_CARD = """
+<div style="background: rgba(30, 41, 59, 0.5); border: 2px solid rgba({border}, 0.3); 
+            border-radius: 16px; padding: 2rem; box-shadow: 0 8px 32px rgba(0, 0, 0, 0.3); margin-bottom: 1.5rem;">
+    <div style="display: flex; align-items: center; gap: 1rem; margin-bottom: 1.5rem;">
+        <div style="font-size: 2.5rem;">{icon}</div>
+        <h3 style="margin: 0; color: {color}; font-size: 1.3rem;">{title}</h3>
+    </div>
+    <ul style="color: #cbd5e1; line-height: 1.8; margin: 0; padding-left: 1.25rem;">
+{items}
+    </ul>
+</div>
+"""
+
+_GUIDE_CARD = """
+<div style="background: rgba(30, 41, 59, 0.5); border: 2px solid rgba(99, 102, 241, 0.2); 
+            border-radius: 16px; padding: 2rem; margin-bottom: 1.5rem;">
+    <h3 style="margin: 0 0 1rem 0; color: #a5b4fc; display: flex; align-items: center; gap: 0.75rem;">
+        <span style="font-size: 1.75rem;">{icon}</span> {title}
+    </h3>
+    <p style="color: #cbd5e1; line-height: 1.7; margin: 0;">
+        {text}
+    </p>
+</div>
+"""
+
+# (border rgb, title color, icon, title, bullets) per core feature card
+_CORE_FEATURES_LEFT = [
+    ("99, 102, 241", "#06b6d4", "🔍", "Project Scanning", [
+        "Recursively scans Python files in your project",
+        "Parses functions, methods, and classes",
+        "Extracts existing docstrings and signatures",
+        "Calculates cyclomatic complexity metrics",
+    ]),
+    ("16, 185, 129", "#10b981", "✅", "Review &amp; Apply Workflow", [
+        "Side-by-side comparison view",
+        "Detailed diff highlighting changes",
+        "Accept: Writes docstring directly to your file",
+        "Tracks accepted styles per function",
+    ]),
+    ("99, 102, 241", "#6366f1", "📊", "Coverage Tracking", [
+        "Real-time calculation of doc coverage %",
+        "Tracks which functions have docstrings",
+        "Provides overall project metrics",
+        "Updates automatically after changes",
+    ]),
+]
+_CORE_FEATURES_RIGHT = [
+    ("139, 92, 246", "#8b5cf6", "🤖", "AI Docstring Generation", [
+        "Generates 3 styles: Google, NumPy, reST",
+        "Uses Groq LLM API for intelligent suggestions",
+        "Analyzes function signature and complexity",
+        "Pre-generates all styles during scan",
+    ]),
+    ("245, 158, 11", "#f59e0b", "📝", "Direct File Modification", [
+        "Automatically finds function definition",
+        "Replaces existing or inserts new docstring",
+        "Preserves indentation and formatting",
+        "Works with both functions and class methods",
+    ]),
+    ("239, 68, 68", "#ef4444", "🔍", "PEP 257 Validation", [
+        "Checks docstring compliance standards",
+        "Identifies missing or malformed docstrings",
+        "Provides detailed violation reports",
+        "Groups violations by severity",
+    ]),
+]
+
+# (icon, title, text) per enhanced-feature guide card
+_GUIDE_LEFT = [
+    ("🎯", "Advanced Filters",
+     "Filter functions by documentation status: <strong>All</strong>, <strong>Missing Docs</strong>, "
+     "or <strong>Documented</strong>. Quickly identify which parts of your codebase need attention. "
+     "Shows count and percentage of filtered results."),
+    ("📥", "Export Reports",
+     "Download complete analysis reports in <strong>JSON</strong> (programmatic use) or "
+     "<strong>CSV</strong> (spreadsheets/Excel). Include coverage metrics, complexity scores, "
+     "and validation results for code reviews or CI/CD integration."),
+]
+_GUIDE_RIGHT = [
+    ("🔎", "Search Functions",
+     "Find specific functions by name across your entire project. Case-insensitive search helps "
+     "you quickly locate methods, classes, or functions. Perfect for large codebases with "
+     "hundreds of functions."),
+    ("🧪", "Testing Integration",
+     "Run all pytest tests directly from the sidebar. View test results, pass rates, and "
+     "failures grouped by file. Ensure your documentation changes don't break existing "
+     "functionality."),
+]
+
+
+def _minify_html(html):
+    """Drop whitespace between tags and collapse whitespace runs to one space."""
+    return re.sub(r"\s{2,}", " ", re.sub(r">\s+<", "><", html)).strip()
+
+
+def _feature_cards_html(cards):
+    """Render core feature cards from (border, color, icon, title, bullets) rows."""
+    return _minify_html("".join(
+        _FEATURE_CARD.format(
+            border=border, color=color, icon=icon, title=title,
+            items="".join(f"<li>{item}</li>" for item in items),
+        )
+        for border, color, icon, title, items in cards
+    ))
+
+
+def _guide_cards_html(cards):
+    """Render guide cards from (icon, title, text) rows."""
+    return _minify_html("".join(
+        _GUIDE_CARD.format(icon=icon, title=title, text=text) for icon, title, text in cards
+    ))
+
+
+_HELP_CORE_FEATURES_LEFT = _feature_cards_html(_CORE_FEATURES_LEFT)
+_HELP_CORE_FEATURES_RIGHT = _feature_cards_html(_CORE_FEATURES_RIGHT)
+_HELP_GUIDE_LEFT = _guide_cards_html(_GUIDE_LEFT)
+_HELP_GUIDE_RIGHT = _guide_cards_html(_GUIDE_RIGHT)
+
+# The remaining static markdown between widgets: tab styling and section
+# headers, each group sent as one element.
+_HELP_INTRO = """
+<style>
+.stTabs [data-baseweb="tab-list"] button [data-testid="stMarkdownContainer"] p {
+    color: #cbd5e1 !important;
+    font-weight: 500 !important;
+}
+.stTabs [data-baseweb="tab-list"] button[aria-selected="true"] [data-testid="stMarkdownContainer"] p {
+    color: #6366f1 !important;
+    font-weight: 700 !important;
+}
+</style>
+
+<div class="section-header">📚 Complete Usage Guide</div>
+
+### 🎯 Core Features
+"""
+
+_HELP_GUIDE_HEADER = """
+---
+
+<div class="section-header">✨ Enhanced Features Guide</div>
+"""
+
+_HELP_STYLES_HEADER = """
+---
+
+<div class="section-header">📖 Docstring Styles Reference</div>
+"""
+
+_HELP_FOOTER = "---\n\n" + _minify_html("""
+<div style="background: linear-gradient(135deg, rgba(99, 102, 241, 0.08) 0%, rgba(139, 92, 246, 0.08) 100%); 
+            border: 2px solid rgba(99, 102, 241, 0.3); padding: 2rem; border-radius: 16px; 
+            margin: 2rem 0; text-align: center;">
+    <div style="font-size: 3rem; margin-bottom: 1rem;">🎓</div>
+    <h3 style="margin: 0 0 1rem 0; color: #a5b4fc; font-size: 1.5rem;">Pro Tip</h3>
+    <p style="color: #cbd5e1; line-height: 1.8; font-size: 1.1rem; margin: 0;">
+        Use this tool as part of your development workflow! Run scans before commits to ensure 
+        documentation coverage. Export reports for code reviews. Integrate validation checks 
+        into your CI/CD pipeline for automated quality assurance.
+    </p>
+</div>
+
+<div style="background: rgba(30, 41, 59, 0.5); border-left: 4px solid #6366f1; 
+            padding: 1.5rem; border-radius: 12px; margin-top: 2rem;">
+    <h3 style="margin-top: 0; color: #a5b4fc;">📚 Documentation Standards</h3>
+    <p style="color: #e2e8f0; line-height: 1.7;">
+        This tool follows <strong>PEP 257</strong> docstring conventions and supports 
+        three popular styles: <strong>Google</strong>, <strong>NumPy</strong>, and <strong>reST</strong>.
+        All generated docstrings are validated for compliance with Python's official documentation standards.
+    </p>
+</div>
+""")
+
+
+# Example docstrings shown in the Docstring Styles Reference tabs
+_GOOGLE_EXAMPLE = '''def example_function(param1, param2, param3=None):
     """Brief description of the function.
     
     More detailed explanation of what the function does,
@@ -997,20 +1033,9 @@ def render_help_view():
         {'status': 'success'}
     """
     pass
-''', language='python')
-    
-    with tab2:
-        st.markdown("""
-        <div style="background: rgba(30, 41, 59, 0.5); border: 2px solid rgba(148, 163, 184, 0.2); 
-                    border-radius: 16px; padding: 2rem; margin: 1rem 0;">
-            <h3 style="margin-top: 0; color: #a5b4fc;">NumPy Style Docstrings</h3>
-            <p style="color: #cbd5e1; line-height: 1.7;">
-                Preferred by the scientific Python community. Used by NumPy, SciPy, and Pandas.
-            </p>
-        </div>
-        """, unsafe_allow_html=True)
-        
-        st.code('''def example_function(param1, param2, param3=None):
+'''
+
+_NUMPY_EXAMPLE = '''def example_function(param1, param2, param3=None):
     """Brief description of the function.
     
     More detailed explanation of what the function does,
@@ -1045,20 +1070,9 @@ def render_help_view():
     {'status': 'success'}
     """
     pass
-''', language='python')
-    
-    with tab3:
-        st.markdown("""
-        <div style="background: rgba(30, 41, 59, 0.5); border: 2px solid rgba(148, 163, 184, 0.2); 
-                    border-radius: 16px; padding: 2rem; margin: 1rem 0;">
-            <h3 style="margin-top: 0; color: #a5b4fc;">reST Style Docstrings</h3>
-            <p style="color: #cbd5e1; line-height: 1.7;">
-                ReStructuredText style. Integrates well with Sphinx documentation generator.
-            </p>
-        </div>
-        """, unsafe_allow_html=True)
-        
-        st.code('''def example_function(param1, param2, param3=None):
+'''
+
+_REST_EXAMPLE = '''def example_function(param1, param2, param3=None):
     """Brief description of the function.
     
     More detailed explanation of what the function does,
@@ -1082,33 +1096,68 @@ def render_help_view():
         {'status': 'success'}
     """
     pass
-''', language='python')
+'''
+
+
+_STYLE_TAB_CARD = """
+<div style="background: rgba(30, 41, 59, 0.5); border: 2px solid rgba(148, 163, 184, 0.2); 
+            border-radius: 16px; padding: 2rem; margin: 1rem 0;">
+    <h3 style="margin-top: 0; color: #a5b4fc;">{title}</h3>
+    <p style="color: #cbd5e1; line-height: 1.7;">
+        {text}
+    </p>
+</div>
+"""
+
+# (tab label, intro card, example) per docstring style tab
+_HELP_STYLE_TABS = [
+    (label, _minify_html(_STYLE_TAB_CARD.format(title=title, text=text)), example)
+    for label, title, text, example in [
+        ("📗 Google Style", "Google Style Docstrings",
+         "Most popular and readable style. Used by Google, TensorFlow, and many open-source projects.",
+         _GOOGLE_EXAMPLE),
+        ("📕 NumPy Style", "NumPy Style Docstrings",
+         "Preferred by the scientific Python community. Used by NumPy, SciPy, and Pandas.",
+         _NUMPY_EXAMPLE),
+        ("📙 reST Style", "reST Style Docstrings",
+         "ReStructuredText style. Integrates well with Sphinx documentation generator.",
+         _REST_EXAMPLE),
+    ]
+]
+
+
+def render_help_view():
+    # Tab styling, page header and the first section title
+    st.markdown(_HELP_INTRO, unsafe_allow_html=True)
     
-    st.markdown("---")
+    # Feature Grid - Using Streamlit columns for reliability
+    col1, col2 = st.columns(2)
     
-    # Final Tips
-    st.markdown("""
-    <div style="background: linear-gradient(135deg, rgba(99, 102, 241, 0.08) 0%, rgba(139, 92, 246, 0.08) 100%); 
-                border: 2px solid rgba(99, 102, 241, 0.3); padding: 2rem; border-radius: 16px; 
-                margin: 2rem 0; text-align: center;">
-        <div style="font-size: 3rem; margin-bottom: 1rem;">🎓</div>
-        <h3 style="margin: 0 0 1rem 0; color: #a5b4fc; font-size: 1.5rem;">Pro Tip</h3>
-        <p style="color: #cbd5e1; line-height: 1.8; font-size: 1.1rem; margin: 0;">
-            Use this tool as part of your development workflow! Run scans before commits to ensure 
-            documentation coverage. Export reports for code reviews. Integrate validation checks 
-            into your CI/CD pipeline for automated quality assurance.
-        </p>
-    </div>
-    """, unsafe_allow_html=True)
+    with col1:
+        st.markdown(_HELP_CORE_FEATURES_LEFT, unsafe_allow_html=True)
     
-    st.markdown("""
-    <div style="background: rgba(30, 41, 59, 0.5); border-left: 4px solid #6366f1; 
-                padding: 1.5rem; border-radius: 12px; margin-top: 2rem;">
-        <h3 style="margin-top: 0; color: #a5b4fc;">📚 Documentation Standards</h3>
-        <p style="color: #e2e8f0; line-height: 1.7;">
-            This tool follows <strong>PEP 257</strong> docstring conventions and supports 
-            three popular styles: <strong>Google</strong>, <strong>NumPy</strong>, and <strong>reST</strong>.
-            All generated docstrings are validated for compliance with Python's official documentation standards.
-        </p>
-    </div>
-    """, unsafe_allow_html=True)
\ No newline at end of file
+    with col2:
+        st.markdown(_HELP_CORE_FEATURES_RIGHT, unsafe_allow_html=True)
+    
+    # Enhanced Features Guide
+    st.markdown(_HELP_GUIDE_HEADER, unsafe_allow_html=True)
+    
+    col1, col2 = st.columns(2)
+    
+    with col1:
+        st.markdown(_HELP_GUIDE_LEFT, unsafe_allow_html=True)
+    
+    with col2:
+        st.markdown(_HELP_GUIDE_RIGHT, unsafe_allow_html=True)
+    
+    # Docstring Styles Reference
+    st.markdown(_HELP_STYLES_HEADER, unsafe_allow_html=True)
+    
+    tabs = st.tabs([label for label, _, _ in _HELP_STYLE_TABS])
+    for tab, (_, intro, example) in zip(tabs, _HELP_STYLE_TABS):
+        with tab:
+            st.markdown(intro, unsafe_allow_html=True)
+            st.code(example, language='python')
+    
+    # Final Tips
+    st.markdown(_HELP_FOOTER, unsafe_allow_html=True)
@@ -1,21 +1,23 @@
 import math
+import sys
 
 def calculate_average(numbers):
     """
     Calculates the average of a collection of numbers.
 
     Args:
-        numbers: A list of numbers to calculate the average from
+        numbers: A list or 1-D array of numbers to calculate the average from
 
     Returns:
         float: The calculated average of the input numbers
     """
-    total = 0
-    for n in numbers:
-        total +=n
     if len(numbers) == 0:
         return 0
-    return total / len(numbers)
+    # Arrays and Series average in C; summing them boxes every element
+    mean = getattr(numbers, "mean", None)
+    if mean is not None:
+        return float(mean())
+    return sum(numbers) / len(numbers)
 
 
 
@@ -58,8 +60,7 @@ class Processor:
         Returns:
             None: No return value is provided by this function
         """
-        for item in data:
-            if item is None:
-                continue
-            print(item)
+        lines = [str(item) for item in data if item is not None]
+        if lines:
+            sys.stdout.write("\n".join(lines) + "\n")
 
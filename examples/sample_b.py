@@ -7,8 +7,7 @@ def generator_example(n):
     :returns: None
     :rtype: None
     """
-    for i in range(n):
-        yield i
+    return iter(range(n))
 
 
 def raises_example(x):
@@ -2,30 +2,35 @@ import sqlite3
 
 # This will create employee.db in the same folder
 conn = sqlite3.connect("employee.db")
-cursor = conn.cursor()
 
-# Create departments table
-cursor.execute("""
-CREATE TABLE IF NOT EXISTS departments (
-    department_id INTEGER PRIMARY KEY,
-    department_name TEXT
-);
-""")
+# WAL commits with a single sync and lets readers run alongside a writer
+conn.execute("PRAGMA journal_mode=WAL")
+conn.execute("PRAGMA synchronous=NORMAL")
+conn.execute("PRAGMA foreign_keys=ON")
 
-# Create employees table
-cursor.execute("""
-CREATE TABLE IF NOT EXISTS employees (
-    emp_id INTEGER PRIMARY KEY AUTOINCREMENT,
-    emp_name TEXT NOT NULL,
-    age INTEGER,
-    salary INTEGER,
-    join_date TEXT,
-    department_id INTEGER,
-    FOREIGN KEY (department_id) REFERENCES departments(department_id)
-);
-""")
+# Create both tables and their indexes in one script; the with block commits it.
+# join_date holds ISO dates (YYYY-MM-DD), which sort and range-scan as text.
+with conn:
+    conn.executescript("""
+    CREATE TABLE IF NOT EXISTS departments (
+        department_id INTEGER PRIMARY KEY,
+        department_name TEXT
+    );
+
+    CREATE TABLE IF NOT EXISTS employees (
+        emp_id INTEGER PRIMARY KEY AUTOINCREMENT,
+        emp_name TEXT NOT NULL,
+        age INTEGER,
+        salary INTEGER,
+        join_date TEXT CHECK (join_date IS strftime('%Y-%m-%d', join_date)),
+        department_id INTEGER,
+        FOREIGN KEY (department_id) REFERENCES departments(department_id)
+    );
+
+    CREATE INDEX IF NOT EXISTS idx_employees_department_id ON employees(department_id);
+    CREATE INDEX IF NOT EXISTS idx_employees_join_date ON employees(join_date);
+    """)
 
-conn.commit()
 conn.close()
 
-print("employee.db created with tables")
\ No newline at end of file
+print("employee.db created with tables")
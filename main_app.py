@@ -19,13 +19,17 @@ import os
 import difflib
 import streamlit as st
 from core.parser.python_parser import parse_path
-from core.docstring_engine.generator import generate_google_docstring, generate_class_docstring
-from core.reporter.coverage_reporter import compute_coverage, write_report
-from core.validator.validator import validate_project
+from core.docstring_engine.generator import configure_cache, generate_all_styles, generate_all_styles_class
+from core.reporter.coverage_reporter import compute_coverage, dumps_report, write_report
+from core.validator.validator import configure_validation_cache, validate_project
 
 # Import dashboard module
 import dashboard
 
+# Reuse generated docstrings and validation results across scans and app restarts
+configure_cache(os.path.join("storage", "docstring_cache"))
+configure_validation_cache(os.path.join("storage", "validation_cache"))
+
 # Page config
 st.set_page_config(page_title="AI Code Reviewer", layout="wide", initial_sidebar_state="expanded")
 
@@ -756,12 +760,15 @@ with st.sidebar:
             with st.spinner("🔄 Scanning files..."):
                 try:
                     skip_dirs = ["__pycache__", "venv", ".git", ".venv", "node_modules"]
-                    results = parse_path(scan_path, recursive=True, skip_dirs=skip_dirs)
+                    # Parse in this process: a process pool would fork the multithreaded
+                    # Streamlit server, which can deadlock
+                    results = parse_path(scan_path, recursive=True, skip_dirs=skip_dirs, max_workers=1)
                     
                     if not results:
                         st.warning("⚠️ No Python files found.")
                     else:
                         st.session_state.scan_results = results
+                        dashboard.mark_scan_results_changed()
                         st.session_state.accepted_styles = {}
                         
                         # Generate docstrings for all styles for ALL functions
@@ -797,11 +804,7 @@ with st.sidebar:
                                     func["original_docstring"] = '"""\nNo docstring.\n"""'
                                 
                                 try:
-                                    func["suggested_docstrings"] = {
-                                        "google": generate_google_docstring(func, use_groq=True, style="google"),
-                                        "numpy": generate_google_docstring(func, use_groq=True, style="numpy"),
-                                        "rest": generate_google_docstring(func, use_groq=True, style="rest")
-                                    }
+                                    func["suggested_docstrings"] = generate_all_styles(func, use_groq=True)
                                 except Exception as e:
                                     st.warning(f"⚠️ Error generating for {func['name']}: {str(e)}")
                                     func["suggested_docstrings"] = {
@@ -824,11 +827,7 @@ with st.sidebar:
                                     cls["original_docstring"] = '"""\nNo docstring.\n"""'
                                 
                                 try:
-                                    cls["suggested_docstrings"] = {
-                                        "google": generate_class_docstring(cls, use_groq=True, style="google"),
-                                        "numpy": generate_class_docstring(cls, use_groq=True, style="numpy"),
-                                        "rest": generate_class_docstring(cls, use_groq=True, style="rest")
-                                    }
+                                    cls["suggested_docstrings"] = generate_all_styles_class(cls, use_groq=True)
                                 except Exception as e:
                                     st.warning(f"⚠️ Error generating class docstring for {cls['name']}: {str(e)}")
                                     cls["suggested_docstrings"] = {
@@ -853,11 +852,7 @@ with st.sidebar:
                                     method["class_name"] = cls["name"]
                                     
                                     try:
-                                        method["suggested_docstrings"] = {
-                                            "google": generate_google_docstring(method, use_groq=True, style="google"),
-                                            "numpy": generate_google_docstring(method, use_groq=True, style="numpy"),
-                                            "rest": generate_google_docstring(method, use_groq=True, style="rest")
-                                        }
+                                        method["suggested_docstrings"] = generate_all_styles(method, use_groq=True)
                                     except Exception as e:
                                         st.warning(f"⚠️ Error generating for {cls['name']}.{method['name']}: {str(e)}")
                                         method["suggested_docstrings"] = {
@@ -972,12 +967,15 @@ if st.session_state.view == "Home":
                 with st.spinner("🔄 Scanning files..."):
                     try:
                         skip_dirs = ["__pycache__", "venv", ".git", ".venv", "node_modules"]
-                        results = parse_path(home_scan_path, recursive=True, skip_dirs=skip_dirs)
+                        # Parse in this process: a process pool would fork the multithreaded
+                        # Streamlit server, which can deadlock
+                        results = parse_path(home_scan_path, recursive=True, skip_dirs=skip_dirs, max_workers=1)
                         
                         if not results:
                             st.warning("⚠️ No Python files found.")
                         else:
                             st.session_state.scan_results = results
+                            dashboard.mark_scan_results_changed()
                             st.session_state.accepted_styles = {}
                             
                             # Generate docstrings for all styles for ALL functions
@@ -1012,11 +1010,7 @@ if st.session_state.view == "Home":
                                         func["original_docstring"] = '"""\nNo docstring.\n"""'
                                     
                                     try:
-                                        func["suggested_docstrings"] = {
-                                            "google": generate_google_docstring(func, use_groq=True, style="google"),
-                                            "numpy": generate_google_docstring(func, use_groq=True, style="numpy"),
-                                            "rest": generate_google_docstring(func, use_groq=True, style="rest")
-                                        }
+                                        func["suggested_docstrings"] = generate_all_styles(func, use_groq=True)
                                     except Exception as e:
                                         st.warning(f"⚠️ Error generating for {func['name']}: {str(e)}")
                                         func["suggested_docstrings"] = {
@@ -1039,11 +1033,7 @@ if st.session_state.view == "Home":
                                         cls["original_docstring"] = '"""\nNo docstring.\n"""'
                                     
                                     try:
-                                        cls["suggested_docstrings"] = {
-                                            "google": generate_class_docstring(cls, use_groq=True, style="google"),
-                                            "numpy": generate_class_docstring(cls, use_groq=True, style="numpy"),
-                                            "rest": generate_class_docstring(cls, use_groq=True, style="rest")
-                                        }
+                                        cls["suggested_docstrings"] = generate_all_styles_class(cls, use_groq=True)
                                     except Exception as e:
                                         st.warning(f"⚠️ Error generating class docstring for {cls['name']}: {str(e)}")
                                         cls["suggested_docstrings"] = {
@@ -1068,11 +1058,7 @@ if st.session_state.view == "Home":
                                         method["class_name"] = cls["name"]
                                         
                                         try:
-                                            method["suggested_docstrings"] = {
-                                                "google": generate_google_docstring(method, use_groq=True, style="google"),
-                                                "numpy": generate_google_docstring(method, use_groq=True, style="numpy"),
-                                                "rest": generate_google_docstring(method, use_groq=True, style="rest")
-                                            }
+                                            method["suggested_docstrings"] = generate_all_styles(method, use_groq=True)
                                         except Exception as e:
                                             st.warning(f"⚠️ Error generating for {cls['name']}.{method['name']}: {str(e)}")
                                             method["suggested_docstrings"] = {
@@ -1493,6 +1479,7 @@ elif st.session_state.view == "Docstrings":
                                                 selected_func_data["original_docstring"] = docstring
                                                 selected_func_data["has_docstring"] = True
                                                 selected_func_data["docstring"] = docstring
+                                                dashboard.mark_scan_results_changed()
                                                 
                                                 for other_style in ["google", "numpy", "rest"]:
                                                     if other_style != style:
@@ -1687,7 +1674,7 @@ elif st.session_state.view == "Metrics":
         
         # Download button
         if st.button("📥 Download Metrics Data", use_container_width=True):
-            metrics_json = json.dumps(metrics_data, indent=2)
+            metrics_json = dumps_report(metrics_data)
             st.download_button(
                 label="💾 Save Metrics JSON",
                 data=metrics_json,
@@ -1869,7 +1856,7 @@ elif st.session_state.view == "Validation":
         # Download button
         st.markdown("---")
         if st.button("📥 Download Validation Report", use_container_width=True):
-            report_json = json.dumps(validation_report, indent=2)
+            report_json = dumps_report(validation_report)
             st.download_button(
                 label="💾 Save Validation JSON",
                 data=report_json,
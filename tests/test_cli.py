@@ -0,0 +1,147 @@
+# tests/test_cli.py
+
+"""Tests for the CLI scan command."""
+
+import argparse
+import json
+import os
+import threading
+import time
+
+import pytest
+
+from cli import commands
+from core.docstring_engine import generator
+
+
+def _scan_args(tmp_path, **overrides):
+    """Build the argparse namespace `main` would pass to cmd_scan."""
+    args = {
+        "path": "examples",
+        "out": str(tmp_path / "reports" / "review_logs.json"),
+        "generate_docs": False,
+        "cache_dir": str(tmp_path / "cache"),
+        "no_cache": True,
+        "concurrency": 4,
+        "requests_per_second": None,
+        "styles": commands.STYLES,
+        "parse_cache_dir": str(tmp_path / "parse_cache"),
+        "no_parse_cache": True,
+        "jobs": 1,
+    }
+    args.update(overrides)
+    return argparse.Namespace(**args)
+
+
+def test_cmd_scan_writes_coverage_report(tmp_path):
+    """Test that a plain scan writes parsed results and coverage."""
+    args = _scan_args(tmp_path)
+
+    commands.cmd_scan(args)
+
+    with open(args.out, 'r', encoding='utf-8') as f:
+        report = json.load(f)
+    assert set(report) == {"parsed_results", "coverage"}
+    assert report["coverage"]["total_functions"] > 0
+    assert not os.path.exists(args.out + ".partial")
+
+
+def test_cmd_scan_saves_coverage_before_generating_docs(tmp_path, monkeypatch):
+    """Test that coverage is on disk before the LLM step and docstrings are added after."""
+    args = _scan_args(tmp_path, generate_docs=True)
+    seen_before_generation = {}
+
+    def fake_attach(results, concurrency=16, on_progress=None, styles=commands.STYLES):
+        with open(args.out, 'r', encoding='utf-8') as f:
+            seen_before_generation.update(json.load(f))
+        for file_result in results:
+            for func in file_result.get("functions", []):
+                func["suggested_docstrings"] = {"google": '"""\nDoc.\n"""'}
+        on_progress()
+
+    monkeypatch.setattr(commands, "_attach_generated_docstrings", fake_attach)
+
+    commands.cmd_scan(args)
+
+    assert "coverage" in seen_before_generation
+    with open(args.out, 'r', encoding='utf-8') as f:
+        report = json.load(f)
+    funcs = [func for file_result in report["parsed_results"] for func in file_result["functions"]]
+    assert funcs and all("suggested_docstrings" in func for func in funcs)
+
+
+def test_cmd_scan_accepts_bare_output_filename(tmp_path, monkeypatch):
+    """Test that an --out without a directory part is written to the working directory."""
+    args = _scan_args(tmp_path, path=os.path.abspath("examples"), out="report.json")
+    monkeypatch.chdir(tmp_path)
+
+    commands.cmd_scan(args)
+
+    assert (tmp_path / "report.json").exists()
+
+
+def test_parse_styles():
+    """Test parsing and validation of the --styles flag."""
+    assert commands._parse_styles("google") == ("google",)
+    assert commands._parse_styles(" NumPy, rest,numpy ") == ("numpy", "rest")
+    with pytest.raises(argparse.ArgumentTypeError):
+        commands._parse_styles("google,epydoc")
+    with pytest.raises(argparse.ArgumentTypeError):
+        commands._parse_styles(",")
+
+
+def test_cmd_scan_enables_docstring_cache_unless_disabled(tmp_path, monkeypatch):
+    """Test that the docstring cache is off by default and turned on by the CLI."""
+    assert generator._cache_dir is None
+    monkeypatch.setattr(generator, "_cache_dir", None)
+    seen = []
+    monkeypatch.setattr(commands, "_attach_generated_docstrings",
+                        lambda results, **kwargs: seen.append(generator._cache_dir))
+
+    commands.cmd_scan(_scan_args(tmp_path, generate_docs=True, no_cache=False))
+    commands.cmd_scan(_scan_args(tmp_path, generate_docs=True, no_cache=True))
+
+    assert seen == [str(tmp_path / "cache"), None]
+
+
+@pytest.mark.parametrize("concurrency", [1, 2, 5, 16])
+def test_attach_generated_docstrings_shares_the_concurrency_budget(monkeypatch, concurrency):
+    """Test that functions and classes together never exceed --concurrency LLM calls."""
+    lock = threading.Lock()
+    in_flight = [0]
+    peak = [0]
+
+    def fake_batch(metas, kind="function", max_concurrency=16, styles=commands.STYLES):
+        with lock:
+            in_flight[0] += max_concurrency
+            peak[0] = max(peak[0], in_flight[0])
+        time.sleep(0.05)
+        with lock:
+            in_flight[0] -= max_concurrency
+        return [{"google": '"""\nDoc.\n"""'} for _ in metas]
+
+    monkeypatch.setattr(commands, "generate_docstrings_batch", fake_batch)
+    results = [{"functions": [{"name": "f"}], "classes": [{"name": "C", "methods": []}]}]
+
+    commands._attach_generated_docstrings(results, concurrency=concurrency)
+
+    assert peak[0] <= concurrency
+    assert "suggested_docstrings" in results[0]["functions"][0]
+    assert "suggested_docstrings" in results[0]["classes"][0]
+
+
+def test_attach_generated_docstrings_gives_a_lone_batch_the_whole_budget(monkeypatch):
+    """Test that an empty kind is not submitted and the other kind gets all of --concurrency."""
+    calls = []
+
+    def fake_batch(metas, kind="function", max_concurrency=16, styles=commands.STYLES):
+        calls.append((kind, max_concurrency))
+        return [{"google": '"""\nDoc.\n"""'} for _ in metas]
+
+    monkeypatch.setattr(commands, "generate_docstrings_batch", fake_batch)
+
+    commands._attach_generated_docstrings([{"functions": [{"name": "f"}], "classes": []}], concurrency=16)
+    commands._attach_generated_docstrings([{"functions": [], "classes": [{"name": "C", "methods": []}]}],
+                                          concurrency=16)
+
+    assert calls == [("function", 16), ("class", 16)]
@@ -2,7 +2,7 @@
 
 """Tests for coverage reporter."""
 
-from core.reporter.coverage_reporter import compute_coverage, write_report
+from core.reporter.coverage_reporter import compute_coverage, dumps_report, write_report, _percentage
 from core.parser.python_parser import parse_path
 import json
 import os
@@ -141,4 +141,36 @@ def test_function_count_consistency():
     
     # Sum of all file parsed counts should equal total parsed
     file_parsed = sum(f["parsed_functions"] for f in report["files"])
-    assert report["successfully_parsed"] == file_parsed
\ No newline at end of file
+    assert report["successfully_parsed"] == file_parsed
+
+def test_write_report_streams_parsed_results(tmp_path):
+    """Test that streamed reports round-trip lists, nested values and unicode."""
+    parsed = parse_path("examples")
+    report = {"parsed_results": parsed, "coverage": compute_coverage(parsed), "notes": [], "title": "Café ✓"}
+    out_path = tmp_path / "report.json"
+    
+    write_report(report, str(out_path))
+    
+    with open(out_path, 'r', encoding='utf-8') as f:
+        assert json.load(f) == report
+    assert "Café ✓" in out_path.read_text(encoding='utf-8')
+
+
+def test_dumps_report():
+    """Test that dumps_report produces indented JSON and accepts non-string keys."""
+    report = {"summary": {"total": 2}, "by_line": {10: "D103"}, "name": "café"}
+    
+    encoded = dumps_report(report)
+    
+    assert encoded.startswith(b"{\n  ")
+    assert json.loads(encoded) == {"summary": {"total": 2}, "by_line": {"10": "D103"}, "name": "café"}
+
+
+def test_percentage_rounding():
+    """Test integer-math percentages: 2 decimals, exact ties rounded half to even."""
+    assert _percentage(0, 0) == 0.0
+    assert _percentage(3, 3) == 100.0
+    assert _percentage(2, 3) == 66.67
+    assert _percentage(1, 3) == 33.33
+    assert _percentage(23, 160) == 14.38  # exactly 14.375
+    assert _percentage(49, 160) == 30.62  # exactly 30.625
@@ -6,17 +6,38 @@ import pytest
 from unittest.mock import MagicMock, patch, mock_open
 import streamlit as st
 import json
+import os
+import dashboard
 from dashboard import (
     render_feature_cards,
     render_filters_view,
     render_search_view,
     render_export_view,
     render_help_view,
-    render_tests_view,
     load_test_results,
     run_pytest_tests
 )
 
+# st.fragment only calls the view inside a Streamlit script run
+render_tests_view = dashboard.render_tests_view.__wrapped__
+
+
+@pytest.fixture(autouse=True)
+def _fresh_test_results_cache():
+    """Don't let one test see a report parsed by another."""
+    dashboard._load_test_results_cached.clear()
+    yield
+    dashboard._load_test_results_cached.clear()
+
+
+@pytest.fixture(autouse=True)
+def _no_report_split(monkeypatch):
+    """Keep mocked test runs from rewriting the local pytest report or history."""
+    split = MagicMock()
+    monkeypatch.setattr(dashboard, "split_report", split)
+    monkeypatch.setattr(dashboard, "record_run", MagicMock())
+    return split
+
 
 @pytest.fixture
 def mock_streamlit_state():
@@ -27,6 +48,8 @@ def mock_streamlit_state():
     st.session_state.scan_results = []
     st.session_state.tests_have_run = False
     st.session_state.test_running = False
+    st.session_state.pop("scan_results_version", None)
+    st.session_state.pop("scan_results_frame", None)
     st.session_state.report = {
         'total_functions': 10,
         'documented_functions': 5,
@@ -96,8 +119,7 @@ def test_render_feature_cards(mock_streamlit_state, monkeypatch):
     """Test that feature cards render without errors."""
     # Mock streamlit functions
     monkeypatch.setattr(st, "subheader", MagicMock())
-    monkeypatch.setattr(st, "columns", MagicMock(return_value=[MagicMock()] * 5))
-    monkeypatch.setattr(st, "button", MagicMock(return_value=False))
+    monkeypatch.setattr(st, "segmented_control", MagicMock())
     monkeypatch.setattr(st, "divider", MagicMock())
     
     # Should not raise any exceptions
@@ -106,6 +128,20 @@ def test_render_feature_cards(mock_streamlit_state, monkeypatch):
         assert True
     except Exception as e:
         pytest.fail(f"render_feature_cards raised an exception: {e}")
+    
+    assert st.segmented_control.call_args.kwargs["default"] == "filters"
+
+
+def test_dashboard_nav_switches_and_keeps_view(mock_streamlit_state):
+    """Test the nav callback switches views and ignores deselection."""
+    st.session_state.dashboard_nav = "tests"
+    dashboard._select_dashboard_view()
+    assert st.session_state.dashboard_view == "tests"
+    
+    st.session_state.dashboard_nav = None
+    dashboard._select_dashboard_view()
+    assert st.session_state.dashboard_view == "tests"
+    assert st.session_state.dashboard_nav == "tests"
 
 
 def test_load_test_results_file_exists(sample_test_results, monkeypatch):
@@ -124,17 +160,39 @@ def test_load_test_results_file_exists(sample_test_results, monkeypatch):
 
 def test_load_test_results_file_not_exists(monkeypatch):
     """Test loading test results when file doesn't exist."""
-    with patch('os.path.exists', return_value=False):
+    with patch('os.stat', side_effect=FileNotFoundError):
         results = load_test_results()
         assert results is None
 
 
+def test_load_test_results_reparses_only_when_file_changes(tmp_path, sample_test_results):
+    """Test that the parsed report is reused until the file is rewritten."""
+    report = tmp_path / "pytest_results.json"
+    report.write_text(json.dumps(sample_test_results), encoding="utf-8")
+    
+    first = load_test_results(str(report))
+    with patch('builtins.open', side_effect=AssertionError("report re-read")):
+        assert load_test_results(str(report)) == first
+    
+    sample_test_results["summary"]["total"] = 11
+    report.write_text(json.dumps(sample_test_results) + "\n", encoding="utf-8")
+    assert load_test_results(str(report))['summary']['total'] == 11
+
+
+def _piped_process(output, returncode):
+    """Build a fake Popen whose stdout is a real pipe holding `output`."""
+    read_fd, write_fd = os.pipe()
+    os.write(write_fd, output)
+    os.close(write_fd)
+    mock_process = MagicMock()
+    mock_process.stdout = os.fdopen(read_fd, "rb")
+    mock_process.returncode = returncode
+    return mock_process
+
+
 def test_run_pytest_tests_success(monkeypatch):
     """Test running pytest tests successfully."""
-    mock_process = MagicMock()
-    mock_process.stdout = iter(["test output line 1\n", "test output line 2\n"])
-    mock_process.returncode = 0
-    mock_process.wait = MagicMock()
+    mock_process = _piped_process(b"test output line 1\ntest output line 2\n", 0)
     
     with patch('subprocess.Popen', return_value=mock_process):
         with patch('os.makedirs'):
@@ -142,15 +200,12 @@ def test_run_pytest_tests_success(monkeypatch):
             
             assert success is True
             assert all_passed is True
-            assert len(output_lines) == 2
+            assert "".join(output_lines) == "test output line 1\ntest output line 2\n"
 
 
 def test_run_pytest_tests_failure(monkeypatch):
     """Test running pytest tests with failures."""
-    mock_process = MagicMock()
-    mock_process.stdout = iter(["test failed\n"])
-    mock_process.returncode = 1
-    mock_process.wait = MagicMock()
+    mock_process = _piped_process(b"test failed\n", 1)
     
     with patch('subprocess.Popen', return_value=mock_process):
         with patch('os.makedirs'):
@@ -158,7 +213,54 @@ def test_run_pytest_tests_failure(monkeypatch):
             
             assert success is True
             assert all_passed is False
-            assert len(output_lines) == 1
+            assert "".join(output_lines) == "test failed\n"
+
+
+def test_run_pytest_tests_splits_the_new_report(_no_report_split):
+    """Test that a finished run splits the report it wrote."""
+    mock_process = _piped_process(b"", 0)
+    
+    with patch('subprocess.Popen', return_value=mock_process):
+        with patch('os.makedirs'):
+            with patch('os.path.exists', return_value=True):
+                run_pytest_tests()
+    
+    _no_report_split.assert_called_once_with("storage/reports/pytest_results.json")
+
+
+def test_load_test_results_uses_stored_tallies(tmp_path):
+    """Test that a split report's by_file is used without a tests list."""
+    report = tmp_path / "pytest_results.json"
+    by_file = {"test_cli.py": {"passed": 3, "failed": 1, "skipped": 0, "total": 4}}
+    report.write_text(json.dumps({"summary": {"total": 4}, "by_file": by_file}), encoding="utf-8")
+    
+    assert load_test_results(str(report)) == {"summary": {"total": 4}, "by_file": by_file}
+
+
+def test_run_pytest_tests_streams_partial_output():
+    """Test that output without a trailing newline reaches the callback."""
+    mock_process = _piped_process("collecting ... \u2705".encode("utf-8"), 0)
+    seen = []
+    
+    with patch('subprocess.Popen', return_value=mock_process):
+        with patch('os.makedirs'):
+            run_pytest_tests(on_output=seen.append)
+    
+    assert seen[-1] == "collecting ... \u2705"
+
+
+def test_run_pytest_tests_uses_xdist_only_when_available(monkeypatch):
+    """Test that -n auto is passed only when pytest-xdist can be imported."""
+    monkeypatch.setattr(dashboard.os, "cpu_count", lambda: 4)
+    for xdist_spec, expected in ((object(), True), (None, False)):
+        mock_process = _piped_process(b"", 0)
+        with patch('importlib.util.find_spec', return_value=xdist_spec):
+            with patch('subprocess.Popen', return_value=mock_process) as popen:
+                with patch('os.makedirs'):
+                    run_pytest_tests()
+        argv = popen.call_args.args[0]
+        assert ("-n" in argv) is expected
+        assert argv[-1] == "tests/"
 
 
 def test_run_pytest_tests_exception(monkeypatch):
@@ -196,14 +298,16 @@ def test_render_tests_view_no_tests_run(mock_streamlit_state, monkeypatch):
     monkeypatch.setattr(st, "info", MagicMock())
     monkeypatch.setattr(st, "rerun", MagicMock())
     
-    # Mock os.path.exists to return False (no test results file)
-    with patch('os.path.exists', return_value=False):
+    # Mock os.stat to raise (no test results file)
+    with patch('os.stat', side_effect=FileNotFoundError):
         # Should not raise any exceptions and should return early
         try:
             render_tests_view()
             assert True
         except Exception as e:
             pytest.fail(f"render_tests_view raised an exception: {e}")
+    
+    assert any("No Test Results Found" in c.args[0] for c in st.markdown.call_args_list)
 
 
 def test_render_tests_view_with_results(mock_streamlit_state, sample_test_results, monkeypatch):
@@ -230,6 +334,72 @@ def test_render_tests_view_with_results(mock_streamlit_state, sample_test_result
                 assert True
             except Exception as e:
                 pytest.fail(f"render_tests_view raised an exception: {e}")
+    
+    suite_calls = [c for c in st.markdown.call_args_list if " passed" in c.args[0]]
+    assert len(suite_calls) == 1
+    assert "Parser" in suite_calls[0].args[0] and "Generator" in suite_calls[0].args[0]
+
+
+def test_build_results_figure_is_reused_until_tallies_change():
+    """Test that the chart is built once per distinct set of tallies."""
+    pytest.importorskip("plotly")
+    by_file = {"test_parser.py": {"passed": 2, "failed": 0, "skipped": 0, "total": 2}}
+    dashboard._build_results_figure.clear()
+    
+    fig = dashboard._build_results_figure(by_file)
+    
+    assert dashboard._build_results_figure(dict(by_file)) is fig
+    changed = {"test_parser.py": {"passed": 1, "failed": 1, "skipped": 0, "total": 2}}
+    assert dashboard._build_results_figure(changed) is not fig
+
+
+def test_render_tests_view_run_shows_results_without_rerun(mock_streamlit_state, sample_test_results, monkeypatch):
+    """Test that a run draws the fresh results in the same pass."""
+    mock_file = mock_open(read_data=json.dumps(sample_test_results))
+    monkeypatch.setattr(st, "markdown", MagicMock())
+    monkeypatch.setattr(st, "columns", lambda spec: [MagicMock() for _ in (spec if isinstance(spec, list) else range(spec))])
+    monkeypatch.setattr(st, "button", MagicMock(return_value=True))
+    monkeypatch.setattr(st, "spinner", MagicMock())
+    monkeypatch.setattr(st, "empty", MagicMock())
+    monkeypatch.setattr(st, "success", MagicMock())
+    monkeypatch.setattr(st, "metric", MagicMock())
+    monkeypatch.setattr(st, "rerun", MagicMock())
+    monkeypatch.setattr(dashboard, "run_pytest_tests", MagicMock(return_value=(True, True, ["ok\n"])))
+    
+    with patch('builtins.open', mock_file):
+        render_tests_view()
+    
+    st.rerun.assert_not_called()
+    assert st.session_state.test_running is False
+    assert ("🧪 Total Tests", 10) in [c.args for c in st.metric.call_args_list]
+
+
+def test_scan_results_frame_is_reused_until_marked_changed(mock_streamlit_state, sample_scan_results):
+    """Test that the session's frame is rebuilt only after a change is marked."""
+    st.session_state.scan_results = sample_scan_results
+    dashboard.mark_scan_results_changed()
+    
+    first = dashboard._scan_results_frame()
+    assert dashboard._scan_results_frame() is first
+    
+    sample_scan_results[0]["functions"][1]["has_docstring"] = True
+    dashboard.mark_scan_results_changed()
+    
+    assert dashboard._scan_results_frame()["Docstring"].tolist()[:2] == [True, True]
+
+
+def test_flatten_scan_results(sample_scan_results):
+    """Test that functions and methods become one row each, in scan order."""
+    df = dashboard._flatten_scan_results(sample_scan_results)
+    
+    assert list(df.columns) == ["File", "Function", "Docstring", "Complexity"]
+    assert list(df["Function"]) == [
+        "test_function", "undocumented_func", "TestClass.method_one",
+        "TestClass.method_two", "calculate", "process"
+    ]
+    assert list(df["Docstring"]) == [True, False, True, False, True, False]
+    assert list(df["Complexity"]) == [5, 2, 3, 1, 8, 4]
+    assert dashboard._flatten_scan_results([]).empty
 
 
 def test_render_filters_view_all_functions(mock_streamlit_state, sample_scan_results, monkeypatch):
@@ -357,6 +527,9 @@ def test_render_search_view_with_query(mock_streamlit_state, sample_scan_results
         assert len(all_functions) == 1  # test_function
     except Exception as e:
         pytest.fail(f"render_search_view raised an exception: {e}")
+    
+    shown = st.dataframe.call_args.args[0]
+    assert shown["Function"].tolist() == ["test_function"]
 
 
 def test_render_export_view(mock_streamlit_state, sample_scan_results, monkeypatch):
@@ -367,6 +540,7 @@ def test_render_export_view(mock_streamlit_state, sample_scan_results, monkeypat
     monkeypatch.setattr(st, "subheader", MagicMock())
     monkeypatch.setattr(st, "markdown", MagicMock())
     monkeypatch.setattr(st, "columns", MagicMock(return_value=[MagicMock(), MagicMock(), MagicMock()]))
+    monkeypatch.setattr(st, "metric", MagicMock())
     monkeypatch.setattr(st, "download_button", MagicMock())
     monkeypatch.setattr(st, "dataframe", MagicMock())
     monkeypatch.setattr(st, "info", MagicMock())
@@ -377,6 +551,15 @@ def test_render_export_view(mock_streamlit_state, sample_scan_results, monkeypat
         assert True
     except Exception as e:
         pytest.fail(f"render_export_view raised an exception: {e}")
+    
+    assert [c.args for c in st.metric.call_args_list] == [
+        ("Total Functions", 6), ("Documented", 3), ("Missing", 3)
+    ]
+    downloads = {c.kwargs["key"]: c.kwargs["data"] for c in st.download_button.call_args_list}
+    csv_lines = downloads["csv_download"].splitlines()
+    assert csv_lines[0] == "File,Function,Has Docstring,Complexity"
+    assert "test_file.py,TestClass.method_two,No,1" in csv_lines
+    assert len(csv_lines) == 7
 
 
 def test_render_export_view_csv_data(mock_streamlit_state, sample_scan_results):
@@ -427,6 +610,16 @@ def test_render_help_view(mock_streamlit_state, monkeypatch):
         assert True
     except Exception as e:
         pytest.fail(f"render_help_view raised an exception: {e}")
+    
+    texts = [c.args[0] for c in st.markdown.call_args_list]
+    left_column = next(t for t in texts if "Project Scanning" in t)
+    assert "Review &amp; Apply Workflow" in left_column and "Coverage Tracking" in left_column
+    assert "\n" not in left_column and "> <" not in left_column
+
+    # Section rules and headers ride along with the neighbouring markdown
+    assert not any(t.strip() == "---" for t in texts)
+    intro = texts[0]
+    assert "<style>" in intro and "Complete Usage Guide" in intro and "### 🎯 Core Features" in intro
 
 
 def test_function_collection_logic(sample_scan_results):
@@ -3,14 +3,51 @@
 
 import os
 import pytest
+from collections import OrderedDict
+from core.docstring_engine import generator
 from core.docstring_engine.generator import (
     generate_google_docstring, 
     generate_all_styles,
+    generate_docstrings_batch,
     _generate_fallback_docstring
 )
 from core.parser.python_parser import parse_path
 
 
+@pytest.fixture(autouse=True)
+def _fresh_memo(monkeypatch):
+    """Give every test its own in-process docstring memo."""
+    monkeypatch.setattr(generator, "_memo", OrderedDict())
+
+
+class FakeChain:
+    """Stand-in for the LLM chain that records its inputs and answers with `respond`."""
+
+    def __init__(self):
+        self.respond = lambda chain_input: "Summary."
+        self.inputs = []
+        self.batch_sizes = []
+
+    def invoke(self, chain_input):
+        self.inputs.append(chain_input)
+        return self.respond(chain_input)
+
+    def batch(self, inputs, config=None, return_exceptions=False):
+        self.inputs.extend(inputs)
+        self.batch_sizes.append(len(inputs))
+        return [self.respond(chain_input) for chain_input in inputs]
+
+
+@pytest.fixture
+def fake_chain(monkeypatch):
+    """Route generation through a FakeChain with an API key set and the disk cache off."""
+    chain = FakeChain()
+    monkeypatch.setattr(generator, "_GROQ_API_KEY", "test-key")
+    monkeypatch.setattr(generator, "_get_chain", lambda kind="function": chain)
+    monkeypatch.setattr(generator, "_cache_dir", None)
+    return chain
+
+
 def test_generate_google_docstring_with_groq():
     """Test Google-style docstring generation with Groq."""
     fn = {
@@ -369,4 +406,188 @@ def test_multiple_arguments_formatting():
     assert "arg3" in doc
     assert "int" in doc
     assert "str" in doc
-    assert "list" in doc
\ No newline at end of file
+    assert "list" in doc
+
+
+def test_generate_docstrings_batch_single_round_trip(fake_chain):
+    """Test that batched generation answers every style and falls back per item."""
+    fake_chain.respond = lambda item: (
+        RuntimeError("LLM failure") if "'broken'" in item["prompt_text"] else "Summary line."
+    )
+
+    metas = [
+        {"name": "ok", "args": [], "returns": None, "raises": []},
+        {"name": "broken", "args": [{"name": "x", "annotation": "int"}], "returns": "int", "raises": []}
+    ]
+    results = generate_docstrings_batch(metas)
+
+    assert fake_chain.batch_sizes == [6]
+    assert results[0]["google"] == '"""\nSummary line.\n"""'
+    assert set(results[1]) == {"google", "numpy", "rest"}
+    assert results[1]["numpy"] == _generate_fallback_docstring(metas[1], "numpy")
+
+
+def test_generate_docstrings_batch_uses_persistent_cache(fake_chain, monkeypatch, tmp_path):
+    """Test that a second run over unchanged functions makes no LLM calls."""
+    fake_chain.respond = lambda item: "Cached summary."
+    monkeypatch.setattr(generator, "_cache_dir", str(tmp_path))
+
+    fn = {"name": "add", "args": [{"name": "a", "annotation": "int"}], "returns": "int", "raises": []}
+    first = generate_docstrings_batch([fn])
+    second = generate_docstrings_batch([dict(fn)])
+
+    assert fake_chain.batch_sizes == [3]
+    assert first == second
+    assert second[0]["rest"] == '"""\nCached summary.\n"""'
+
+
+def test_single_docstring_uses_shared_chain_and_skips_caching_fallbacks(fake_chain, monkeypatch, tmp_path):
+    """Test that single calls reuse one chain and never cache template fallbacks."""
+    fake_chain.respond = lambda item: generator._template_fallback(dict(item, error=RuntimeError("LLM failure")))
+    monkeypatch.setattr(generator, "_cache_dir", str(tmp_path))
+
+    fn = {"name": "add", "args": [{"name": "a", "annotation": "int"}], "returns": "int", "raises": []}
+    first = generate_google_docstring(fn, use_groq=True, style="numpy")
+    second = generate_google_docstring(fn, use_groq=True, style="numpy")
+
+    assert first == second == _generate_fallback_docstring(fn, "numpy")
+    assert len(fake_chain.inputs) == 2
+    assert fake_chain.inputs[0]["meta"] is fn
+    assert fake_chain.inputs[0]["style"] == "numpy"
+
+
+def test_generator_import_does_not_load_langchain():
+    """Test that LangChain is only imported once a chain is actually needed."""
+    import subprocess
+    import sys
+    
+    code = (
+        "import sys; import core.docstring_engine.generator as g; "
+        "g.generate_all_styles({'name': 'f', 'args': [], 'returns': None, 'raises': []}, use_groq=False); "
+        "print(any(m.startswith('langchain') for m in sys.modules))"
+    )
+    out = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, check=True)
+    
+    assert out.stdout.strip().splitlines()[-1] == "False"
+
+
+def test_missing_api_key_is_logged(monkeypatch, caplog):
+    """Test that generator diagnostics go through logging instead of stdout."""
+    monkeypatch.setattr(generator, "_GROQ_API_KEY", None)
+    fn = {"name": "f", "args": [], "returns": None, "raises": []}
+    
+    with caplog.at_level("WARNING", logger="core.docstring_engine.generator"):
+        doc = generate_google_docstring(fn, use_groq=True, style="google")
+    
+    assert doc == _generate_fallback_docstring(fn, "google")
+    assert "GROQ_API_KEY not found" in caplog.text
+
+
+def test_fallback_none_return_has_no_dangling_blank_line():
+    """Test that a '-> None' function without args gets a tidy template docstring."""
+    fn = {"name": "reset", "args": [{"name": "self", "annotation": None}], "returns": "None", "raises": ["KeyError"]}
+    
+    assert _generate_fallback_docstring({**fn, "raises": []}, "numpy") == '"""\nShort description of `reset`.\n"""'
+    assert _generate_fallback_docstring(fn, "google") == (
+        '"""\nShort description of `reset`.\n\nRaises:\n    KeyError: Description of when KeyError is raised.\n"""'
+    )
+
+
+def test_generate_docstrings_batch_coalesces_identical_signatures(fake_chain):
+    """Test that duplicate signatures share one request and are memoized in-process."""
+    fake_chain.respond = lambda item: "Getter."
+
+    getter = {"name": "get_value", "args": [{"name": "self", "annotation": None}], "returns": "int", "raises": []}
+    first = generate_docstrings_batch([getter, dict(getter), dict(getter)])
+    second = generate_docstrings_batch([dict(getter)])
+
+    assert fake_chain.batch_sizes == [3]
+    assert first[0] == first[2] == second[0]
+    assert generate_google_docstring(dict(getter), style="rest") == '"""\nGetter.\n"""'
+
+
+def test_generate_docstrings_batch_only_requested_styles(fake_chain):
+    """Test that only the requested styles are sent to the LLM and returned."""
+
+    fn = {"name": "add", "args": [], "returns": "int", "raises": []}
+    docs = generate_all_styles(fn, styles=("numpy",))
+
+    assert [item["style"] for item in fake_chain.inputs] == ["numpy"]
+    assert docs == {"numpy": '"""\nSummary.\n"""'}
+    assert set(generate_all_styles(fn, use_groq=False, styles=("rest", "google"))) == {"rest", "google"}
+
+
+def test_persistent_rate_limit_halves_shared_request_rate(monkeypatch):
+    """Test that a 429 surviving the SDK retries throttles the shared token bucket."""
+    class RateLimited(Exception):
+        status_code = 429
+
+    generator.configure_rate_limit(4)
+    try:
+        generator._slow_down_on_rate_limit(RuntimeError("boom"))
+        assert generator._rate_limiter.requests_per_second == 4
+        generator._slow_down_on_rate_limit(RateLimited("Too Many Requests"))
+        assert generator._rate_limiter.requests_per_second == 2
+    finally:
+        generator.configure_rate_limit(None)
+
+
+def test_generate_docstrings_batch_empty_response_falls_back(fake_chain, monkeypatch, tmp_path):
+    """Test that blank LLM output is replaced by the template and never cached."""
+    fake_chain.respond = lambda item: "   "
+    monkeypatch.setattr(generator, "_cache_dir", str(tmp_path))
+
+    fn = {"name": "add", "args": [], "returns": "int", "raises": []}
+    docs = generate_docstrings_batch([fn], styles=("google",))
+
+    assert docs == [{"google": _generate_fallback_docstring(fn, "google")}]
+    assert generator._cache_get([generator._cache_key(fn, "google")]) == {}
+
+
+def test_system_prompt_is_shared_across_functions():
+    """Test that static instructions live in a per-style system prompt, not the per-call text."""
+    fn_a = {"name": "add", "args": [{"name": "a", "annotation": "int"}], "returns": "int", "raises": []}
+    fn_b = {"name": "load", "args": [], "returns": None, "raises": ["IOError"], "docstring": "Load data."}
+    
+    input_a = generator._chain_input(fn_a, "numpy")
+    input_b = generator._chain_input(fn_b, "numpy")
+    
+    assert input_a["system_prompt"] == input_b["system_prompt"]
+    assert "Example NumPy style" in input_a["system_prompt"]
+    assert "Requirements:" not in input_a["prompt_text"]
+    assert "'add'" in input_a["prompt_text"] and "Load data." in input_b["prompt_text"]
+    assert generator._chain_input(fn_a, "rest")["system_prompt"] != input_a["system_prompt"]
+
+
+def test_existing_docstring_context_is_clipped():
+    """Test that long existing docstrings are truncated before being sent as context."""
+    essay = "Legacy documentation sentence. " * 200
+    fn = {"name": "legacy", "args": [], "returns": None, "raises": [], "docstring": essay}
+    
+    prompt = generator._build_prompt(fn, "google")
+    
+    assert len(prompt) < len(essay)
+    assert prompt.count("Legacy documentation sentence.") < 30
+    assert " ...\n" in prompt
+    assert generator._clip("short docstring") == "short docstring"
+    assert len(generator._clip(essay)) <= generator._EXISTING_DOC_MAX_CHARS + 4
+
+
+def test_cache_key_ignores_dict_order_and_tracks_signature():
+    """Test that cache keys are canonical and change with the signature."""
+    fn = {"name": "add", "args": [{"name": "a", "annotation": "int"}], "returns": "int", "raises": []}
+    reordered = {"raises": [], "returns": "int", "args": [{"annotation": "int", "name": "a"}], "name": "add"}
+    
+    assert generator._cache_key(fn, "google") == generator._cache_key(reordered, "google")
+    assert generator._cache_key(fn, "google") != generator._cache_key({**fn, "returns": "float"}, "google")
+    assert generator._cache_key(fn, "google") != generator._cache_key(fn, "numpy")
+
+
+def test_refresh_api_key_rereads_environment(monkeypatch):
+    """Test that the cached API key only changes when refresh_api_key is called."""
+    monkeypatch.setattr(generator, "_GROQ_API_KEY", None)
+    monkeypatch.setenv("GROQ_API_KEY", "new-key")
+    
+    assert generator._GROQ_API_KEY is None
+    assert generator.refresh_api_key() == "new-key"
+    assert generator._GROQ_API_KEY == "new-key"
@@ -6,6 +6,7 @@ Test file for python_parser.py
 
 import os
 import pytest
+from core.parser import python_parser
 from core.parser.python_parser import (
     parse_path,
     parse_file,
@@ -19,9 +20,18 @@ from core.parser.python_parser import (
     _max_nesting_depth,
     _has_docstring
 )
+
 import ast
 
 
+@pytest.fixture(autouse=True)
+def _fresh_parse_memo():
+    """Keep parse results memoized by one test from leaking into the next."""
+    python_parser.clear_parse_memo()
+    yield
+    python_parser.clear_parse_memo()
+
+
 def test_parse_path_returns_list():
     """Test that parse_path returns a list."""
     results = parse_path("examples")
@@ -451,4 +461,270 @@ def test_file_paths_are_valid():
 
 
 if __name__ == "__main__":
-    pytest.main([__file__, "-v"])
\ No newline at end of file
+    pytest.main([__file__, "-v"])
+
+def test_parse_cache_reuses_unchanged_files(tmp_path, monkeypatch):
+    """Test that cached parse results are reused until a file's mtime or size changes."""
+    source_dir = tmp_path / "src"
+    source_dir.mkdir()
+    module = source_dir / "mod.py"
+    module.write_text("def first(a: int) -> int:\n    return a\n", encoding="utf-8")
+    monkeypatch.setattr(python_parser, "_parse_cache_dir", str(tmp_path / "cache"))
+    
+    calls = []
+    real_parse_source = python_parser._parse_source
+    monkeypatch.setattr(python_parser, "_parse_source", lambda path, src: calls.append(path) or real_parse_source(path, src))
+    
+    first = parse_path(str(source_dir))
+    second = parse_path(str(source_dir))
+    assert len(calls) == 1
+    assert first == second
+    
+    module.write_text("def first(a: int) -> int:\n    return a\n\n\ndef second():\n    pass\n", encoding="utf-8")
+    third = parse_path(str(source_dir))
+    assert len(calls) == 2
+    assert [f["name"] for f in third[0]["functions"]] == ["first", "second"]
+
+
+def test_parse_cache_reuses_results_for_identical_content(tmp_path, monkeypatch):
+    """Test that a file with new mtime but known content is served from the content cache."""
+    source = "import os\n\n\nclass Box:\n    def get(self) -> int:\n        return 1\n"
+    original = tmp_path / "a" / "box.py"
+    copy = tmp_path / "b" / "box.py"
+    original.parent.mkdir()
+    copy.parent.mkdir()
+    original.write_text(source, encoding="utf-8")
+    copy.write_text(source, encoding="utf-8")
+    monkeypatch.setattr(python_parser, "_parse_cache_dir", str(tmp_path / "cache"))
+    
+    calls = []
+    real_parse_source = python_parser._parse_source
+    monkeypatch.setattr(python_parser, "_parse_source", lambda path, src: calls.append(path) or real_parse_source(path, src))
+    
+    first = parse_path(str(original))
+    second = parse_path(str(copy))
+    
+    assert len(calls) == 1
+    assert second[0]["file_path"] == str(copy)
+    assert second[0]["classes"] == first[0]["classes"]
+    
+    monkeypatch.setenv("PYPARSER_NO_CACHE", "1")
+    parse_path(str(copy))
+    assert len(calls) == 2
+
+
+def test_parse_file_memoizes_unchanged_files(tmp_path, monkeypatch):
+    """Test that re-parsing an unchanged file is served from memory as a fresh copy."""
+    module = tmp_path / "mod.py"
+    module.write_text("def f(x):\n    return x\n", encoding="utf-8")
+    
+    calls = []
+    real_parse_source = python_parser._parse_source
+    monkeypatch.setattr(python_parser, "_parse_source", lambda path, src: calls.append(path) or real_parse_source(path, src))
+    
+    first = parse_file(str(module))
+    first["functions"][0]["suggested_docstrings"] = {"google": "mutated"}
+    second = parse_file(str(module))
+    
+    assert len(calls) == 1
+    assert "suggested_docstrings" not in second["functions"][0]
+    
+    module.write_text("def f(x, y):\n    return x + y\n", encoding="utf-8")
+    assert [a["name"] for a in parse_file(str(module))["functions"][0]["args"]] == ["x", "y"]
+    assert len(calls) == 2
+
+
+def test_single_pass_metrics_match_helpers():
+    """Test that metrics gathered in one pass match the per-function helpers."""
+    code = '''
+import os
+
+def outer(x):
+    import json
+    if x and x > 1:
+        try:
+            raise ValueError("bad")
+        except ValueError:
+            def inner():
+                while True:
+                    raise KeyError
+    return x
+
+class Box:
+    def get(self):
+        for i in range(3):
+            if i:
+                raise errors.Boom()
+
+from sys import path
+'''
+    tree = ast.parse(code)
+    func = parse_functions(tree)[0]
+    method = parse_classes(tree)[0]["methods"][0]
+    
+    assert func["complexity"] == _simple_complexity(tree.body[1]) == 5
+    assert func["nesting_depth"] == _max_nesting_depth(tree.body[1]) == 3
+    assert func["raises"] == _extract_raises(tree.body[1]) == ["KeyError", "ValueError"]
+    assert method["complexity"] == 3
+    assert method["raises"] == ["Boom"]
+    # Breadth-first order, as before: nested imports come after top-level ones
+    assert parse_imports(tree) == ["import os", "from sys import path", "import json"]
+
+
+def test_annotation_fast_path_matches_unparse():
+    """Test that annotations and defaults rendered without ast.unparse are unchanged."""
+    samples = [
+        "int", "np.ndarray", "os.path.sep", "Optional[str]", "Dict[str, Any]",
+        "Tuple[int, ...]", "Callable[[int], str]", "int | None | str", "x | (y | z)",
+        "None", "True", "-1", "'it\\'s'", "u'legacy'", "1.5", "Tuple[()]", "x[a,]",
+        "Literal['a', 'b']", "typing.List[int]", "[1, [2, 3]]", "f(x)",
+    ]
+    for sample in samples:
+        node = ast.parse(sample, mode="eval").body
+        assert get_annotation_str(node) == ast.unparse(node)
+        assert python_parser._get_default_str(node) == ast.unparse(node)
+
+
+def test_parse_path_in_worker_processes_matches_serial(tmp_path):
+    """Test that parsing in worker processes gives the same, ordered, cached results."""
+    for i in range(12):
+        (tmp_path / f"mod_{i:02d}.py").write_text(f"def f{i}(x: int = {i}) -> int:\n    return x\n", encoding="utf-8")
+    
+    serial = parse_path(str(tmp_path), max_workers=1)
+    python_parser.clear_parse_memo()
+    parallel = parse_path(str(tmp_path), max_workers=2)
+    
+    assert parallel == serial
+    assert len(python_parser._parse_memo) == 12
+
+
+def test_deeply_nested_function_does_not_hit_recursion_limit():
+    """Test that metrics are computed for trees deeper than the recursion limit."""
+    code = "def f(x):\n    if x:\n        return " + " + ".join(["x"] * 2000) + "\n"
+    
+    result = python_parser._parse_source("deep.py", code)
+    
+    assert result["parsing_errors"] == []
+    assert result["functions"][0]["complexity"] == 2
+    assert result["functions"][0]["nesting_depth"] == 1
+
+
+def test_empty_docstring_counts_as_docstring():
+    """Test that an empty docstring is reported as present."""
+    tree = ast.parse('def f():\n    ""\n')
+    
+    func = parse_functions(tree)[0]
+    
+    assert func["has_docstring"] is True
+    assert func["docstring"] == '"""\n\n"""'
+    assert _has_docstring(tree.body[0]) is True
+
+
+def test_parse_tree_matches_separate_parsers():
+    """Test that parse_tree returns what the three separate parsers return."""
+    with open("examples/sample_a.py", "r", encoding="utf-8") as f:
+        tree = ast.parse(f.read())
+    
+    functions, classes, imports = python_parser.parse_tree(tree)
+    
+    assert functions == parse_functions(tree)
+    assert classes == parse_classes(tree)
+    assert imports == parse_imports(tree)
+
+
+def test_trivial_sources_skip_the_parser():
+    """Test that empty and comment-only files short-circuit with the same result a parse gives."""
+    empty = {"file_path": "pkg/__init__.py", "imports": [], "parsing_errors": [], "functions": [], "classes": []}
+    for source in ["", "\n\n", "   \t\n", "# just a comment\n\n  # another\n", "#!/usr/bin/env python\n"]:
+        assert python_parser._is_trivial_source(source)
+        assert python_parser._parse_source("pkg/__init__.py", source) == empty
+    
+    # Code, syntax errors and null bytes still go through the parser
+    assert not python_parser._is_trivial_source("x = 1\n")
+    assert python_parser._parse_source("bad.py", "x = (\n")["parsing_errors"]
+    assert python_parser._parse_source("nul.py", "# \0\n")["parsing_errors"]
+
+
+def test_parse_path_lists_files_like_os_walk(tmp_path):
+    """Test that files are found in os.walk order, honouring skip_dirs and recursive."""
+    for rel in ["z.py", "a/m.py", "a/b/n.py", "skip/p.py", "notes.txt"]:
+        target = tmp_path / rel
+        target.parent.mkdir(parents=True, exist_ok=True)
+        target.write_text("x = 1\n", encoding="utf-8")
+    
+    expected = []
+    for root, dirs, files in os.walk(tmp_path):
+        dirs[:] = [d for d in dirs if d != "skip"]
+        expected += [os.path.join(root, f) for f in files if f.endswith(".py")]
+    
+    assert [r["file_path"] for r in parse_path(str(tmp_path), skip_dirs=["skip"])] == expected
+    assert [r["file_path"] for r in parse_path(str(tmp_path), recursive=False)] == [str(tmp_path / "z.py")]
+
+
+def test_trivial_function_bodies_still_count_signature():
+    """Test that one-line functions get base metrics, including BoolOps in defaults."""
+    code = '''
+class Box:
+    @property
+    def value(self) -> int:
+        """The value."""
+        return self._value
+
+    def pick(self, x=a or b):
+        return x
+
+    def both(self):
+        return self.a and self.b
+'''
+    methods = parse_classes(ast.parse(code))[0]["methods"]
+    
+    assert [m["complexity"] for m in methods] == [1, 2, 2]
+    assert all(m["raises"] == [] for m in methods)
+
+
+def test_parse_imports_lists_each_import_once():
+    """Test that repeated imports are reported once, at their first position."""
+    code = '''
+import os
+from typing import List
+import os
+
+def f():
+    import os
+    import json
+'''
+    assert parse_imports(ast.parse(code)) == ["import os", "from typing import List", "import json"]
+
+
+def test_parse_cache_ignores_results_from_older_versions(tmp_path, monkeypatch):
+    """Test that bumping the cache version re-parses files whose mtime and size are unchanged."""
+    module = tmp_path / "mod.py"
+    module.write_text("import os\n", encoding="utf-8")
+    monkeypatch.setattr(python_parser, "_parse_cache_dir", str(tmp_path / "cache"))
+    
+    calls = []
+    real_parse_source = python_parser._parse_source
+    monkeypatch.setattr(python_parser, "_parse_source", lambda path, src: calls.append(path) or real_parse_source(path, src))
+    
+    parse_path(str(module))
+    python_parser.clear_parse_memo()
+    monkeypatch.setattr(python_parser, "_DIGEST_SUFFIX", python_parser._DIGEST_SUFFIX + "-next")
+    parse_path(str(module))
+    
+    assert len(calls) == 2
+
+
+def test_parse_path_parses_in_batches(tmp_path, monkeypatch):
+    """Test that batched parsing (a fresh worker pool per batch) keeps results and order."""
+    for i in range(24):
+        (tmp_path / f"mod_{i:02d}.py").write_text(f"def f{i}():\n    return {i}\n", encoding="utf-8")
+    serial = parse_path(str(tmp_path), max_workers=1)
+    python_parser.clear_parse_memo()
+    
+    batches = []
+    real_parse_jobs = python_parser._parse_jobs
+    monkeypatch.setattr(python_parser, "_PARSE_BATCH_FILES", 10)
+    monkeypatch.setattr(python_parser, "_parse_jobs", lambda jobs, workers: batches.append(len(jobs)) or real_parse_jobs(jobs, workers))
+    
+    assert parse_path(str(tmp_path), max_workers=2) == serial
+    assert batches == [10, 10, 4]
@@ -0,0 +1,74 @@
+# tests/test_pytest_report.py
+
+"""Tests for pytest report splitting."""
+
+import json
+import sqlite3
+
+import orjson
+
+from core.reporter.pytest_report import record_run, split_report, tally_by_file, raw_tests_path
+from tests.conftest import pytest_json_modifyreport
+
+
+TESTS = [
+    {"nodeid": "tests/test_parser.py::test_parse_function", "outcome": "passed"},
+    {"nodeid": "tests/test_parser.py::test_parse_class", "outcome": "failed"},
+    {"nodeid": "test_cli.py::test_scan", "outcome": "skipped"},
+    {"nodeid": "tests/test_parser.py::test_broken", "outcome": "error"},
+]
+
+
+def test_tally_by_file():
+    """Test per-file counts keep the zero defaults and extra outcomes."""
+    assert tally_by_file(TESTS) == {
+        "test_parser.py": {"passed": 1, "failed": 1, "skipped": 0, "total": 3, "error": 1},
+        "test_cli.py": {"passed": 0, "failed": 0, "skipped": 1, "total": 1},
+    }
+
+
+def test_split_report_moves_tests_to_sidecar(tmp_path):
+    """Test that the main report keeps the summary plus tallies only."""
+    report = tmp_path / "pytest_results.json"
+    report.write_text(json.dumps({"summary": {"total": 4}, "tests": TESTS}), encoding="utf-8")
+
+    split_report(str(report))
+    split_report(str(report))
+
+    main = json.loads(report.read_text(encoding="utf-8"))
+    assert set(main) == {"summary", "by_file"}
+    assert main["by_file"] == tally_by_file(TESTS)
+    sidecar = raw_tests_path(str(report))
+    assert sidecar == str(tmp_path / "pytest_results_tests.json")
+    with open(sidecar, encoding="utf-8") as f:
+        assert json.load(f) == TESTS
+    assert not list(tmp_path.glob("*.partial"))
+
+
+def test_report_hook_stores_tallies():
+    """Test that the conftest hook adds by_file to the json report."""
+    json_report = {"summary": {"total": 4}, "tests": TESTS}
+
+    pytest_json_modifyreport(json_report)
+
+    assert json_report["by_file"] == tally_by_file(TESTS)
+
+
+def test_record_run_keeps_one_row_per_report(tmp_path):
+    """Test that history dedupes identical reports and trims old runs."""
+    history = str(tmp_path / "history" / "runs.sqlite3")
+
+    for created, failed in ((1.0, 1), (2.0, 0), (3.0, 2)):
+        report = tmp_path / f"run{created}.json"
+        summary = {"total": 4, "failed": failed}
+        report.write_text(json.dumps({"created": created, "summary": summary, "tests": TESTS}), encoding="utf-8")
+        record_run(str(report), history, max_runs=2)
+        record_run(str(report), history, max_runs=2)
+
+    conn = sqlite3.connect(history)
+    try:
+        rows = conn.execute("SELECT created, results FROM runs ORDER BY created").fetchall()
+    finally:
+        conn.close()
+    assert [created for created, _ in rows] == [2.0, 3.0]
+    assert orjson.loads(rows[-1][1]) == {"summary": {"total": 4, "failed": 2}, "by_file": tally_by_file(TESTS)}
@@ -2,6 +2,7 @@
 """Tests for PEP 257 docstring validator."""
 
 import pytest
+from core.validator import validator as validator_module
 from core.validator.validator import PEP257Validator, validate_project
 from core.parser.python_parser import parse_path, parse_file
 
@@ -252,6 +253,13 @@ def test_validate_project_counts_correctly():
     assert report["compliant_items"] == report["compliant_functions"] + report["compliant_classes"]
 
 
+def test_validate_project_accepts_generator():
+    """Test that validate_project gives the same report for a one-shot iterator."""
+    parsed_results = parse_path("examples")
+    
+    assert validate_project(iter(parsed_results)) == validate_project(parsed_results)
+
+
 def test_validator_checks_classes():
     """Test that validator checks class docstrings (D101)."""
     mock_data = {
@@ -412,5 +420,85 @@ def test_pep257_validator_class_attributes():
     assert hasattr(PEP257Validator, 'D400')
 
 
+def test_validator_keeps_quotes_inside_docstring_text():
+    """Test that only the enclosing triple quotes are removed before the checks run."""
+    validator = PEP257Validator()
+    mock_data = {
+        "file_path": "test.py",
+        "functions": [{"name": "set_sep", "start_line": 1, "has_docstring": True,
+                       "docstring": '"""Set the separator to ".""""'}],
+        "classes": []
+    }
+    
+    violations = validator.validate_file(mock_data, source_code="")
+    
+    # The summary ends with a quote, not a period
+    assert [v["code"] for v in violations] == ["D400"]
+
+
+def test_validator_reports_repeated_docstrings_at_each_definition():
+    """Test that a docstring shared by several definitions is reported for each of them."""
+    validator = PEP257Validator()
+    docstring = '"""No period here"""'
+    mock_data = {
+        "file_path": "test.py",
+        "functions": [
+            {"name": "first", "start_line": 1, "has_docstring": True, "docstring": docstring},
+            {"name": "second", "start_line": 7, "has_docstring": True, "docstring": docstring}
+        ],
+        "classes": [{"name": "Cls", "start_line": 12, "has_docstring": True, "docstring": docstring, "methods": []}]
+    }
+    
+    violations = validator.validate_file(mock_data, source_code="")
+    
+    d400 = [(v["line"], v["message"]) for v in violations if v["code"] == "D400"]
+    assert d400 == [
+        (1, "D400: First line should end with a period in first"),
+        (7, "D400: First line should end with a period in second"),
+        (12, "D400: First line should end with a period in Cls")
+    ]
+
+
+def test_validator_reads_source_only_when_a_check_needs_it(tmp_path, monkeypatch):
+    """Test that a file is only read once a documented public function needs its lines."""
+    path = tmp_path / "mod.py"
+    path.write_text('def f():\n\n    """Doc."""\n    return 1\n', encoding="utf-8")
+    reads = []
+    read_source = validator_module._read_source
+    monkeypatch.setattr(validator_module, "_read_source", lambda p: reads.append(p) or read_source(p))
+    func = {"name": "f", "start_line": 1, "has_docstring": False, "docstring": None}
+    file_data = {"file_path": str(path), "functions": [func], "classes": []}
+    
+    assert [v["code"] for v in PEP257Validator().validate_file(file_data)] == ["D103"]
+    assert reads == []
+    
+    func.update(has_docstring=True, docstring='"""Doc."""')
+    assert [v["code"] for v in PEP257Validator().validate_file(file_data)] == ["D201"]
+    assert reads == [str(path)]
+
+
+def test_validation_cache_reuses_and_invalidates(tmp_path, monkeypatch):
+    """Test that cached violations are reused for identical input and dropped on a version bump."""
+    monkeypatch.setattr(validator_module, "_validation_cache_dir", str(tmp_path / "cache"))
+    file_data = {
+        "file_path": "mod.py",
+        "functions": [{"name": "f", "start_line": 1, "has_docstring": False, "docstring": None}],
+        "classes": []
+    }
+    source = "def f():\n    pass\n"
+    
+    first = PEP257Validator().validate_file(file_data, source_code=source)
+    
+    calls = []
+    monkeypatch.setattr(PEP257Validator, "_validate_source", lambda self, *args: calls.append(args))
+    assert PEP257Validator().validate_file(file_data, source_code=source) == first
+    assert validate_project([dict(file_data, file_path="other.py")])["total_violations"] == 0
+    assert len(calls) == 1  # a different file is a miss
+    
+    monkeypatch.setattr(validator_module, "_VALIDATION_CACHE_VERSION", 999)
+    PEP257Validator().validate_file(file_data, source_code=source)
+    assert len(calls) == 2
+
+
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])
\ No newline at end of file